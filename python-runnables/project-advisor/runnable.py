@@ -115,6 +115,7 @@ class MyRunnable(Runnable):
         The progress_callback is a function expecting 1 value: current progress
         """
         self.project_advisor.run()
+        self.project_advisor.save_optional_reports(self.project_advisor.metrics, self.project_advisor.checks, datetime.now())
         
         status = self.project_advisor.get_status()
         score = self.project_advisor.get_score()
@@ -16,6 +16,10 @@ from project_advisor.assessments.dss_assessment import DSSAssessment
 from project_advisor.assessments.metrics import DSSMetric
 
 from project_advisor.assessments.checks import DSSCheck
+from project_advisor.assessments import (ProjectCheckCategory, InstanceCheckCategory)
+from project_advisor.report.columnar_report import (METRIC_REPORT, CHECK_REPORT, build_report_frame, write_report_frame)
+from project_advisor.report.report_partitions import (get_run_date_partition, is_partitioned_by_run_date)
+from project_advisor.report.scores import (compute_run_score_rows, set_score_deltas)
 
 class DSSAdvisor(ABC):
     """
@@ -97,6 +101,19 @@ class DSSAdvisor(ABC):
         """
         self.init_metric_logging_dataset()
         
+        metric_records = self.build_metric_records(metrics, timestamp)
+        new_metrics_df = pd.DataFrame.from_dict(metric_records)
+        
+        
+        self.append_to_report_dataset(self.metric_report_dataset, new_metrics_df, timestamp)
+        
+        self.save_columnar_report(metric_records, METRIC_REPORT, timestamp)
+        return
+    
+    def build_metric_records(self, metrics : List[DSSMetric], timestamp : datetime) -> List[dict]:
+        """
+        Build the report records of the metrics.
+        """
         ts_str = self.format_ts(timestamp)
         metric_records = []
         for metric in metrics:
@@ -113,12 +130,7 @@ class DSSAdvisor(ABC):
                 }
             self.config.logger.debug(f"[metric_record]{json.dumps(metric_record)}") # Logging report metric to job logs
             metric_records.append(metric_record)
-        new_metrics_df = pd.DataFrame.from_dict(metric_records)
-        
-        
-        new_log_df = pd.concat([self.metric_report_dataset.get_dataframe(), new_metrics_df])
-        self.metric_report_dataset.write_with_schema(new_log_df)
-        return
+        return metric_records
     
 
     def save_checks(self,checks : List[DSSCheck], timestamp : datetime) -> None:
@@ -128,7 +140,18 @@ class DSSAdvisor(ABC):
         self.config.logger.debug(f"saving {len(checks)} checks")
         self.init_check_logging_dataset()
         
-
+        check_records = self.build_check_records(checks, timestamp)
+        new_checks_df = pd.DataFrame.from_dict(check_records)
+        self.append_to_report_dataset(self.check_report_dataset, new_checks_df, timestamp)
+        
+        self.save_columnar_report(check_records, CHECK_REPORT, timestamp)
+        self.save_scores(check_records, timestamp)
+        return
+    
+    def build_check_records(self, checks : List[DSSCheck], timestamp : datetime) -> List[dict]:
+        """
+        Build the report records of the checks.
+        """
         ts_str = self.format_ts(timestamp)
         check_records = []
         for check in checks:
@@ -148,10 +171,106 @@ class DSSAdvisor(ABC):
             
             self.config.logger.debug(f"[check_record]{json.dumps(check_record)}") # Logging report metric to job logs
             check_records.append(check_record)
-
-        new_checks_df = pd.DataFrame.from_dict(check_records)
-        new_log_df = pd.concat([self.check_report_dataset.get_dataframe(), new_checks_df])
-        self.check_report_dataset.write_with_schema(new_log_df)
+        return check_records
+    
+    def save_optional_reports(self, metrics : List[DSSMetric], checks : List[DSSCheck], timestamp : datetime) -> None:
+        """
+        Save only the optional outputs (columnar report & scores), for the runs without report datasets.
+        """
+        self.save_columnar_report(self.build_metric_records(metrics, timestamp), METRIC_REPORT, timestamp)
+        check_records = self.build_check_records(checks, timestamp)
+        self.save_columnar_report(check_records, CHECK_REPORT, timestamp)
+        self.save_scores(check_records, timestamp)
+        return
+    
+    def append_to_report_dataset(self, dataset : dataiku.Dataset, new_df : pd.DataFrame, timestamp : datetime) -> None:
+        """
+        Append new records to a report dataset.
+        When the dataset is partitioned by run date, only the partition of the run is read and rewritten.
+        """
+        if is_partitioned_by_run_date(dataset):
+            partition = get_run_date_partition(timestamp)
+            current_df = None # First run of the day
+            if partition in dataset.list_partitions():
+                try:
+                    dataset.read_partitions = [partition]
+                    current_df = dataset.get_dataframe()
+                finally:
+                    dataset.read_partitions = None
+            dataset.set_write_partition(partition)
+        else:
+            current_df = dataset.get_dataframe()
+        
+        new_log_df = pd.concat([current_df, new_df]) if current_df is not None else new_df
+        dataset.write_with_schema(new_log_df)
+        return
+    
+    def is_first_run(self, dataset : dataiku.Dataset) -> bool:
+        """
+        Whether nothing was saved yet to a report dataset : no partition, or no schema if not partitioned.
+        Read errors are not taken for a first run, the saved history would be overwritten.
+        """
+        if is_partitioned_by_run_date(dataset):
+            return len(dataset.list_partitions()) == 0
+        return len(dataset.read_schema(raise_if_empty = False)) == 0
+    
+    def get_score_report_dataset(self) -> dataiku.Dataset:
+        """
+        Return the dataset receiving the materialized scores, None if not configured.
+        """
+        score_report_dataset_name = self.config.get_config().get("score_report_dataset")
+        if not score_report_dataset_name:
+            return None
+        return dataiku.Dataset(score_report_dataset_name)
+    
+    def save_scores(self, check_records : List[dict], timestamp : datetime) -> None:
+        """
+        Save the score rows of the run to the score dataset (when configured) :
+        pass/fail counts, score & delta with the previous run of each project and of the instance, overall and by category.
+        """
+        score_dataset = self.get_score_report_dataset()
+        if score_dataset is None or len(check_records) == 0:
+            return
+        try:
+            score_df = compute_run_score_rows(pd.DataFrame.from_records(check_records),
+                                              project_categories = [c.name for c in ProjectCheckCategory],
+                                              instance_categories = [c.name for c in InstanceCheckCategory])
+            if self.is_first_run(score_dataset):
+                previous_score_df = None
+            else:
+                previous_score_df = score_dataset.get_dataframe()
+            score_df = set_score_deltas(score_df, previous_score_df)
+            
+            if is_partitioned_by_run_date(score_dataset):
+                self.append_to_report_dataset(score_dataset, score_df, timestamp)
+            else:
+                score_dataset.write_with_schema(pd.concat([previous_score_df, score_df]) if previous_score_df is not None else score_df)
+            self.config.logger.info(f"Saved {len(score_df)} score rows")
+        except Exception as error:
+            self.config.logger.error(f"Failed to save the score rows : {error}")
+        return
+    
+    def get_report_folder(self) -> dataiku.Folder:
+        """
+        Return the managed folder receiving the typed columnar (Parquet) reports, None if not configured.
+        """
+        report_folder_id = self.config.get_config().get("report_folder")
+        if not report_folder_id:
+            return None
+        return dataiku.Folder(report_folder_id)
+    
+    def save_columnar_report(self, records : List[dict], report : str, timestamp : datetime) -> None:
+        """
+        Save the report records as a typed Parquet file in the report folder (when configured).
+        """
+        report_folder = self.get_report_folder()
+        if report_folder is None or len(records) == 0:
+            return
+        try:
+            path = write_report_frame(report_folder, report, build_report_frame(records, report), timestamp)
+            self.config.logger.info(f"Saved {len(records)} {report} records to the report folder : {path}")
+        except Exception as error:
+            self.config.logger.error(f"Failed to save the {report} records to the report folder : {error}")
         return
     
 
@@ -170,6 +289,8 @@ class DSSAdvisor(ABC):
                 "result_data": pd.Series(dtype="str"),
             }
         )
+        if is_partitioned_by_run_date(self.metric_report_dataset):
+            return # The run date partition is created when the records are saved
         try:
             self.metric_report_dataset.get_dataframe()
         except:
@@ -192,6 +313,8 @@ class DSSAdvisor(ABC):
                 "result_data": pd.Series(dtype="str"),
             }
         )
+        if is_partitioned_by_run_date(self.check_report_dataset):
+            return # The run date partition is created when the records are saved
         try:
             self.check_report_dataset.get_dataframe()
         except:
@@ -123,7 +123,11 @@ class BatchProjectAdvisor(DSSAdvisor):
         self.config.logger.info(
             f"Creating ProjectAdvisors for every project in the folder : {self.project_folder.get_name()}"
         )
-        project_keys = self.recursive_project_search(self.project_folder)
+        if self.project_folder.id == "ROOT" and self.config.instance_inventory is not None:
+            # All the projects of the instance, already listed in the inventory
+            project_keys = self.config.instance_inventory.list_project_keys()
+        else:
+            project_keys = self.recursive_project_search(self.project_folder)
         
         project_advisors = []
         all_check_results = {}
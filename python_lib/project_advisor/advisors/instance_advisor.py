@@ -47,6 +47,9 @@ class InstanceAdvisor(DSSAdvisor):
                          metric_report_dataset = metric_report_dataset
                        )
 
+        # Project list of the instance (projects table only), read by the batch project advisor & the nbr_projects metric
+        if self.config.instance_inventory is None:
+            self.config.build_instance_inventory()
         
         try:
             self.batch_project_advisor = BatchProjectAdvisor(client=client,
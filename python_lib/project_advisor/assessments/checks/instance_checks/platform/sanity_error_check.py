@@ -34,9 +34,6 @@ class InstanceErrorCheck(InstanceCheck):
             description="Checks the errors on the DSS sanity report"
         )
 
-    def check_error_rate_above_zero(self, metric) -> List:
-        return metric.value > 0
-        
     def run(self) -> InstanceCheck:
         """
         Runs the check to determine if there are any instance errors from the instance sanity check.
@@ -49,12 +46,10 @@ class InstanceErrorCheck(InstanceCheck):
 
 
         for metric in self.metrics:
-            if (metric.name == "nbr_sanity_check_errors") & (self.check_error_rate_above_zero(metric)):
+            if (metric.name == "nbr_sanity_check_errors") & (metric.value > 0):
                 check_pass = False
-                for message in metric.run_result:
-                    if message['severity'] == 'ERROR':
-                        message = f"There are {metric.value} errors on the instance sanity check report"
-                        error_messages.append(message)
+                message = f"There are {metric.value} errors on the instance sanity check report"
+                error_messages = [issue['title'] for issue in metric.run_result]
                 
         self.check_pass = check_pass
         self.message = message
@@ -34,9 +34,6 @@ class InstanceWarningCheck(InstanceCheck):
             description="Checks the warnings on the DSS sanity report",
         )
 
-    def check_warning_rate_above_zero(self, metric) -> List:
-        return metric.value > 0
-        
     def run(self) -> InstanceCheck:
         """
         Runs the check to determine if there are any instance warnings from the instance sanity check.
@@ -50,12 +47,10 @@ class InstanceWarningCheck(InstanceCheck):
 
         
         for metric in self.metrics:
-            if (metric.name == "nbr_sanity_check_warnings") & (self.check_warning_rate_above_zero(metric)):
+            if (metric.name == "nbr_sanity_check_warnings") & (metric.value > 0):
                 check_pass = False
-                for message in metric.run_result:
-                    if message['severity'] == 'WARNING':
-                        message = f"There are {metric.value} warnings on the instance sanity check report"
-                        warning_messages.append(message)
+                message = f"There are {metric.value} warnings on the instance sanity check report"
+                warning_messages = [issue['title'] for issue in metric.run_result]
                 
         self.check_pass = check_pass
         self.message = message
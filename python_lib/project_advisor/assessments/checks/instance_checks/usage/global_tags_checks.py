@@ -42,8 +42,7 @@ class GlobalTagsCheck(InstanceCheck):
         :return: self
         """
 
-        settings = self.client.get_general_settings()
-        raw_settings = settings.get_raw().get("globalTagsCategories", [])
+        raw_settings = self.config.general_settings.get_global_tag_categories()
 
         required_objects = {'PROJECT', 'DATASET', 'RECIPE', 'SCENARIO', 'DASHBOARD'}
 
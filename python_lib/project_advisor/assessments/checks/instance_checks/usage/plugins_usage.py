@@ -46,22 +46,21 @@ class PluginUsageCheck(InstanceCheck):
         check_pass = True
         message = f"All plugins are used at least once."
         result = {}
-        nb_plugins_not_used = 0
-        plugins_not_used = list()
         
-        plugin_list = self.client.list_plugins()
+        if self.config.plugin_usage_index is None:
+            self.config.compute_plugins_usage()
         
-        for plugin in plugin_list:
-            plugin_id = plugin["id"]
-            plugin_usage = self.client.get_plugin(plugin_id).list_usages()
-            if not plugin_usage.maybe_used():
-                nb_plugins_not_used += 1
-                plugins_not_used.append(plugin_id)
-                
-        if nb_plugins_not_used > 0:
-            check_pass = False
-            message = f"{nb_plugins_not_used} plugins are not used."
-            result.update({"plugins_not_used": plugins_not_used})
+        if self.config.plugin_usage_index is None:
+            check_pass = None
+            message = f"Plugin usage could not be computed : {self.config.plugin_usage_error}"
+        else:
+            plugins_not_used = self.config.plugin_usage_index.get_unused_plugins()
+            nb_plugins_not_used = len(plugins_not_used)
+                    
+            if nb_plugins_not_used > 0:
+                check_pass = False
+                message = f"{nb_plugins_not_used} plugins are not used."
+                result.update({"plugins_not_used": plugins_not_used})
 
         self.check_pass = check_pass
         self.message = message
@@ -38,14 +38,7 @@ class MainScenarioExistsCheck(ProjectCheck):
         Checks that there is a global tag category named 'Scenario Type' that has the tag 'main'.
         :return: boolean
         """
-        global_tags = self.client.get_general_settings().get_raw()["globalTagsCategories"]
-        if (
-            len(global_tags) != 0
-            and any(tag["name"] == "Scenario Type" for tag in global_tags)
-            and any(tag["name"] == "main" for cat in global_tags for tag in cat["globalTags"])
-        ):
-            return True
-        return False
+        return self.config.general_settings.has_global_tag("Scenario Type", "main")
 
     def run(self) -> ProjectCheck:
         """
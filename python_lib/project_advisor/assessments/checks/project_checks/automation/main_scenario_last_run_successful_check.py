@@ -37,14 +37,7 @@ class MainScenarioLastRunSuccessfulCheck(ProjectCheck):
         Checks that there is a global tag category named 'Scenario Type' that has the tag 'main'.
         :return: boolean
         """
-        global_tags = self.client.get_general_settings().get_raw()["globalTagsCategories"]
-        if (
-            len(global_tags) != 0
-            and any(tag["name"] == "Scenario Type" for tag in global_tags)
-            and any(tag["name"] == "main" for cat in global_tags for tag in cat["globalTags"])
-        ):
-            return True
-        return False
+        return self.config.general_settings.has_global_tag("Scenario Type", "main")
 
     def run(self) -> ProjectCheck:
         """
@@ -59,11 +52,11 @@ class MainScenarioLastRunSuccessfulCheck(ProjectCheck):
             scenarios = self.project.list_scenarios(as_type="objects")
             for s in scenarios:
                 if any("Scenario Type:main" in tag for tag in s.get_settings().get_raw()["tags"]):
-                    try:
-                        if s.get_last_finished_run().outcome == "SUCCESS":
-                            check_pass = True
-                            message = "This project's main scenario had a successful last run."
-                    except:
+                    last_outcome = self.config.get_scenario_run_history().get_last_outcome(s)
+                    if last_outcome == "SUCCESS":
+                        check_pass = True
+                        message = "This project's main scenario had a successful last run."
+                    elif last_outcome is None:
                         message = "This project's main scenario does not have a completed run."
                     break
         else:
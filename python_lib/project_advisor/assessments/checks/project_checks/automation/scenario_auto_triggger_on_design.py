@@ -31,11 +31,10 @@ class ScenarioWithAutoTriggerOnDesignNodeCheck(ProjectCheck):
             metrics = metrics
         )
         
-    def check_for_active_scenario_triggers(self, scenario) -> bool:
+    def check_for_active_scenario_triggers(self, scenario_details : dict) -> bool:
         """
         Checks if a scenario is both active and has an automated trigger set up
         """
-        scenario_details = scenario.get_settings().get_raw()
         if (scenario_details.get('active') ==True) & (len(scenario_details.get('triggers'))>0):
             return True
         else:
@@ -53,12 +52,13 @@ class ScenarioWithAutoTriggerOnDesignNodeCheck(ProjectCheck):
         result = []
         
 
-        scenarios = self.project.list_scenarios(as_type="objects")
+        project_reader = self.config.get_project_reader(self.project)
         
-        for scenario in scenarios:
-            if self.check_for_active_scenario_triggers(scenario):
+        for scenario in project_reader.list_scenarios():
+            scenario_details = project_reader.get_scenario_raw_settings(scenario["id"])
+            if self.check_for_active_scenario_triggers(scenario_details):
                 check_pass = False
-                result.append(scenario.id)
+                result.append(scenario["id"])
                 
         if not check_pass:
             message = f"{len(result)} scenarios are active with triggers on the design node"
@@ -36,7 +36,7 @@ class ScenarioSizeCheck(ProjectCheck):
         Retrieves the IDs of all step-based scenarios in the project.
         :return: self
         """
-        scenario_items = self.project.list_scenarios()
+        scenario_items = self.config.get_project_reader(self.project).list_scenarios()
         ids = [
             scenario_item["id"]
             for scenario_item in scenario_items
@@ -59,9 +59,10 @@ class ScenarioSizeCheck(ProjectCheck):
 
         if len(step_based_scenario_ids) != 0:
             big_scenarios = []
+            project_reader = self.config.get_project_reader(self.project)
             for id in step_based_scenario_ids:
-                scenario = self.project.get_scenario(id)
-                nbr_scenario_steps = len(scenario.get_settings().raw_steps)
+                scenario_settings = project_reader.get_scenario_raw_settings(id)
+                nbr_scenario_steps = len(scenario_settings.get("params", {}).get("steps", []))
                 if nbr_scenario_steps > max_nbr_steps_in_scenarios:
                     big_scenarios.append(id)
                     check_pass = False
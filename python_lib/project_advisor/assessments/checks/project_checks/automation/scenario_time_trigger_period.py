@@ -62,9 +62,9 @@ class ScenarioTimeTriggerPeriodCheck(ProjectCheck):
         message = "All time-based scenario triggers have a period greater than 5 minutes."
         result = {}
 
-        scenarios = self.project.list_scenarios(as_type="objects")
-        for scenario in scenarios:
-            scenario_settings = scenario.get_settings().get_raw()
+        project_reader = self.config.get_project_reader(self.project)
+        for scenario in project_reader.list_scenarios():
+            scenario_settings = project_reader.get_scenario_raw_settings(scenario["id"])
             for trigger in scenario_settings.get('triggers', []):
                 if trigger['type'] == 'temporal':  # Checking for time-based triggers
                     frequency = trigger['params'].get('frequency')
@@ -75,8 +75,8 @@ class ScenarioTimeTriggerPeriodCheck(ProjectCheck):
                     
                     if period_in_minutes <= min_scenario_trigger_time_period:
                         check_pass = False
-                        result[scenario.id] = {
-                            "scenario_name": scenario.get_definition().get('name'),
+                        result[scenario["id"]] = {
+                            "scenario_name": scenario_settings.get('name'),
                             "period_in_minutes": period_in_minutes
                         }
 
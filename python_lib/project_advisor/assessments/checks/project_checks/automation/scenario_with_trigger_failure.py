@@ -1,6 +1,5 @@
 import dataikuapi
 from typing import List
-import datetime
 from project_advisor.assessments.metrics import DSSMetric
 from project_advisor.assessments import ProjectCheckCategory
 from project_advisor.assessments.config import DSSAssessmentConfig
@@ -41,14 +40,11 @@ class FailingActiveScenarioWithTriggerOnDesignCheck(ProjectCheck):
         else:
             return False
 
-    def get_last_runs(self, scenario, days=7):
+    def get_last_runs(self, scenario, days=7) -> List[dict]:
         """
-        Retrieves the last x days of runs of a scenario
+        Retrieves the last x days of runs of a scenario (from the local run history)
         """
-        current_datetime = datetime.datetime.now()
-        one_week_ago_datetime = current_datetime - datetime.timedelta(days=days)
-        runs = scenario.get_runs_by_date(from_date=one_week_ago_datetime, to_date=current_datetime)
-        return runs
+        return self.config.get_scenario_run_history().get_runs(scenario, days=days)
     
 
     def run(self) -> ProjectCheck:
@@ -61,16 +57,16 @@ class FailingActiveScenarioWithTriggerOnDesignCheck(ProjectCheck):
         message = f"No scenarios are active with triggers and have failed in the last 7 days on the design node"
         result = {}
         
-        base_url = self.client.get_general_settings().get_raw().get('studioExternalUrl', "")
+        base_url = self.config.general_settings.get_external_url()
         scenarios = self.project.list_scenarios(as_type="objects")
         
         for scenario in scenarios:
             if self.check_for_active_scenario_triggers(scenario):
                 runs = self.get_last_runs(scenario, days=7)
                 for run in runs:
-                    if run.outcome == "FAILED":
+                    if run["outcome"] == "FAILED":
                         check_pass = False
-                        result[run.id] = base_url +f'/projects/{self.project.project_key}/scenarios/{scenario.id}/runs/list/{run.id}'
+                        result[run["run_id"]] = base_url +f'/projects/{self.project.project_key}/scenarios/{scenario.id}/runs/list/{run["run_id"]}'
                         
         if not check_pass:
             message = f"{len(result)} scenarios are active with triggers on the design node and have failed in the last 7 days"
@@ -52,32 +52,18 @@ class PythonRecipeRowCheck(ProjectCheck):
         message = f"All Python Recipes in the Flow are under {max_nbr_row_python_recipe} lines of code."
         result = {}
 
-        python_recipes = []
-        for recipe in self.project.list_recipes():
-            if recipe["type"] == "python":
-                python_recipes.append(recipe)
-
         big_python_recipes = []
-        for recipe in python_recipes:
-            recipe_name = recipe["name"]
-            recipe = self.project.get_recipe(recipe_name)
-            settings = recipe.get_settings()
-            python_code = settings.get_code()
-            if python_code == None:
-                python_code = ""
-            lines = python_code.split("\n")
-            lines = [line for line in lines if line != ""]
-            lines = [line for line in lines if not line.startswith("#")]
-            lines = [line for line in lines if not line.startswith("import")]
-            lines = [line for line in lines if not line.startswith("from")]
-            recipe_py_lines = len(lines)
-            if len(lines) > max_nbr_row_python_recipe:
+        recipe_code_metrics = {}
+        for recipe_name, code_metrics in self.config.code_analyzer.analyze_python_recipes(self.project).items():
+            if code_metrics.logical_lines > max_nbr_row_python_recipe:
                 big_python_recipes.append(recipe_name)
+                recipe_code_metrics[recipe_name] = code_metrics.to_dict()
 
         if len(big_python_recipes) > 0:
             message = f"{len(big_python_recipes)} recipe(s) have been found with more than {max_nbr_row_python_recipe} lines of code. See {big_python_recipes}"
             check_pass = False
             result["big_python_recipes"] = big_python_recipes
+            result["recipe_code_metrics"] = recipe_code_metrics
 
         self.check_pass = check_pass
         self.message = message
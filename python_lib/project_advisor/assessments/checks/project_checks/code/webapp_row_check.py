@@ -13,6 +13,7 @@ from project_advisor.assessments.metrics import DSSMetric
 from project_advisor.assessments import ProjectCheckCategory
 from project_advisor.assessments.config import DSSAssessmentConfig
 from project_advisor.assessments.checks.project_check import ProjectCheck
+from project_advisor.assessments.providers.code_analysis import PYTHON_WEBAPP_TYPES
 
 from typing import Any, Dict
 
@@ -47,7 +48,6 @@ class WebappRowCheck(ProjectCheck):
         :return: self
         """
         config = self.config.get_config()["check_configs"]
-        self.config.get_config()["llm_id"]
         max_nbr_row_webapp = config["max_nbr_row_python_webapp"]
 
         check_pass = True
@@ -56,33 +56,23 @@ class WebappRowCheck(ProjectCheck):
 
         webapps = []
         for webapp in self.project.list_webapps():
-            print(webapp["type"])
-            if webapp["type"] in ['DASH', 'STANDARD', 'BOKEH']:
+            if webapp["type"] in PYTHON_WEBAPP_TYPES:
                 webapps.append(webapp)
 
-
         big_python_webapps = []
+        webapp_code_metrics = {}
         for webapp in webapps:
             webapp_name = webapp["name"]
-            webapp_current = self.project.get_webapp(webapp["id"])
-            settings = webapp_current.get_settings().get_raw()
-            python_code = settings["params"]["python"]
-            print(python_code)
-            if python_code == None:
-                python_code = ""
-            lines = python_code.split("\n")
-            lines = [line for line in lines if line != ""]
-            lines = [line for line in lines if not line.startswith("#")]
-            lines = [line for line in lines if not line.startswith("import")]
-            lines = [line for line in lines if not line.startswith("from")]
-            #recipe_py_lines = len(lines)
-            if len(lines) > max_nbr_row_webapp:
+            code_metrics = self.config.code_analyzer.analyze_webapp(self.project, webapp["id"])
+            if code_metrics.logical_lines > max_nbr_row_webapp:
                 big_python_webapps.append(webapp_name)
+                webapp_code_metrics[webapp_name] = code_metrics.to_dict()
 
         if len(big_python_webapps) > 0:
             message = f"{len(big_python_webapps)} webapp(s) has/have been found with more than {max_nbr_row_webapp} lines of python code. See {big_python_webapps}"
             check_pass = False
             result["big_python_webapps"] = big_python_webapps
+            result["webapp_code_metrics"] = webapp_code_metrics
 
         self.check_pass = check_pass
         self.message = message
@@ -52,36 +52,34 @@ class ProjectHasProdActiveScenario(ProjectCheck):
         elif any(infra_client is None for infra_id, infra_client in self.config.infra_to_client.items()):
             check_pass = None
             message = "Deployment best practices can't be checked with the current deployment infrastruture configuration" 
+        elif self.config.deployment_snapshot is None:
+            check_pass = None
+            message = "Deployment best practices can't be checked, the deployer and infrastructures state could not be fetched" 
         else:
-            project_deployer = self.config.deployer_client.get_projectdeployer()
+            deployment_snapshot = self.config.deployment_snapshot
             
-            # Compute a mapping between the design project key and the deployment project key
-            if self.config.deployment_project_mapping is None:
-                deployment_project_mapping = dict()
-                deployments = project_deployer.list_deployments()
-                for deployment in deployments:
-                    deployments_info = deployment.get_status().get_light()
-                    design_project_key = deployments_info["packages"][-1]["designNodeInfo"]["projectKey"]
-                    deployed_project_key = deployments_info["deploymentBasicInfo"]["deployedProjectKey"]
-                    deployment_project_mapping.setdefault(design_project_key, list()).append(deployed_project_key)
-            else:
-                # Retrieve a pre-computed mapping between the design project key and the deployment project key
-                deployment_project_mapping = self.config.deployment_project_mapping
+            # Retrieve the mapping between the design project key and the deployment project key
+            deployment_project_mapping = deployment_snapshot.get_deployment_project_mapping()
                     
             if project_key not in deployment_project_mapping:
                 message = f"Project {project_key} has no deployment in production." 
             else:
                 infra_no_active_projects = dict()
+                deployed_project_keys = deployment_project_mapping[project_key]
+                # Fetch the scenarios of the deployed projects on all the infras at once
+                deployment_snapshot.fetch_deployed_scenarios(deployed_project_keys)
                 # Check if the deployements has at least one auto-triggered scenario in each infrastructure where the project has been deployed
-                for infra_id, infra_client in self.config.infra_to_client.items():
-                    deployed_project_keys = deployment_project_mapping[project_key]
-                    infra_project_keys = infra_client.list_project_keys()
+                for infra_id in deployment_snapshot.get_reachable_infra_ids():
+                    infra_project_keys = deployment_snapshot.infra_project_keys[infra_id]
                     for deployed_project_key in deployed_project_keys:
                         if deployed_project_key in infra_project_keys:
-                            deployed_project =  infra_client.get_project(deployed_project_key)
-                            scenarios = deployed_project.list_scenarios(as_type="objects")
-                            active_scenarios = [(scenario.get_settings().get_raw().get('active')==True) 
-                                                & (len(scenario.get_settings().get_raw().get('triggers'))>0) 
+                            scenario_error = deployment_snapshot.get_deployed_scenario_error(infra_id, deployed_project_key)
+                            if scenario_error is not None:
+                                run_result.setdefault("scenario_fetch_errors_by_infra", dict()).setdefault(infra_id, dict())[deployed_project_key] = scenario_error
+                                continue
+                            scenarios = deployment_snapshot.get_deployed_scenarios(infra_id, deployed_project_key)
+                            active_scenarios = [(scenario.get('active')==True) 
+                                                & (len(scenario.get('triggers'))>0) 
                                                 for scenario in scenarios]
                             if not any(active_scenarios):
                                 infra_no_active_projects.setdefault(infra_id, list()).append(deployed_project_key)
@@ -90,6 +88,13 @@ class ProjectHasProdActiveScenario(ProjectCheck):
                     check_pass = False
                     message = "Project does not have at least an auto-triggered scenario in all infrastructures"           
                     run_result["deployed_project_without_active_scenario_by_infra"] = infra_no_active_projects
+                if check_pass and "scenario_fetch_errors_by_infra" in run_result:
+                    check_pass = None
+                    message = "The scenarios of some deployed projects could not be fetched"
+                if check_pass and deployment_snapshot.has_no_reachable_infra():
+                    check_pass = None
+                    message = "Deployment best practices can't be checked, none of the deployment infrastructures could be reached"
+                run_result.update(deployment_snapshot.get_partial_result_info())
 
         self.check_pass = check_pass
         self.message = message
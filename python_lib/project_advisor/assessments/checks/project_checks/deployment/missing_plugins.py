@@ -56,6 +56,9 @@ class ProjectHasPluginsInProd(ProjectCheck):
         elif any(infra_client is None for infra_id, infra_client in self.config.infra_to_client.items()):
             check_pass = None
             message = "Deployment best practices can't be checked with the current deployment infrastruture configuration" 
+        elif self.config.deployment_snapshot is None:
+            check_pass = None
+            message = "Deployment best practices can't be checked, the deployer and infrastructures state could not be fetched" 
         else: 
             if self.config.plugins_usage is None:
                 check_pass = None
@@ -65,18 +68,12 @@ class ProjectHasPluginsInProd(ProjectCheck):
                 if project_key not in project_plugin_usage:
                     message = "No plugin used in this project."
                 else:
-                    # Retrieve projects on the deployer and the infrastructures
-                    project_deployer = self.config.deployer_client.get_projectdeployer()
-                    deployer_projects = [deployer_project.project_key for deployer_project in project_deployer.list_projects()]
-                    infra_projects = {infra_id: infra_client.list_project_keys() for infra_id, infra_client in self.config.infra_to_client.items()}
-
                     # Retrieve the plugins used in the current project
                     current_project_plugins = project_plugin_usage[project_key]
 
                     infra_missing_plugins = dict()
                     # Compute the missing plugins in every automation node for the current project
-                    for infra_id, infra_client in self.config.infra_to_client.items():
-                        infra_plugins = set(plugin["id"] for plugin in infra_client.list_plugins())
+                    for infra_id, infra_plugins in self.config.deployment_snapshot.infra_plugins.items():
                         missing_plugins = current_project_plugins - infra_plugins
                         infra_missing_plugins[infra_id] = list(missing_plugins)
 
@@ -84,6 +81,10 @@ class ProjectHasPluginsInProd(ProjectCheck):
                         check_pass = False
                         message = f"Plugins are not installed in production infrastructures for project {project_key}."  
                         run_result["missing_plugins_by_infra"] = infra_missing_plugins
+                    if check_pass and self.config.deployment_snapshot.has_no_reachable_infra():
+                        check_pass = None
+                        message = "Deployment best practices can't be checked, none of the deployment infrastructures could be reached"
+                    run_result.update(self.config.deployment_snapshot.get_partial_result_info())
 
         self.check_pass = check_pass
         self.message = message
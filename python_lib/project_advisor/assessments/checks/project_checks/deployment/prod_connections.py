@@ -52,8 +52,11 @@ class ProjectHasConnectionsInProd(ProjectCheck):
         elif any(infra_client is None for infra_id, infra_client in self.config.infra_to_client.items()):
             check_pass = None
             message = "Deployment best practices can't be checked with the current deployment infrastruture configuration" 
+        elif self.config.deployment_snapshot is None:
+            check_pass = None
+            message = "Deployment best practices can't be checked, the deployer and infrastructures state could not be fetched" 
         else:
-            project_deployer = self.config.deployer_client.get_projectdeployer()
+            deployment_snapshot = self.config.deployment_snapshot
             
             # Compute the plugins usage across the instance
             data_object_descs = self.project.list_datasets() + self.project.list_managed_folders()
@@ -63,19 +66,13 @@ class ProjectHasConnectionsInProd(ProjectCheck):
                     connections.add(data_object_desc["params"]["connection"])
                     
             # Retrieve the existing connection remappings from the deployments        
-            connection_remappings = dict()
-            for deployment in project_deployer.list_deployments():
-                deployment_remappings = deployment.get_settings().get_raw()["bundleContainerSettings"]["remapping"]["connections"]
-                for deployment_remapping in deployment_remappings:
-                    connection_remappings[deployment_remapping["source"]] = deployment_remapping["target"]
+            connection_remappings = deployment_snapshot.get_connection_remappings()
 
             infra_missing_connections = dict()
             infra_project_remappings = dict()
             
             # Compute the missing connections per infrastructure
-            for infra_id, infra_client in self.config.infra_to_client.items():
-                # List the connections in the infra
-                infra_connections = set(infra_client.list_connections().keys())
+            for infra_id, infra_connections in deployment_snapshot.infra_connections.items():
                 # List the remappings in the deployer with a valid target in the infra
                 valid_remappings = {source: target for source, target in connection_remappings.items() if target in infra_connections}
                 # Compute the missing connections according to the infra
@@ -94,6 +91,10 @@ class ProjectHasConnectionsInProd(ProjectCheck):
                 
             if any(len(infra_project_remapping) != 0 for infra_id, infra_project_remapping in infra_project_remappings.items()):
                 run_result["valid_project_remappings_by_infra"] = infra_project_remappings
+            if check_pass and deployment_snapshot.has_no_reachable_infra():
+                check_pass = None
+                message = "Deployment best practices can't be checked, none of the deployment infrastructures could be reached"
+            run_result.update(deployment_snapshot.get_partial_result_info())
                 
         self.check_pass = check_pass
         self.message = message
@@ -43,15 +43,13 @@ class ProjectHasDeploymentCheck(ProjectCheck):
         run_result = {}
         
         try:
-            self.config.deployer_client.get_instance_info()
+            if self.config.deployment_snapshot is None:
+                raise Exception("The deployer state could not be fetched")
            
-            deployer = self.config.deployer_client.get_projectdeployer()
-            deployment_ids = []
-            for deployment in deployer.list_deployments():
-                if deployment.get_settings().get_raw()["publishedProjectKey"] ==self.project.project_key:
-                    deployment_ids.append(deployment.get_settings().get_raw()["id"])
-                    check_pass = True
-                    message = f"Project {self.project.project_key} has a deployment on the deployer"
+            deployment_ids = self.config.deployment_snapshot.get_project_deployment_ids(self.project.project_key)
+            if len(deployment_ids) > 0:
+                check_pass = True
+                message = f"Project {self.project.project_key} has a deployment on the deployer"
 
             run_result["deployment_ids"] = deployment_ids
 
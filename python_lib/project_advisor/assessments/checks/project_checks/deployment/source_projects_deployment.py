@@ -55,40 +55,23 @@ class ProjectHasSourceDeployedCheck(ProjectCheck):
         elif any(infra_client is None for infra_id, infra_client in self.config.infra_to_client.items()):
             check_pass = None
             message = "Deployment best practices can't be checked with the current deployment infrastruture configuration" 
+        elif self.config.deployment_snapshot is None:
+            check_pass = None
+            message = "Deployment best practices can't be checked, the deployer and infrastructures state could not be fetched" 
         else:
-            # Compute the shared objects across the project and the instance
-            shared_objects = {}
-            try:
-                project_keys = self.client.list_project_keys()
-
-                # Check that the project dependencies are not already computed
-                if self.config.project_dependencies is None:
-                    for sharing_project_key in project_keys:
-                        project = self.client.get_project(sharing_project_key)
-                        exposed_objects = project.get_settings().get_raw()["exposedObjects"]["objects"]
-                        for exposed_object in exposed_objects:
-                            for rule in exposed_object["rules"]:
-                                target_project = rule["targetProject"]
-                                if target_project not in shared_objects:
-                                    shared_objects[target_project] = set()
-                                shared_objects[target_project].add(sharing_project_key)
-                else:
-                    shared_objects = self.config.project_dependencies
-            except Exception as e:
+            # Retrieve the projects sharing objets to the current project from the dependency index
+            if self.config.project_dependency_index is None:
                 self.check_pass = None
                 self.message = "This check requires admin rights."
                 return self
+            sharing_projects = self.config.project_dependency_index.get_source_projects(project_key)
 
-            if project_key not in shared_objects:
+            if len(sharing_projects) == 0:
                 message = "No shared object in this project."
             else:
                 # Retrieve projects on the deployer and the infrastructures
-                project_deployer = self.config.deployer_client.get_projectdeployer()
-                deployer_projects = [deployer_project.project_key for deployer_project in project_deployer.list_projects()]
-                infra_projects = {infra_id: infra_client.list_project_keys() for infra_id, infra_client in self.config.infra_to_client.items()}
-                
-                # Retrieve the projects sharing objets to the current project
-                sharing_projects = shared_objects[project_key]
+                deployer_projects = self.config.deployment_snapshot.deployer_project_keys
+                infra_projects = self.config.deployment_snapshot.infra_project_keys
                 
                 # Check whether source projects are not published and/or deployed
                 for sharing_project in sharing_projects:
@@ -109,6 +92,10 @@ class ProjectHasSourceDeployedCheck(ProjectCheck):
                     check_pass = False
                     message = f"Source projects are not all deployed for project {project_key}."
                     run_result["source_projects_to_deploy_by_infra"] = infra_projects_to_deploy
+                if check_pass and self.config.deployment_snapshot.has_no_reachable_infra():
+                    check_pass = None
+                    message = "Deployment best practices can't be checked, none of the deployment infrastructures could be reached"
+                run_result.update(self.config.deployment_snapshot.get_partial_result_info())
 
         self.check_pass = check_pass
         self.message = message
@@ -40,19 +40,12 @@ class GlobalTagCheck(ProjectCheck):
         """
 
         # get all global tags on the instance
-        inst_tagCat=self.client.get_general_settings().get_raw()["globalTagsCategories"]
-        all_global_tags=[]
-        for i in inst_tagCat:
-            category=i["name"]
-            inst_globalTag=i["globalTags"]   
-            for j in inst_globalTag:
-                text=category + ":" + j["name"]
-                all_global_tags.append(text)
+        all_global_tags = self.config.general_settings.get_global_tags()
 
         #project tags
         project_tags = self.project.get_metadata()["tags"]
 
-        not_global_project_tags = set(project_tags) - set(all_global_tags)
+        not_global_project_tags = set(project_tags) - all_global_tags
         project_tags_text= str(not_global_project_tags)
         if len(not_global_project_tags) == 0:
             project_tags_text="None"
@@ -65,7 +58,7 @@ class GlobalTagCheck(ProjectCheck):
         for i in project_datasets:
             dataset_tags=i["tags"]
 
-            not_global_dataset_tags = set(dataset_tags) - set(all_global_tags)
+            not_global_dataset_tags = set(dataset_tags) - all_global_tags
             if len(not_global_dataset_tags) > 0:
                 project_datasets_text = project_datasets_text + "Dataset '" +i["name"] +"' with tag(s) " + str(not_global_dataset_tags) + ". "
 
@@ -82,7 +75,7 @@ class GlobalTagCheck(ProjectCheck):
 
             webapp_tags=i["tags"]
 
-            not_global_webapp_tags = set(webapp_tags) - set(all_global_tags)
+            not_global_webapp_tags = set(webapp_tags) - all_global_tags
             
             if len(not_global_webapp_tags) > 0:
                 project_webapps_text = project_webapps_text + " Webapp '" +i["name"] +"' with tag(s) " + str(not_global_webapp_tags) + ". "
@@ -100,7 +93,7 @@ class GlobalTagCheck(ProjectCheck):
 
             dashboard_tags=i["tags"]
 
-            not_global_dashboard_tags = set(dashboard_tags) - set(all_global_tags)
+            not_global_dashboard_tags = set(dashboard_tags) - all_global_tags
             
             if len(not_global_dashboard_tags) > 0:
                 project_dashboard_text = project_dashboard_text + " Dashboard '" +i["name"] +"' with tag(s) " + str(not_global_dashboard_tags) + ". "
@@ -118,7 +111,7 @@ class GlobalTagCheck(ProjectCheck):
 
             recipes_tags=i["tags"]
 
-            not_global_recipes_tags = set(recipes_tags) - set(all_global_tags)
+            not_global_recipes_tags = set(recipes_tags) - all_global_tags
             
             if len(not_global_recipes_tags) > 0:
                 project_recipes_text = project_recipes_text + " Recipe '" +i["name"] +"' with tag(s) " + str(not_global_recipes_tags) + ". "
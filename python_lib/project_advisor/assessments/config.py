@@ -3,9 +3,22 @@ import dataikuapi
 from typing import Any, Dict, List
 from abc import ABC
 import logging
+import os
 import socket
 
 from project_advisor.assessments import ProjectCheckCategory
+from project_advisor.assessments.providers.code_analysis import CodeAnalyzer
+from project_advisor.assessments.providers.project_reader import DSSProjectReader, DSSProjectFSReader
+from project_advisor.assessments.providers.instance_inventory import InstanceInventory
+from project_advisor.assessments.providers.deployment_snapshot import DeploymentSnapshot
+from project_advisor.assessments.providers.infra_fan_out import DEFAULT_INFRA_TIMEOUT
+from project_advisor.assessments.providers.local_cache import LocalCache, DEFAULT_CACHE_DIR
+from project_advisor.assessments.providers.plugin_usage import PluginUsageIndex
+from project_advisor.assessments.providers.sanity_check import SanityCheckProvider
+from project_advisor.assessments.providers.connection_catalogue import ConnectionCatalogue
+from project_advisor.assessments.providers.general_settings import GeneralSettingsCache
+from project_advisor.assessments.providers.scenario_run_history import ScenarioRunHistory
+from project_advisor.assessments.providers.dependency_index import ProjectDependencyIndex
 
 
 # File to contain the DSSAssessment class implementation.
@@ -25,8 +38,22 @@ class DSSAssessmentConfig(ABC):
     infra_to_client : Dict[str, dataikuapi.dssclient.DSSClient] = {}
     deployment_method : str = None # custom, fm_managed or manual
     deployment_mode : str = None # local or remote
-    project_dependencies : Dict[str, set] = {}
-    plugins_usage : Dict[str, set] = {}
+    deployment_snapshot : DeploymentSnapshot = None
+    deployment_project_mapping : Dict[str, list] = None
+    project_dependency_index : ProjectDependencyIndex = None
+    project_dependencies : Dict[str, set] = {} # target project -> sharing projects (view on the dependency index)
+    plugin_usage_index : PluginUsageIndex = None
+    plugins_usage : Dict[str, set] = {} # project -> plugins (view on the plugin usage index)
+    plugin_usage_error : str = None # Error of the last plugin usage computation
+    local_cache : LocalCache = None
+    sanity_check : SanityCheckProvider = None
+    connection_catalogues : Dict[int, ConnectionCatalogue] = {} # id of the client -> catalogue of its connections
+    general_settings : GeneralSettingsCache = None
+    scenario_run_history : ScenarioRunHistory = None
+    code_analyzer : CodeAnalyzer = None
+    datadir_path : str = None # Set when the FS assessments are enabled and the DSS data directory is reachable
+    project_readers : Dict[str, DSSProjectReader] = {}
+    instance_inventory : InstanceInventory = None
 
     def __init__(self, config: dict, logging_level : str = "WARNING"):
         """
@@ -39,6 +66,29 @@ class DSSAssessmentConfig(ABC):
         
         check_filters = self.config.get("check_filters", {})
         
+        # Cache of the expensive results reused across runs
+        self.local_cache = LocalCache(self.config.get("cache_dir", DEFAULT_CACHE_DIR), logger = self.logger)
+        
+        # Instance sanity check, performed on first use (sanity_check_cache_age in minutes)
+        sanity_check_cache_age = self.config.get("check_configs", {}).get("sanity_check_cache_age", 0) or 0
+        self.sanity_check = SanityCheckProvider(self.design_client, 
+                                                cache = self.local_cache, 
+                                                max_age = sanity_check_cache_age * 60, 
+                                                logger = self.logger)
+        
+        self.connection_catalogues = {}
+        
+        # General settings of the design node, downloaded on first use
+        self.general_settings = GeneralSettingsCache(self.design_client, logger = self.logger)
+        
+        # Project definitions are read from the data directory when the FS is available
+        self.project_readers = {}
+        if check_filters.get("use_fs", False):
+            self.set_datadir_path()
+        
+        # Run wide cache of the parsed recipe & webapp code
+        self.code_analyzer = CodeAnalyzer(self.logger, get_project_reader = self.get_project_reader)
+        
         # Deployment pre computations
         project_check_categories = check_filters.get("project_check_categories", [])
         if ProjectCheckCategory.DEPLOYMENT in project_check_categories:
@@ -52,6 +102,7 @@ class DSSAssessmentConfig(ABC):
                 self.logger.info("deployer_client and infra_to_client mapping have been created")
             self.compute_project_dependencies()
             
+            self.compute_deployment_snapshot()
             self.compute_deployments_projects_mapping()
         else:
             self.logger.info("DEPLOYMENT related computations are skipped")
@@ -88,6 +139,84 @@ class DSSAssessmentConfig(ABC):
         return
     
     
+    ### Project definition readers ###
+    
+    def set_datadir_path(self) -> None:
+        """
+        Sets the *datadir_path* attribute if the DSS data directory is reachable from the current process.
+        """
+        try:
+            datadir_path = self.design_client.get_instance_info().raw["dataDirPath"]
+            if os.path.isdir(os.path.join(datadir_path, "config", "projects")):
+                self.datadir_path = datadir_path
+                self.logger.info(f"Project definitions will be read from the data directory : {datadir_path}")
+            else:
+                self.logger.info("The DSS data directory is not reachable, project definitions will be read through the API")
+        except Exception as error:
+            self.logger.info(f"Failed to resolve the DSS data directory : {str(error)}")
+        return
+    
+    def get_project_reader(self, project : dataikuapi.dss.project.DSSProject) -> DSSProjectReader:
+        """
+        Returns the (cached) reader of the project definitions.
+        The reader is backed by the data directory if available, by the public API otherwise.
+        """
+        if project.project_key not in self.project_readers:
+            if self.datadir_path is not None:
+                reader = DSSProjectFSReader(project, self.datadir_path, logger = self.logger)
+            else:
+                reader = DSSProjectReader(project, logger = self.logger)
+            self.project_readers[project.project_key] = reader
+        return self.project_readers[project.project_key]
+    
+    
+    ### Connections ###
+    
+    def get_connection_catalogue(self, client : dataikuapi.dssclient.DSSClient = None) -> ConnectionCatalogue:
+        """
+        Returns the (cached) catalogue of the connections of a node, the design node by default.
+        """
+        client = self.design_client if client is None else client
+        if id(client) not in self.connection_catalogues:
+            self.connection_catalogues[id(client)] = ConnectionCatalogue.build(client, logger = self.logger)
+        return self.connection_catalogues[id(client)]
+    
+    
+    ### Scenario runs ###
+    
+    def get_scenario_run_history(self) -> ScenarioRunHistory:
+        """
+        Returns the persistent history of the scenario runs of the design node (opened on first use).
+        It is stored in the history_dir plugin setting. Without it, it falls back on the local cache directory,
+        which is temporary : once wiped, all the scenario runs are fetched again from the API.
+        """
+        if self.scenario_run_history is None:
+            instance_id = self.design_client.get_instance_info().raw["dipInstanceId"]
+            history_dir = self.config.get("history_dir")
+            if not history_dir:
+                history_dir = self.local_cache.cache_dir
+                self.logger.warning(f"No history directory configured, the scenario run history is kept in the temporary directory {history_dir}")
+            db_path = os.path.join(history_dir, f"scenario_run_history_{instance_id}.sqlite")
+            self.scenario_run_history = ScenarioRunHistory(db_path, logger = self.logger)
+        return self.scenario_run_history
+    
+    
+    ### Instance inventory ###
+    
+    def build_instance_inventory(self, tables : List[str] = None) -> None:
+        """
+        Sets the *instance_inventory* attribute with a snapshot of all the projects of the design node.
+        tables : inventory tables to sweep, only the projects table (one list_projects call) by default.
+        """
+        tables = ["projects"] if tables is None else tables
+        try:
+            self.instance_inventory = InstanceInventory.build(self.design_client, tables = tables, logger = self.logger)
+        except Exception as error:
+            self.logger.warning(f"Failed to build the instance inventory : {str(error)}")
+            self.instance_inventory = None
+        return
+    
+    
     ### Deployment helper functions ###
     
     def _get_vn_id(self, fm_client :dataikuapi.fmclient.FMClient) -> str:
@@ -115,7 +244,7 @@ class DSSAssessmentConfig(ABC):
         """
         Fetch the deployment_mode for manually connected Nodes (deployment_method : custom)
         """
-        mode = self.design_client.get_general_settings().settings.get("deployerClientSettings", {}).get("mode", None)
+        mode = self.general_settings.get_deployer_settings().get("mode", None)
         if mode == "LOCAL":
             return "local"
         elif mode == "REMOTE":
@@ -194,7 +323,7 @@ class DSSAssessmentConfig(ABC):
             if self.deployment_mode == "local":
                 self.deployer_client = self.design_client
             elif self.deployment_mode == "remote":
-                self.deployer_client = self.get_custom_remote_deployer_client(self.design_client)   
+                self.deployer_client = self.get_custom_remote_deployer_client()   
             else:
                 self.logger.info(f"The deployment mode {self.deployment_mode} is not supported")
         
@@ -214,13 +343,12 @@ class DSSAssessmentConfig(ABC):
         return
        
 
-    def get_custom_remote_deployer_client(self, design_client : dataikuapi.dssclient.DSSClient) -> dataikuapi.dssclient.DSSClient:
+    def get_custom_remote_deployer_client(self) -> dataikuapi.dssclient.DSSClient:
         """
-        Returns the deployer client for remote & manual deployements.
+        Returns the deployer client for remote & manual deployements, from the (cached) deployer settings of the design node.
         """
         self.logger.info(f"Fetching deployer client for customer remote deployment")
-        settings = design_client.get_general_settings()
-        deployer_settings = settings.settings["deployerClientSettings"]
+        deployer_settings = self.general_settings.get_deployer_settings()
         
         try:
             host = deployer_settings["nodeUrl"]
@@ -346,66 +474,67 @@ class DSSAssessmentConfig(ABC):
     def compute_project_dependencies(self) -> None:
         """
         Update the configuration with the project dependencies.
+        The dependency index is saved in the local cache between runs and incrementally refreshed on each call
+        (only the projects modified since the previous refresh are fetched).
         """
         try: 
-            shared_objects = {}
-            project_keys = self.design_client.list_project_keys()
-
-            for sharing_project_key in project_keys:
-                project = self.design_client.get_project(sharing_project_key)
-                exposed_objects = project.get_settings().get_raw()["exposedObjects"]["objects"]
-                for exposed_object in exposed_objects:
-                    for rule in exposed_object["rules"]:
-                        target_project = rule["targetProject"]
-                        if target_project not in shared_objects:
-                            shared_objects[target_project] = set()
-                        shared_objects[target_project].add(sharing_project_key)
-
-            self.project_dependencies = shared_objects
-        except:
+            if self.project_dependency_index is None:
+                self.project_dependency_index = ProjectDependencyIndex.load_and_refresh(self.design_client, self.local_cache, logger = self.logger)
+            else:
+                self.project_dependency_index.refresh(self.design_client)
+                self.project_dependency_index.save(self.design_client, self.local_cache)
+            self.project_dependencies = self.project_dependency_index.sources_by_target
+        except Exception as error:
+            self.logger.info(f"Failed to compute the project dependencies : {str(error)}")
+            self.project_dependency_index = None
             self.project_dependencies = None
         return
 
     def compute_plugins_usage(self) -> None:
         """
-        Returns the usage of plugins for all projects.
+        Update the configuration with the usage of plugins for all projects.
+        A usage index younger than the plugin_usage_cache_ttl filter (in hours) is reused from a previous run.
         """
         self.logger.info("running plugin usage computation")
-        project_plugin_usage = dict()
-        plugin_list = self.design_client.list_plugins()
-        for plugin in plugin_list:
-            plugin_id = plugin["id"]
-            plugin_usage = self.design_client.get_plugin(plugin_id).list_usages()
-            project_key = 'none'
-            for usage in plugin_usage.usages:
-                try:
-                    # Attempt to access a key that might not exist
-                    project_key = usage.project_key
-                except KeyError:
-                    pass
-                
-                project_plugin_usage.setdefault(project_key, set()).add(plugin_id)
-                
-        self.plugins_usage = project_plugin_usage
+        cache_ttl = self.config.get("check_filters", {}).get("plugin_usage_cache_ttl", 0) or 0
+        self.plugin_usage_error = None
+        try:
+            self.plugin_usage_index = PluginUsageIndex.load_or_build(self.design_client, 
+                                                                     self.local_cache, 
+                                                                     cache_ttl * 3600, 
+                                                                     logger = self.logger)
+            self.plugins_usage = self.plugin_usage_index.plugins_by_project
+        except Exception as error:
+            self.logger.warning(f"Failed to compute the plugin usage : {str(error)}")
+            self.plugin_usage_index = None
+            self.plugins_usage = None
+            self.plugin_usage_error = str(error)
         return 
     
+    def compute_deployment_snapshot(self) -> None:
+        """
+        Update the configuration with a snapshot of the deployer and automation infrastructures.
+        """
+        try:
+            infra_timeout = self.config.get("deployment_config", {}).get("infra_timeout", DEFAULT_INFRA_TIMEOUT)
+            self.deployment_snapshot = DeploymentSnapshot.build(self.deployer_client, 
+                                                                self.infra_to_client, 
+                                                                infra_timeout = infra_timeout, 
+                                                                get_connection_catalogue = self.get_connection_catalogue,
+                                                                logger = self.logger)
+        except Exception as error:
+            self.logger.info(f"Failed to build the deployment snapshot : {str(error)}")
+            self.deployment_snapshot = None
+        return
+    
     def compute_deployments_projects_mapping(self) -> None:
         """
         Returns the mapping between design and deployment project keys.
         """
-        deployment_project_mapping = dict()
         try:
-            deployments = self.deployer_client.get_projectdeployer().list_deployments()
-            for deployment in deployments:
-                deployments_info = deployment.get_status().get_light()
-                design_project_key = deployments_info["packages"][-1]["designNodeInfo"]["projectKey"]
-                deployed_project_key = deployments_info["deploymentBasicInfo"]["deployedProjectKey"]
-                deployment_project_mapping.setdefault(design_project_key, list()).append(deployed_project_key)
-
-            self.deployment_project_mapping = deployment_project_mapping
+            self.deployment_project_mapping = self.deployment_snapshot.get_deployment_project_mapping()
         except:
             self.deployment_project_mapping = None
         return 
     
 
-                             
\ No newline at end of file
@@ -43,6 +43,9 @@ class DSSAssessmentConfigBuilder():
              "check_filters" : check_filters,
              "check_configs" : check_configs,
             "llm_id":llm_id, # Keep top level
+            "report_folder" : config.get("report_folder", None), # Optional typed columnar report output
+            "score_report_dataset" : config.get("score_report_dataset", None), # Optional materialized scores
+            "history_dir" : plugin_config.get("history_dir", None), # Persistent directory of the scenario run history
             }, 
             logging_level)
     
@@ -68,6 +71,7 @@ class DSSAssessmentConfigBuilder():
         
         # Instance Check Filter preset parameters 
         max_nbr_sanity_warnings = instance_check_config_preset.get("max_nbr_sanity_warnings",None)
+        sanity_check_cache_age = instance_check_config_preset.get("sanity_check_cache_age",0)
         
         
         # Build Assessment filter config
@@ -85,6 +89,7 @@ class DSSAssessmentConfigBuilder():
                              
                              # Instance Check configs
                              "max_nbr_sanity_warnings":max_nbr_sanity_warnings,
+                             "sanity_check_cache_age":sanity_check_cache_age,
                         }
         
         return check_configs    
@@ -104,6 +109,7 @@ class DSSAssessmentConfigBuilder():
         use_llm = project_check_filter_preset.get("use_llm",None)
         
         use_plugin_usage = project_check_filter_preset.get("use_plugin_usage",None)
+        plugin_usage_cache_ttl = project_check_filter_preset.get("plugin_usage_cache_ttl",0)
         use_fs = project_check_filter_preset.get("use_fs",None)
         
         use_project_check_white_list = project_check_filter_preset.get("use_project_check_white_list",False)
@@ -122,6 +128,7 @@ class DSSAssessmentConfigBuilder():
                             "use_llm" : use_llm,
                             "use_fs" : use_fs,
                             "use_plugin_usage" : use_plugin_usage,
+                            "plugin_usage_cache_ttl" : plugin_usage_cache_ttl,
                             "use_project_check_white_list" : use_project_check_white_list,
                             "project_check_white_list" : project_check_white_list,
                             "project_check_categories" : project_check_categories,
@@ -264,7 +271,10 @@ class DSSAssessmentConfigBuilder():
                                  "deployment_config" : deployment_config,
                                  "check_filters" : check_filters,
                                  "check_configs" : check_configs,
-                                 "llm_id":llm_id # keep top level
+                                 "llm_id":llm_id, # keep top level
+                                 "report_folder" : step_config.get("report_folder", None), # Optional typed columnar report output
+                                 "score_report_dataset" : step_config.get("score_report_dataset", None), # Optional materialized scores
+                                 "history_dir" : plugin_level_config.get("history_dir", None) # Persistent directory of the scenario run history
                                 }, logging_level)
         
         
@@ -35,15 +35,7 @@ class NumberConnectionTypesMetric(InstanceMetric):
         Computes the number of distinct connection types on the instance.
         :return: self
         """
-        connections = self.client.list_connections()
-
-        connection_types = set()  
-        for connection in connections:
-            connection_details = self.client.get_connection(connection)
-            connection_type = connection_details.get_definition().get('type')
-            connection_types.add(connection_type)
-            
-        connection_types = list(connection_types)
+        connection_types = self.config.get_connection_catalogue(self.client).list_connection_types()
         self.value = len(connection_types)
         self.run_result = {"conn_types": connection_types}
         return self
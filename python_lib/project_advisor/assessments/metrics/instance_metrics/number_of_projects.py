@@ -33,7 +33,11 @@ class NumberProjectsMetric(InstanceMetric):
         Computes the number of projects in the instance.
         :return: self
         """
-        project_keys = self.client.list_project_keys()
+        # Projects already listed in the instance inventory of the run
+        if self.config.instance_inventory is not None:
+            project_keys = self.config.instance_inventory.list_project_keys()
+        else:
+            project_keys = self.client.list_project_keys()
         
         nb_projects = len(project_keys)
         
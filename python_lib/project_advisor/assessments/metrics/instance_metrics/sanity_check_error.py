@@ -38,16 +38,9 @@ class SanityCheckErrorsMetric(InstanceMetric):
         Computes the list of connections used in a project.
         :return: self
         """
-        sc = self.client.perform_instance_sanity_check()
-        sanity_issues = []
-        error_count = 0
+        sanity_issues = self.config.sanity_check.get_issues(severity = 'ERROR')
 
-        for message in sc.messages:
-            if message.severity == 'ERROR':
-                sanity_issues.append({'severity': message.severity, 'title': message.title, 'details': message.details})
-                error_count+=1
-
-        self.value = error_count
+        self.value = len(sanity_issues)
         self.run_result = sanity_issues
         return self
     
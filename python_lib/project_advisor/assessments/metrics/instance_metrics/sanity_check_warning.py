@@ -38,18 +38,9 @@ class SanityCheckWarningsMetric(InstanceMetric):
         Computes the list of connections used in a project.
         :return: self
         """
-        sc = self.client.perform_instance_sanity_check()
-        sanity_issues = []
+        sanity_issues = self.config.sanity_check.get_issues(severity = 'WARNING')
 
-        warning_count = 0
-        for message in sc.messages:
-           
-            if message.severity == 'WARNING':
-                sanity_issues.append({'severity': message.severity, 'title': message.title, 'details': message.details})
-                warning_count+=1
-
-
-        self.value = warning_count
+        self.value = len(sanity_issues)
         self.run_result = sanity_issues
         return self
     
@@ -44,27 +44,10 @@ class NumberOfTooBigPyRecipesMetric(ProjectMetric):
           'recipe_ids': {}
          }
 
-        # Get all recipes in the project
-        recipe_list = self.project.list_recipes()
-
-        # Filter for Python code recipes
-        python_recipes_list = [recipe for recipe in recipe_list if recipe['type'] == 'python']
-
-        for recipe in python_recipes_list:
-            dss_recipe = recipe.to_recipe()
-            python_code = dss_recipe.get_settings().get_code()
-            if python_code == None:
-                python_code = ""
-
-            # Ignore blank lines, imports, and comments
-            lines = [line for line in python_code.split("\n") 
-                 if line != "" 
-                 and not line.startswith("#")
-                 and not line.startswith("import")
-                 and not line.startswith("from")
-                ]
-            if len(lines) > max_nbr_row_python_recipe:
-                result['recipe_ids'][dss_recipe.id] = len(lines)
+        # Logical lines ignore blank lines, imports, comments and docstrings
+        for recipe_name, code_metrics in self.config.code_analyzer.analyze_python_recipes(self.project).items():
+            if code_metrics.logical_lines > max_nbr_row_python_recipe:
+                result['recipe_ids'][recipe_name] = code_metrics.logical_lines
         
         self.value = len(result['recipe_ids'])
         self.run_result = result
@@ -0,0 +1,352 @@
+import dataikuapi
+
+import ast
+import io
+import logging
+import tokenize
+from typing import Callable, Dict, List, Set, Tuple
+
+from project_advisor.assessments.providers.project_reader import DSSProjectReader
+
+
+DATASET_READ_METHODS = {"get_dataframe", "iter_dataframes", "iter_rows", "iter_tuples", "get_files_info", "raw_formatted_data"}
+DATASET_WRITE_METHODS = {"write_with_schema", "write_dataframe", "write_from_dataframe", "get_writer", "write_schema", "write_schema_from_dataframe"}
+PYTHON_WEBAPP_TYPES = ["DASH", "STANDARD", "BOKEH"]
+
+
+class CodeMetrics():
+    """
+    Result of the static analysis of a piece of python code (recipe or webapp backend).
+    The source is parsed once and all the code size assessments read from this record,
+    only the computed metrics are kept (not the source, the records are cached for the whole run).
+    """
+    object_type : str = None
+    object_id : str = None
+    total_lines : int = 0
+    blank_lines : int = 0
+    comment_lines : int = 0
+    docstring_lines : int = 0
+    import_lines : int = 0
+    logical_lines : int = 0
+    functions : List[dict] = None
+    complexity : int = 1
+    imports : List[str] = None
+    dataset_reads : List[str] = None
+    dataset_writes : List[str] = None
+    parse_error : str = None
+
+    def __init__(self, object_type : str, object_id : str):
+        self.object_type = object_type
+        self.object_id = object_id
+        self.functions = []
+        self.imports = []
+        self.dataset_reads = []
+        self.dataset_writes = []
+
+    def get_max_function_complexity(self) -> int:
+        """
+        Return the highest cyclomatic complexity of all the functions (0 if there are no functions).
+        """
+        return max([f["complexity"] for f in self.functions], default = 0)
+
+    def to_dict(self) -> dict:
+        """
+        Returns a json serializable payload of the code metrics.
+        """
+        return {
+                    "object_type" : self.object_type,
+                    "object_id" : self.object_id,
+                    "total_lines" : self.total_lines,
+                    "logical_lines" : self.logical_lines,
+                    "blank_lines" : self.blank_lines,
+                    "comment_lines" : self.comment_lines,
+                    "docstring_lines" : self.docstring_lines,
+                    "import_lines" : self.import_lines,
+                    "functions" : self.functions,
+                    "complexity" : self.complexity,
+                    "max_function_complexity" : self.get_max_function_complexity(),
+                    "imports" : self.imports,
+                    "dataset_reads" : self.dataset_reads,
+                    "dataset_writes" : self.dataset_writes,
+                    "parse_error" : self.parse_error
+               }
+
+
+class _ComplexityVisitor(ast.NodeVisitor):
+    """
+    Compute the McCabe cyclomatic complexity of a node (1 + number of decision points).
+    """
+    def __init__(self):
+        self.complexity = 1
+
+    def visit_If(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    def visit_IfExp(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    def visit_For(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    def visit_AsyncFor(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    def visit_While(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    def visit_ExceptHandler(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    def visit_Assert(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    def visit_BoolOp(self, node):
+        self.complexity += len(node.values) - 1
+        self.generic_visit(node)
+
+    def visit_comprehension(self, node):
+        self.complexity += 1 + len(node.ifs)
+        self.generic_visit(node)
+
+    def visit_match_case(self, node):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    # Nested functions & classes are scored on their own.
+    def visit_FunctionDef(self, node):
+        return
+
+    def visit_AsyncFunctionDef(self, node):
+        return
+
+
+def _node_complexity(node : ast.AST) -> int:
+    visitor = _ComplexityVisitor()
+    for child in ast.iter_child_nodes(node):
+        visitor.visit(child)
+    return visitor.complexity
+
+
+def _is_dataset_constructor(node : ast.AST) -> bool:
+    """
+    Return True for calls like dataiku.Dataset(...) or Dataset(...)
+    """
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr == "Dataset"
+    if isinstance(func, ast.Name):
+        return func.id == "Dataset"
+    return False
+
+
+def _literal_first_arg(node : ast.Call) -> str:
+    if len(node.args) > 0 and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
+        return node.args[0].value
+    for keyword in node.keywords:
+        if keyword.arg == "name" and isinstance(keyword.value, ast.Constant) and isinstance(keyword.value.value, str):
+            return keyword.value.value
+    return None
+
+
+def _docstring_lines(tree : ast.AST) -> Set[int]:
+    """
+    Return the line numbers covered by module, class & function docstrings.
+    """
+    lines = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            body = node.body
+            if (len(body) > 0
+                and isinstance(body[0], ast.Expr)
+                and isinstance(body[0].value, ast.Constant)
+                and isinstance(body[0].value.value, str)):
+                lines.update(range(body[0].lineno, body[0].end_lineno + 1))
+    return lines
+
+
+def _import_lines(tree : ast.AST) -> Tuple[Set[int], List[str]]:
+    """
+    Return the lines covered by import statements (including multi-line imports) and the imported top level modules.
+    """
+    lines = set()
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            lines.update(range(node.lineno, node.end_lineno + 1))
+            modules.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            lines.update(range(node.lineno, node.end_lineno + 1))
+            if node.module and node.level == 0:
+                modules.add(node.module.split(".")[0])
+    return lines, sorted(modules)
+
+
+def _dataset_io(tree : ast.AST) -> Tuple[List[str], List[str]]:
+    """
+    Find the datasets read and written through the dataiku API.
+    Handles both chained calls (dataiku.Dataset("a").get_dataframe()) and handles assigned to a variable.
+    """
+    handles = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and _is_dataset_constructor(node.value):
+            dataset_name = _literal_first_arg(node.value)
+            for target in node.targets:
+                if isinstance(target, ast.Name) and dataset_name is not None:
+                    handles[target.id] = dataset_name
+
+    reads = set()
+    writes = set()
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+            continue
+        owner = node.func.value
+        dataset_name = None
+        if isinstance(owner, ast.Name):
+            dataset_name = handles.get(owner.id)
+        elif _is_dataset_constructor(owner):
+            dataset_name = _literal_first_arg(owner)
+        if dataset_name is None:
+            continue
+        if node.func.attr in DATASET_READ_METHODS:
+            reads.add(dataset_name)
+        elif node.func.attr in DATASET_WRITE_METHODS:
+            writes.add(dataset_name)
+    return sorted(reads), sorted(writes)
+
+
+def analyze_python_code(source : str, object_type : str = "", object_id : str = "") -> CodeMetrics:
+    """
+    Parse a python source once and compute all the code metrics.
+    A logical line is a line holding code that is not a comment, a docstring or an import statement.
+    """
+    metrics = CodeMetrics(object_type, object_id)
+    source = source if source is not None else ""
+    lines = source.splitlines()
+    metrics.total_lines = len(lines)
+    metrics.blank_lines = len([line for line in lines if line.strip() == ""])
+
+    # Lines holding code tokens & comment only lines
+    code_lines = set()
+    comment_lines = set()
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type == tokenize.COMMENT:
+                comment_lines.add(token.start[0])
+            elif token.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER):
+                code_lines.update(range(token.start[0], token.end[0] + 1))
+    except (tokenize.TokenError, IndentationError, SyntaxError) as error:
+        # Fallback on a naive line scan when the code can't be tokenized.
+        code_lines = {i + 1 for i, line in enumerate(lines) if line.strip() != "" and not line.strip().startswith("#")}
+        comment_lines = {i + 1 for i, line in enumerate(lines) if line.strip().startswith("#")}
+        metrics.parse_error = f"{type(error).__name__} : {error}"
+    metrics.comment_lines = len(comment_lines - code_lines)
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as error:
+        metrics.parse_error = f"{type(error).__name__} : {error}"
+        metrics.logical_lines = len(code_lines)
+        return metrics
+
+    docstring_lines = _docstring_lines(tree)
+    import_lines, imports = _import_lines(tree)
+    metrics.docstring_lines = len(docstring_lines & code_lines)
+    metrics.import_lines = len(import_lines & code_lines)
+    metrics.logical_lines = len(code_lines - docstring_lines - import_lines)
+    metrics.imports = imports
+    metrics.complexity = _node_complexity(tree)
+
+    functions = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.append({
+                                "name" : node.name,
+                                "lineno" : node.lineno,
+                                "lines" : node.end_lineno - node.lineno + 1,
+                                "complexity" : _node_complexity(node)
+                             })
+            metrics.complexity += functions[-1]["complexity"] - 1
+    metrics.functions = sorted(functions, key = lambda f : f["lineno"])
+
+    metrics.dataset_reads, metrics.dataset_writes = _dataset_io(tree)
+    return metrics
+
+
+class CodeAnalyzer():
+    """
+    Run wide cache of the code metrics of all python recipes & webapps.
+    Each source is fetched and parsed at most once per run, all the code size assessments share the result.
+    """
+    logger : logging.Logger = None
+    code_metrics : Dict[Tuple[str, str, str], CodeMetrics] = None
+    get_project_reader : Callable[[dataikuapi.dss.project.DSSProject], DSSProjectReader] = None
+
+    def __init__(self,
+                 logger : logging.Logger = None,
+                 get_project_reader : Callable[[dataikuapi.dss.project.DSSProject], DSSProjectReader] = None
+                ):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.code_metrics = {}
+        if get_project_reader is None:
+            get_project_reader = lambda project : DSSProjectReader(project, logger = self.logger)
+        self.get_project_reader = get_project_reader
+
+    def clear(self) -> None:
+        """
+        Drop all the cached code metrics.
+        """
+        self.code_metrics = {}
+
+    ### Source fetching ###
+
+    def get_recipe_code(self, project : dataikuapi.dss.project.DSSProject, recipe_name : str) -> str:
+        """
+        Fetch the code of a code recipe.
+        """
+        return self.get_project_reader(project).get_recipe_code(recipe_name)
+
+    def get_webapp_code(self, project : dataikuapi.dss.project.DSSProject, webapp_id : str) -> str:
+        """
+        Fetch the python backend code of a webapp.
+        """
+        return self.get_project_reader(project).get_webapp_code(webapp_id)
+
+    ### Cached analysis ###
+
+    def analyze_recipe(self, project : dataikuapi.dss.project.DSSProject, recipe_name : str) -> CodeMetrics:
+        """
+        Return the (cached) code metrics of a python recipe.
+        """
+        key = (project.project_key, "RECIPE", recipe_name)
+        if key not in self.code_metrics:
+            self.logger.debug(f"Analyzing code of recipe {recipe_name} in project {project.project_key}")
+            source = self.get_recipe_code(project, recipe_name)
+            self.code_metrics[key] = analyze_python_code(source, object_type = "RECIPE", object_id = recipe_name)
+        return self.code_metrics[key]
+
+    def analyze_webapp(self, project : dataikuapi.dss.project.DSSProject, webapp_id : str) -> CodeMetrics:
+        """
+        Return the (cached) code metrics of a python webapp backend.
+        """
+        key = (project.project_key, "WEB_APP", webapp_id)
+        if key not in self.code_metrics:
+            self.logger.debug(f"Analyzing code of webapp {webapp_id} in project {project.project_key}")
+            source = self.get_webapp_code(project, webapp_id)
+            self.code_metrics[key] = analyze_python_code(source, object_type = "WEB_APP", object_id = webapp_id)
+        return self.code_metrics[key]
+
+    def analyze_python_recipes(self, project : dataikuapi.dss.project.DSSProject) -> Dict[str, CodeMetrics]:
+        """
+        Return the code metrics of all the python recipes of a project (recipe name -> CodeMetrics).
+        """
+        python_recipe_names = [recipe["name"] for recipe in self.get_project_reader(project).list_recipes() if recipe["type"] == "python"]
+        return {recipe_name : self.analyze_recipe(project, recipe_name) for recipe_name in python_recipe_names}
@@ -0,0 +1,54 @@
+import dataikuapi
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set
+
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class ConnectionCatalogue():
+    """
+    Name & type of all the connections of a DSS node, loaded in bulk.
+    The types come from the connection listing when it returns the definitions (admin listing),
+    the missing ones are fetched concurrently.
+    """
+    logger : logging.Logger = None
+    connection_types : Dict[str, str] = None # connection name -> connection type
+
+    def __init__(self, logger : logging.Logger = None):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.connection_types = {}
+
+    @classmethod
+    def build(cls,
+              client : dataikuapi.dssclient.DSSClient,
+              max_workers : int = DEFAULT_MAX_WORKERS,
+              logger : logging.Logger = None
+             ) -> "ConnectionCatalogue":
+        catalogue = cls(logger = logger)
+        connections = client.list_connections()
+
+        missing_types = []
+        for connection_name in connections:
+            connection = connections[connection_name] if isinstance(connections, dict) else None
+            if isinstance(connection, dict) and connection.get("type") is not None:
+                catalogue.connection_types[connection_name] = connection["type"]
+            else:
+                missing_types.append(connection_name)
+
+        if len(missing_types) > 0:
+            catalogue.logger.debug(f"Fetching the definition of {len(missing_types)} connections")
+            def get_connection_type(connection_name : str) -> str:
+                return client.get_connection(connection_name).get_definition().get("type")
+            with ThreadPoolExecutor(max_workers = max_workers) as executor:
+                for connection_name, connection_type in zip(missing_types, executor.map(get_connection_type, missing_types)):
+                    catalogue.connection_types[connection_name] = connection_type
+        return catalogue
+
+    def list_connection_names(self) -> Set[str]:
+        return set(self.connection_types.keys())
+
+    def list_connection_types(self) -> List[str]:
+        return list(set(self.connection_types.values()))
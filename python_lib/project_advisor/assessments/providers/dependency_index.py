@@ -0,0 +1,144 @@
+import logging
+from typing import TYPE_CHECKING, Dict, List, Set
+
+from project_advisor.assessments.providers.local_cache import LocalCache
+
+if TYPE_CHECKING: # Only used in the type hints, the index is importable without dataikuapi
+    import dataikuapi
+
+
+# The cached index is refreshed incrementally, it is only fully rebuilt once this old (in seconds)
+CACHE_MAX_AGE = 30 * 24 * 3600
+
+
+class ProjectDependencyIndex():
+    """
+    Cross project dependency index built from the objects exposed between projects.
+    It is kept in both directions (sharing project -> target projects & target project -> sharing projects)
+    and can be refreshed incrementally, only the projects modified since the last refresh are fetched again.
+    """
+    logger : logging.Logger = None
+    targets_by_source : Dict[str, Set[str]] = None
+    sources_by_target : Dict[str, Set[str]] = None
+    project_versions : Dict[str, int] = None # project key -> last modification time seen at indexing
+
+    def __init__(self, logger : logging.Logger = None):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.targets_by_source = {}
+        self.sources_by_target = {}
+        self.project_versions = {}
+
+    @classmethod
+    def build(cls, client : "dataikuapi.dssclient.DSSClient", logger : logging.Logger = None) -> "ProjectDependencyIndex":
+        """
+        Build the index for all the projects of the instance.
+        """
+        index = cls(logger = logger)
+        index.refresh(client)
+        return index
+
+    ### Lookups ###
+
+    def get_source_projects(self, project_key : str) -> Set[str]:
+        """
+        Return the projects sharing objects to the given project.
+        """
+        return self.sources_by_target.get(project_key, set())
+
+    def get_target_projects(self, project_key : str) -> Set[str]:
+        """
+        Return the projects the given project shares objects to.
+        """
+        return self.targets_by_source.get(project_key, set())
+
+    ### Updates ###
+
+    def set_project_targets(self, project_key : str, target_projects : List[str]) -> None:
+        """
+        Replace the targets of a sharing project and update the reverse mapping accordingly.
+        """
+        self.remove_project(project_key)
+        targets = set(target_projects)
+        if len(targets) == 0:
+            return
+        self.targets_by_source[project_key] = targets
+        for target_project in targets:
+            self.sources_by_target.setdefault(target_project, set()).add(project_key)
+
+    def remove_project(self, project_key : str) -> None:
+        """
+        Remove a sharing project from the index.
+        """
+        for target_project in self.targets_by_source.pop(project_key, set()):
+            sources = self.sources_by_target.get(target_project, set())
+            sources.discard(project_key)
+            if len(sources) == 0:
+                self.sources_by_target.pop(target_project, None)
+        self.project_versions.pop(project_key, None)
+
+    def refresh_project(self, client : "dataikuapi.dssclient.DSSClient", project_key : str) -> None:
+        """
+        Fetch the exposed objects of a project and update its entries.
+        """
+        exposed_objects = client.get_project(project_key).get_settings().get_raw()["exposedObjects"]["objects"]
+        target_projects = [rule["targetProject"] for exposed_object in exposed_objects for rule in exposed_object["rules"]]
+        self.set_project_targets(project_key, target_projects)
+
+    def refresh(self, client : "dataikuapi.dssclient.DSSClient") -> None:
+        """
+        Bring the index up to date : index new & modified projects and drop deleted ones.
+        """
+        projects = client.list_projects()
+        current_versions = {p["projectKey"] : p.get("versionTag", {}).get("lastModifiedOn") for p in projects}
+
+        for project_key in set(self.project_versions.keys()) - set(current_versions.keys()):
+            self.remove_project(project_key)
+
+        nbr_refreshed = 0
+        for project_key, version in current_versions.items():
+            if version is not None and self.project_versions.get(project_key) == version:
+                continue
+            self.refresh_project(client, project_key)
+            self.project_versions[project_key] = version
+            nbr_refreshed += 1
+        self.logger.info(f"Project dependency index refreshed ({nbr_refreshed} / {len(current_versions)} projects fetched)")
+
+    ### Cross run cache ###
+
+    def to_dict(self) -> dict:
+        return {"targets_by_source" : {project_key : sorted(targets) for project_key, targets in self.targets_by_source.items()},
+                "project_versions" : self.project_versions}
+
+    @classmethod
+    def from_dict(cls, value : dict, logger : logging.Logger = None) -> "ProjectDependencyIndex":
+        index = cls(logger = logger)
+        for project_key, target_projects in value["targets_by_source"].items():
+            index.set_project_targets(project_key, target_projects)
+        index.project_versions = dict(value["project_versions"])
+        return index
+
+    @staticmethod
+    def get_cache_key(client : "dataikuapi.dssclient.DSSClient") -> str:
+        return f"project_dependency_index_{client.get_instance_info().raw['dipInstanceId']}"
+
+    def save(self, client : "dataikuapi.dssclient.DSSClient", cache : LocalCache) -> None:
+        cache.set(self.get_cache_key(client), self.to_dict())
+
+    @classmethod
+    def load_and_refresh(cls,
+                         client : "dataikuapi.dssclient.DSSClient",
+                         cache : LocalCache,
+                         logger : logging.Logger = None
+                        ) -> "ProjectDependencyIndex":
+        """
+        Load the index saved by a previous run for this instance, refresh it (only the modified projects are fetched)
+        and save it for the next run. The index is built from scratch if none was saved.
+        """
+        cached_index = cache.get(cls.get_cache_key(client), CACHE_MAX_AGE)
+        if cached_index is not None:
+            index = cls.from_dict(cached_index, logger = logger)
+            index.refresh(client)
+        else:
+            index = cls.build(client, logger = logger)
+        index.save(client, cache)
+        return index
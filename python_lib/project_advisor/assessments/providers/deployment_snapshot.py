@@ -0,0 +1,154 @@
+import dataikuapi
+import requests
+
+import logging
+from typing import Callable, Dict, List, Set, Tuple
+
+from project_advisor.assessments.providers.infra_fan_out import InfraFanOut, DEFAULT_INFRA_TIMEOUT
+from project_advisor.assessments.providers.connection_catalogue import ConnectionCatalogue
+
+
+class DeploymentSnapshot():
+    """
+    Run wide snapshot of the project deployer and of the automation infrastructures.
+    The deployer and infra listings are fetched once, all the deployment checks read from this record.
+    """
+    logger : logging.Logger = None
+    fan_out : InfraFanOut = None
+    deployment_settings : Dict[str, dict] = None # deployment id -> raw settings
+    deployment_status : Dict[str, dict] = None # deployment id -> light status
+    deployer_project_keys : Set[str] = None
+    infra_project_keys : Dict[str, Set[str]] = None
+    infra_plugins : Dict[str, Set[str]] = None
+    infra_connections : Dict[str, Set[str]] = None
+    deployed_scenarios : Dict[Tuple[str, str], List[dict]] = None # (infra id, project key) -> raw scenario settings
+    deployed_scenario_errors : Dict[Tuple[str, str], str] = None # (infra id, project key) -> fetch error
+
+    def __init__(self, logger : logging.Logger = None):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.deployment_settings = {}
+        self.deployment_status = {}
+        self.deployer_project_keys = set()
+        self.infra_project_keys = {}
+        self.infra_plugins = {}
+        self.infra_connections = {}
+        self.deployed_scenarios = {}
+        self.deployed_scenario_errors = {}
+
+    @classmethod
+    def build(cls,
+              deployer_client : dataikuapi.dssclient.DSSClient,
+              infra_to_client : Dict[str, dataikuapi.dssclient.DSSClient],
+              infra_timeout : float = DEFAULT_INFRA_TIMEOUT,
+              get_connection_catalogue : Callable[[dataikuapi.dssclient.DSSClient], ConnectionCatalogue] = None,
+              logger : logging.Logger = None
+             ) -> "DeploymentSnapshot":
+        """
+        Fetch the deployments (settings & status), the deployer projects and, concurrently for each reachable infra,
+        its projects, plugins and connections.
+        """
+        snapshot = cls(logger = logger)
+        snapshot.logger.info("Building the deployment snapshot")
+        if get_connection_catalogue is None:
+            get_connection_catalogue = lambda client : ConnectionCatalogue.build(client, logger = snapshot.logger)
+
+        project_deployer = deployer_client.get_projectdeployer()
+        for deployment in project_deployer.list_deployments():
+            snapshot.deployment_settings[deployment.id] = deployment.get_settings().get_raw()
+            snapshot.deployment_status[deployment.id] = deployment.get_status().get_light()
+        snapshot.deployer_project_keys = set(deployer_project.project_key for deployer_project in project_deployer.list_projects())
+
+        def fetch_infra_state(infra_id : str, infra_client : dataikuapi.dssclient.DSSClient) -> dict:
+            return {"project_keys" : set(infra_client.list_project_keys()),
+                    "plugins" : set(plugin["id"] for plugin in infra_client.list_plugins()),
+                    "connections" : get_connection_catalogue(infra_client).list_connection_names()}
+
+        snapshot.fan_out = InfraFanOut(infra_to_client, timeout = infra_timeout, logger = snapshot.logger)
+        for infra_id, infra_state in snapshot.fan_out.run(fetch_infra_state).items():
+            snapshot.infra_project_keys[infra_id] = infra_state["project_keys"]
+            snapshot.infra_plugins[infra_id] = infra_state["plugins"]
+            snapshot.infra_connections[infra_id] = infra_state["connections"]
+
+        snapshot.logger.info(f"Deployment snapshot built with {len(snapshot.deployment_settings)} deployments and {len(snapshot.infra_project_keys)} reachable infras")
+        return snapshot
+
+    def get_deployment_project_mapping(self) -> Dict[str, List[str]]:
+        """
+        Return the mapping between the design project keys and their deployed project keys.
+        """
+        deployment_project_mapping = dict()
+        for deployments_info in self.deployment_status.values():
+            design_project_key = deployments_info["packages"][-1]["designNodeInfo"]["projectKey"]
+            deployed_project_key = deployments_info["deploymentBasicInfo"]["deployedProjectKey"]
+            deployment_project_mapping.setdefault(design_project_key, list()).append(deployed_project_key)
+        return deployment_project_mapping
+
+    def get_project_deployment_ids(self, project_key : str) -> List[str]:
+        """
+        Return the ids of the deployments of a published project.
+        """
+        return [settings["id"] for settings in self.deployment_settings.values() if settings.get("publishedProjectKey") == project_key]
+
+    def get_connection_remappings(self) -> Dict[str, str]:
+        """
+        Return the connection remappings (source -> target) defined across all the deployments.
+        """
+        connection_remappings = dict()
+        for settings in self.deployment_settings.values():
+            for deployment_remapping in settings["bundleContainerSettings"]["remapping"]["connections"]:
+                connection_remappings[deployment_remapping["source"]] = deployment_remapping["target"]
+        return connection_remappings
+
+    def fetch_deployed_scenarios(self, project_keys : List[str]) -> None:
+        """
+        Fetch concurrently on all the reachable infras the raw settings of the scenarios of the given deployed projects.
+        Projects already fetched are skipped. A project that fails is recorded in *deployed_scenario_errors*,
+        only connection errors & timeouts mark the whole infra as unreachable.
+        """
+        def fetch_scenarios(infra_id : str, infra_client : dataikuapi.dssclient.DSSClient) -> Dict[str, List[dict]]:
+            scenarios = {}
+            for project_key in project_keys:
+                if (infra_id, project_key) in self.deployed_scenarios or (infra_id, project_key) in self.deployed_scenario_errors:
+                    continue
+                if project_key not in self.infra_project_keys.get(infra_id, set()):
+                    continue
+                try:
+                    deployed_project = infra_client.get_project(project_key)
+                    scenarios[project_key] = [scenario.get_settings().get_raw() for scenario in deployed_project.list_scenarios(as_type="objects")]
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    raise
+                except Exception as error:
+                    self.logger.warning(f"Failed to fetch the scenarios of project {project_key} on infra {infra_id} : {str(error)}")
+                    self.deployed_scenario_errors[(infra_id, project_key)] = f"{type(error).__name__} : {str(error)}"
+            return scenarios
+
+        for infra_id, scenarios in self.fan_out.run(fetch_scenarios).items():
+            for project_key, project_scenarios in scenarios.items():
+                self.deployed_scenarios[(infra_id, project_key)] = project_scenarios
+
+    def get_deployed_scenarios(self, infra_id : str, project_key : str) -> List[dict]:
+        """
+        Return the raw settings of the scenarios of a project deployed on an infra (see *fetch_deployed_scenarios*).
+        """
+        return self.deployed_scenarios.get((infra_id, project_key), [])
+
+    def get_deployed_scenario_error(self, infra_id : str, project_key : str) -> str:
+        """
+        Return the error raised when fetching the scenarios of a deployed project, None if they were fetched.
+        """
+        return self.deployed_scenario_errors.get((infra_id, project_key))
+
+    def get_reachable_infra_ids(self) -> List[str]:
+        return [infra_id for infra_id in self.infra_project_keys.keys() if infra_id not in self.fan_out.unreachable_infras]
+
+    def has_no_reachable_infra(self) -> bool:
+        """
+        True when infras are configured but none of them could be reached : nothing was checked on the infras.
+        """
+        return len(self.fan_out.infra_to_client) > 0 and len(self.get_reachable_infra_ids()) == 0
+
+    def get_partial_result_info(self) -> dict:
+        """
+        Flags to add to the run_result of a check when some infras could not be reached.
+        """
+        return self.fan_out.get_partial_result_info()
@@ -0,0 +1,67 @@
+import dataikuapi
+
+import logging
+from typing import Dict, List, Set
+
+
+class GeneralSettingsCache():
+    """
+    Instance level cache of the general settings of a DSS node.
+    The settings document is downloaded once per run and the parts read by the assessments
+    (global tags, external url, deployer settings) are parsed once.
+    """
+    logger : logging.Logger = None
+    client : dataikuapi.dssclient.DSSClient = None
+    raw_settings : dict = None
+    global_tags_by_category : Dict[str, Set[str]] = None
+
+    def __init__(self, client : dataikuapi.dssclient.DSSClient, logger : logging.Logger = None):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.client = client
+
+    def get_raw(self) -> dict:
+        """
+        Return the raw general settings, fetched on first use.
+        """
+        if self.raw_settings is None:
+            self.logger.debug("Fetching the instance general settings")
+            self.raw_settings = self.client.get_general_settings().get_raw()
+        return self.raw_settings
+
+    def refresh(self) -> None:
+        """
+        Drop the cached settings, they are fetched again on next use.
+        """
+        self.raw_settings = None
+        self.global_tags_by_category = None
+
+    ### Global tags ###
+
+    def get_global_tag_categories(self) -> List[dict]:
+        return self.get_raw().get("globalTagsCategories", [])
+
+    def get_global_tags_by_category(self) -> Dict[str, Set[str]]:
+        """
+        Return the global tag names of each global tag category.
+        """
+        if self.global_tags_by_category is None:
+            self.global_tags_by_category = {category["name"] : set(tag["name"] for tag in category.get("globalTags", []))
+                                            for category in self.get_global_tag_categories()}
+        return self.global_tags_by_category
+
+    def get_global_tags(self) -> Set[str]:
+        """
+        Return all the global tags as they appear on the DSS objects ("Category:tag").
+        """
+        return set(f"{category}:{tag}" for category, tags in self.get_global_tags_by_category().items() for tag in tags)
+
+    def has_global_tag(self, category : str, tag : str) -> bool:
+        return tag in self.get_global_tags_by_category().get(category, set())
+
+    ### Other settings ###
+
+    def get_external_url(self) -> str:
+        return self.get_raw().get("studioExternalUrl", "")
+
+    def get_deployer_settings(self) -> dict:
+        return self.get_raw().get("deployerClientSettings", {})
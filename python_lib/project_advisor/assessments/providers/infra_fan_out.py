@@ -0,0 +1,95 @@
+import dataikuapi
+
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List
+
+
+DEFAULT_INFRA_TIMEOUT = 60 # seconds
+DEFAULT_MAX_WORKERS = 8
+
+
+def set_request_timeout(client : dataikuapi.dssclient.DSSClient, timeout : float) -> None:
+    """
+    Bound every HTTP request of a client (the requests sessions have no default timeout),
+    so that a call to an unresponsive node raises instead of hanging.
+    """
+    session = client._session
+    request = getattr(session, "_untimed_request", session.request)
+    session._untimed_request = request
+    session.request = functools.partial(_request_with_timeout, request, timeout)
+
+def _request_with_timeout(request : Callable, default_timeout : float, method : str, url : str, **kwargs) -> Any:
+    kwargs.setdefault("timeout", default_timeout)
+    return request(method, url, **kwargs)
+
+
+class InfraFanOut():
+    """
+    Issue the same request to all the automation infras concurrently.
+    Each HTTP request to an infra is bounded by the timeout, an infra that fails or times out is marked unreachable once
+    and skipped by all the following requests of the run (circuit breaking).
+    """
+    logger : logging.Logger = None
+    infra_to_client : Dict[str, dataikuapi.dssclient.DSSClient] = None
+    timeout : float = DEFAULT_INFRA_TIMEOUT
+    max_workers : int = DEFAULT_MAX_WORKERS
+    unreachable_infras : Dict[str, str] = None # infra id -> reason
+
+    def __init__(self,
+                 infra_to_client : Dict[str, dataikuapi.dssclient.DSSClient],
+                 timeout : float = DEFAULT_INFRA_TIMEOUT,
+                 max_workers : int = DEFAULT_MAX_WORKERS,
+                 logger : logging.Logger = None
+                ):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.infra_to_client = {infra_id : client for infra_id, client in infra_to_client.items() if client is not None}
+        for client in self.infra_to_client.values():
+            set_request_timeout(client, timeout)
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.unreachable_infras = {}
+
+    def get_reachable_infra_ids(self) -> List[str]:
+        return [infra_id for infra_id in self.infra_to_client.keys() if infra_id not in self.unreachable_infras]
+
+    def mark_unreachable(self, infra_id : str, reason : str) -> None:
+        if infra_id not in self.unreachable_infras:
+            self.logger.warning(f"Automation infra {infra_id} is marked as unreachable for the rest of the run : {reason}")
+            self.unreachable_infras[infra_id] = reason
+
+    def run(self, request : Callable[[str, dataikuapi.dssclient.DSSClient], Any]) -> Dict[str, Any]:
+        """
+        Call request(infra_id, infra_client) on every reachable infra.
+        Return the results of the infras that answered in time (infra id -> result).
+        """
+        infra_ids = self.get_reachable_infra_ids()
+        if len(infra_ids) == 0:
+            return {}
+
+        executor = ThreadPoolExecutor(max_workers = min(self.max_workers, len(infra_ids)))
+        futures = {infra_id : executor.submit(request, infra_id, self.infra_to_client[infra_id]) for infra_id in infra_ids}
+        # The requests are bounded by the HTTP timeout, the wait only guards against a slow sequence of requests
+        wait(futures.values(), timeout = self.timeout)
+        executor.shutdown(wait = False)
+
+        results = {}
+        for infra_id, future in futures.items():
+            if not future.done():
+                future.cancel()
+                self.mark_unreachable(infra_id, f"no answer after {self.timeout} seconds")
+            elif future.exception() is not None:
+                error = future.exception()
+                self.mark_unreachable(infra_id, f"{type(error).__name__} : {str(error)}")
+            else:
+                results[infra_id] = future.result()
+        return results
+
+    def get_partial_result_info(self) -> dict:
+        """
+        Flags to add to a run_result computed without some of the infras.
+        """
+        if len(self.unreachable_infras) == 0:
+            return {}
+        return {"partial_result" : True, "unreachable_infras" : dict(self.unreachable_infras)}
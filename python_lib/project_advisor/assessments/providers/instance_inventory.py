@@ -0,0 +1,109 @@
+import dataikuapi
+import pandas as pd
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List
+
+
+# Columns of each inventory table. All the tables are keyed by project_key.
+INVENTORY_TABLES = {
+    "projects" : ["project_key", "name", "owner_login", "owner_display_name", "project_type"],
+    "permissions" : ["project_key", "user", "group", "admin", "write_project_content", "read_project_content"],
+}
+DEFAULT_MAX_WORKERS = 8
+
+
+class InstanceInventory():
+    """
+    Snapshot of the project level objects of a DSS instance.
+    It is built in one sweep over all the projects (with a bounded number of concurrent API calls)
+    and stored column by column, one table per object type (see INVENTORY_TABLES).
+    """
+    logger : logging.Logger = None
+    tables : Dict[str, Dict[str, list]] = None
+    build_time : datetime = None
+
+    def __init__(self, logger : logging.Logger = None):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.tables = {table : {column : [] for column in columns} for table, columns in INVENTORY_TABLES.items()}
+
+    ### Build ###
+
+    @classmethod
+    def build(cls,
+              client : dataikuapi.dssclient.DSSClient,
+              tables : List[str] = None,
+              max_workers : int = DEFAULT_MAX_WORKERS,
+              logger : logging.Logger = None
+             ) -> "InstanceInventory":
+        """
+        Build the inventory of all the projects of the instance.
+        tables : restrict the sweep to a subset of INVENTORY_TABLES (the projects table is always built).
+        """
+        inventory = cls(logger = logger)
+        tables = list(INVENTORY_TABLES.keys()) if tables is None else tables
+        inventory.logger.info(f"Building the instance inventory ({tables}) with {max_workers} workers")
+
+        projects = client.list_projects()
+        for p in projects:
+            inventory._append("projects", {"project_key" : p["projectKey"],
+                                           "name" : p.get("name"),
+                                           "owner_login" : p.get("ownerLogin"),
+                                           "owner_display_name" : p.get("ownerDisplayName"),
+                                           "project_type" : p.get("projectType")})
+
+        project_tables = [table for table in tables if table != "projects"]
+        if len(project_tables) > 0:
+            with ThreadPoolExecutor(max_workers = max_workers) as executor:
+                sweeps = executor.map(lambda p : inventory._sweep_project(client, p["projectKey"], project_tables), projects)
+                # Rows are appended from the main thread only, in the project order.
+                for rows in sweeps:
+                    for table, table_rows in rows.items():
+                        for row in table_rows:
+                            inventory._append(table, row)
+
+        inventory.build_time = datetime.now()
+        inventory.logger.info(f"Instance inventory built for {len(projects)} projects")
+        return inventory
+
+    def _sweep_project(self, client : dataikuapi.dssclient.DSSClient, project_key : str, tables : List[str]) -> Dict[str, List[dict]]:
+        """
+        Collect the rows of all the requested tables for one project.
+        A failing table is logged and left empty, it does not stop the sweep.
+        """
+        project = client.get_project(project_key)
+        rows = {}
+        for table in tables:
+            try:
+                rows[table] = getattr(self, f"_fetch_{table}")(project)
+            except Exception as error:
+                self.logger.warning(f"Failed to fetch {table} of project {project_key} : {str(error)}")
+                rows[table] = []
+        return rows
+
+    def _fetch_permissions(self, project : dataikuapi.dss.project.DSSProject) -> List[dict]:
+        return [{"project_key" : project.project_key,
+                 "user" : permission.get("user"),
+                 "group" : permission.get("group"),
+                 "admin" : permission.get("admin", False),
+                 "write_project_content" : permission.get("writeProjectContent", False),
+                 "read_project_content" : permission.get("readProjectContent", False)}
+                for permission in project.get_permissions().get("permissions", [])]
+
+    def _append(self, table : str, row : dict) -> None:
+        columns = self.tables[table]
+        for column in columns.keys():
+            columns[column].append(row.get(column))
+
+    ### Read ###
+
+    def get_table(self, table : str) -> pd.DataFrame:
+        """
+        Return an inventory table as a dataframe.
+        """
+        return pd.DataFrame(self.tables[table], columns = INVENTORY_TABLES[table])
+
+    def list_project_keys(self) -> List[str]:
+        return list(self.tables["projects"]["project_key"])
@@ -0,0 +1,61 @@
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any
+
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "project_advisor_cache")
+
+
+class LocalCache():
+    """
+    Small json key/value store on the local file system, used to reuse expensive results across runs.
+    Each entry is stored in its own file with the time it was written.
+    """
+    logger : logging.Logger = None
+    cache_dir : str = None
+
+    def __init__(self, cache_dir : str = DEFAULT_CACHE_DIR, logger : logging.Logger = None):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+
+    def _get_path(self, key : str) -> str:
+        file_name = "".join(c if (c.isalnum() or c in "-_.") else "_" for c in key)
+        return os.path.join(self.cache_dir, f"{file_name}.json")
+
+    def get(self, key : str, max_age : float) -> Any:
+        """
+        Return the cached value if it is younger than max_age (in seconds), None otherwise.
+        """
+        path = self._get_path(key)
+        if max_age <= 0 or not os.path.isfile(path):
+            return None
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except Exception as error:
+            self.logger.debug(f"Failed to read cache entry {key} : {str(error)}")
+            return None
+        age = time.time() - entry.get("written_at", 0)
+        if age > max_age:
+            self.logger.debug(f"Cache entry {key} is expired ({int(age)}s old)")
+            return None
+        self.logger.info(f"Reusing cache entry {key} ({int(age)}s old)")
+        return entry.get("value")
+
+    def set(self, key : str, value : Any) -> None:
+        """
+        Store a json serializable value. Failing to write the cache never fails the run.
+        """
+        path = self._get_path(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok = True)
+            # Write then rename, so that a concurrent reader never sees a partial file.
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"written_at" : time.time(), "value" : value}, f)
+            os.replace(tmp_path, path)
+        except Exception as error:
+            self.logger.debug(f"Failed to write cache entry {key} : {str(error)}")
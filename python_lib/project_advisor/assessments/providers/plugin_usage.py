@@ -0,0 +1,99 @@
+import dataikuapi
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set
+
+from project_advisor.assessments.providers.local_cache import LocalCache
+
+
+DEFAULT_MAX_WORKERS = 4
+NO_PROJECT_KEY = "none" # Usages that are not attached to a project
+
+
+class PluginUsageIndex():
+    """
+    Usage of all the installed plugins, computed once per run (plugin -> projects, project -> plugins, maybe used flags).
+    Listing the usages of a plugin scans all the projects, the plugins are therefore processed concurrently
+    and the index can be reused across runs through a LocalCache.
+    """
+    logger : logging.Logger = None
+    projects_by_plugin : Dict[str, Set[str]] = None
+    plugins_by_project : Dict[str, Set[str]] = None
+    maybe_used : Dict[str, bool] = None
+
+    def __init__(self, logger : logging.Logger = None):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.projects_by_plugin = {}
+        self.plugins_by_project = {}
+        self.maybe_used = {}
+
+    @classmethod
+    def build(cls,
+              client : dataikuapi.dssclient.DSSClient,
+              max_workers : int = DEFAULT_MAX_WORKERS,
+              logger : logging.Logger = None
+             ) -> "PluginUsageIndex":
+        """
+        List the usages of every installed plugin.
+        """
+        index = cls(logger = logger)
+        plugin_ids = [plugin["id"] for plugin in client.list_plugins()]
+        index.logger.info(f"Computing the usage of {len(plugin_ids)} plugins")
+
+        def list_plugin_usages(plugin_id : str):
+            return plugin_id, client.get_plugin(plugin_id).list_usages()
+
+        with ThreadPoolExecutor(max_workers = max_workers) as executor:
+            for plugin_id, plugin_usage in executor.map(list_plugin_usages, plugin_ids):
+                project_keys = set()
+                for usage in plugin_usage.usages:
+                    try:
+                        project_keys.add(usage.project_key)
+                    except KeyError:
+                        project_keys.add(NO_PROJECT_KEY)
+                index.add_plugin(plugin_id, project_keys, plugin_usage.maybe_used())
+        return index
+
+    def add_plugin(self, plugin_id : str, project_keys : Set[str], maybe_used : bool) -> None:
+        self.projects_by_plugin[plugin_id] = set(project_keys)
+        self.maybe_used[plugin_id] = maybe_used
+        for project_key in project_keys:
+            self.plugins_by_project.setdefault(project_key, set()).add(plugin_id)
+
+    def get_unused_plugins(self) -> List[str]:
+        """
+        Return the plugins that are not (even maybe) used.
+        """
+        return [plugin_id for plugin_id, maybe_used in self.maybe_used.items() if not maybe_used]
+
+    ### Cross run cache ###
+
+    def to_dict(self) -> dict:
+        return {plugin_id : {"project_keys" : sorted(project_keys), "maybe_used" : self.maybe_used[plugin_id]}
+                for plugin_id, project_keys in self.projects_by_plugin.items()}
+
+    @classmethod
+    def from_dict(cls, plugins : dict, logger : logging.Logger = None) -> "PluginUsageIndex":
+        index = cls(logger = logger)
+        for plugin_id, plugin in plugins.items():
+            index.add_plugin(plugin_id, set(plugin["project_keys"]), plugin["maybe_used"])
+        return index
+
+    @classmethod
+    def load_or_build(cls,
+                      client : dataikuapi.dssclient.DSSClient,
+                      cache : LocalCache,
+                      ttl : float,
+                      logger : logging.Logger = None
+                     ) -> "PluginUsageIndex":
+        """
+        Reuse the index cached for this instance if it is younger than ttl (in seconds), build it otherwise.
+        """
+        cache_key = f"plugin_usage_{client.get_instance_info().raw['dipInstanceId']}"
+        cached_plugins = cache.get(cache_key, ttl)
+        if cached_plugins is not None:
+            return cls.from_dict(cached_plugins, logger = logger)
+        index = cls.build(client, logger = logger)
+        cache.set(cache_key, index.to_dict())
+        return index
@@ -0,0 +1,184 @@
+import dataikuapi
+
+import json
+import logging
+import os
+from typing import Dict, List
+
+
+class DSSProjectReader():
+    """
+    Read access to the recipes, datasets, scenarios & webapps definitions of a project.
+    This default implementation goes through the public API (one call per object).
+    """
+    project : dataikuapi.dss.project.DSSProject = None
+    logger : logging.Logger = None
+
+    def __init__(self, project : dataikuapi.dss.project.DSSProject, logger : logging.Logger = None):
+        self.project = project
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+
+    ### Recipes ###
+
+    def list_recipes(self) -> List[dict]:
+        """
+        List the recipes of the project, each item contains at least the recipe "name" and "type".
+        """
+        return [{"name" : recipe["name"], "type" : recipe["type"]} for recipe in self.project.list_recipes()]
+
+    def get_recipe_code(self, recipe_name : str) -> str:
+        """
+        Return the code of a code recipe.
+        """
+        return self.project.get_recipe(recipe_name).get_settings().get_code()
+
+    ### Datasets ###
+
+    def list_datasets(self) -> List[dict]:
+        """
+        List the datasets of the project, each item contains at least the dataset "name" and "type".
+        """
+        return [{"name" : dataset["name"], "type" : dataset["type"]} for dataset in self.project.list_datasets()]
+
+    def get_dataset_raw_settings(self, dataset_name : str) -> dict:
+        """
+        Return the raw settings of a dataset.
+        """
+        return self.project.get_dataset(dataset_name).get_settings().get_raw()
+
+    ### Scenarios ###
+
+    def list_scenarios(self) -> List[dict]:
+        """
+        List the scenarios of the project, each item contains at least the scenario "id", "name" and "type".
+        """
+        return [{"id" : scenario["id"], "name" : scenario.get("name"), "type" : scenario.get("type")} for scenario in self.project.list_scenarios()]
+
+    def get_scenario_raw_settings(self, scenario_id : str) -> dict:
+        """
+        Return the raw settings of a scenario (including its "triggers" and "params").
+        """
+        return self.project.get_scenario(scenario_id).get_settings().get_raw()
+
+    ### Webapps ###
+
+    def get_webapp_code(self, webapp_id : str) -> str:
+        """
+        Return the python backend code of a webapp.
+        """
+        settings = self.project.get_webapp(webapp_id).get_settings().get_raw()
+        return settings.get("params", {}).get("python")
+
+
+class DSSProjectFSReader(DSSProjectReader):
+    """
+    Read the project definitions directly from the DSS data directory (config/projects/<PROJECT_KEY>).
+    Each folder is loaded in bulk on first access and kept for the rest of the run.
+    Any object missing on disk is fetched through the public API.
+    """
+    project_dir : str = None
+    recipes : Dict[str, dict] = None
+    recipe_code_paths : Dict[str, str] = None # recipe name -> code file, read on demand (the code is not kept)
+    datasets : Dict[str, dict] = None
+    scenarios : Dict[str, dict] = None
+    webapps : Dict[str, dict] = None
+
+    def __init__(self, project : dataikuapi.dss.project.DSSProject, datadir_path : str, logger : logging.Logger = None):
+        super().__init__(project = project, logger = logger)
+        self.project_dir = os.path.join(datadir_path, "config", "projects", project.project_key)
+
+    def _load_json_folder(self, folder_name : str) -> Dict[str, dict]:
+        """
+        Load all the json files of a project config folder (file name without extension -> content).
+        """
+        folder_path = os.path.join(self.project_dir, folder_name)
+        objects = {}
+        if not os.path.isdir(folder_path):
+            return objects
+        for file_name in os.listdir(folder_path):
+            object_id, extension = os.path.splitext(file_name)
+            if extension != ".json":
+                continue
+            try:
+                with open(os.path.join(folder_path, file_name), "r") as f:
+                    objects[object_id] = json.load(f)
+            except Exception as error:
+                self.logger.debug(f"Failed to read {file_name} in {folder_path} : {str(error)}")
+        self.logger.debug(f"Loaded {len(objects)} {folder_name} definitions from {folder_path}")
+        return objects
+
+    def _load_recipes(self) -> None:
+        """
+        Load all the recipe definitions and list the code files stored next to them.
+        """
+        self.recipes = self._load_json_folder("recipes")
+        self.recipe_code_paths = {}
+        folder_path = os.path.join(self.project_dir, "recipes")
+        if not os.path.isdir(folder_path):
+            return
+        for file_name in os.listdir(folder_path):
+            recipe_name, extension = os.path.splitext(file_name)
+            if extension == ".json" or recipe_name not in self.recipes:
+                continue
+            self.recipe_code_paths[recipe_name] = os.path.join(folder_path, file_name)
+
+    ### Recipes ###
+
+    def list_recipes(self) -> List[dict]:
+        if self.recipes is None:
+            self._load_recipes()
+        if len(self.recipes) == 0:
+            return super().list_recipes()
+        return [{"name" : recipe_name, "type" : recipe.get("type")} for recipe_name, recipe in self.recipes.items()]
+
+    def get_recipe_code(self, recipe_name : str) -> str:
+        if self.recipe_code_paths is None:
+            self._load_recipes()
+        if recipe_name in self.recipe_code_paths:
+            try:
+                with open(self.recipe_code_paths[recipe_name], "r") as f:
+                    return f.read()
+            except Exception as error:
+                self.logger.debug(f"Failed to read the code of recipe {recipe_name} : {str(error)}")
+        return super().get_recipe_code(recipe_name)
+
+    ### Datasets ###
+
+    def list_datasets(self) -> List[dict]:
+        if self.datasets is None:
+            self.datasets = self._load_json_folder("datasets")
+        if len(self.datasets) == 0:
+            return super().list_datasets()
+        return [{"name" : dataset_name, "type" : dataset.get("type")} for dataset_name, dataset in self.datasets.items()]
+
+    def get_dataset_raw_settings(self, dataset_name : str) -> dict:
+        if self.datasets is None:
+            self.datasets = self._load_json_folder("datasets")
+        if dataset_name in self.datasets:
+            return self.datasets[dataset_name]
+        return super().get_dataset_raw_settings(dataset_name)
+
+    ### Scenarios ###
+
+    def list_scenarios(self) -> List[dict]:
+        if self.scenarios is None:
+            self.scenarios = self._load_json_folder("scenarios")
+        if len(self.scenarios) == 0:
+            return super().list_scenarios()
+        return [{"id" : scenario_id, "name" : scenario.get("name"), "type" : scenario.get("type")} for scenario_id, scenario in self.scenarios.items()]
+
+    def get_scenario_raw_settings(self, scenario_id : str) -> dict:
+        if self.scenarios is None:
+            self.scenarios = self._load_json_folder("scenarios")
+        if scenario_id in self.scenarios:
+            return self.scenarios[scenario_id]
+        return super().get_scenario_raw_settings(scenario_id)
+
+    ### Webapps ###
+
+    def get_webapp_code(self, webapp_id : str) -> str:
+        if self.webapps is None:
+            self.webapps = self._load_json_folder("web_apps")
+        if webapp_id in self.webapps:
+            return self.webapps[webapp_id].get("params", {}).get("python")
+        return super().get_webapp_code(webapp_id)
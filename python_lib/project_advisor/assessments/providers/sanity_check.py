@@ -0,0 +1,50 @@
+import dataikuapi
+
+import logging
+from typing import List
+
+from project_advisor.assessments.providers.local_cache import LocalCache
+
+
+class SanityCheckProvider():
+    """
+    Shared result of the instance sanity check.
+    The sanity check is one of the most expensive admin operations, it is performed at most once per run
+    and a report younger than max_age (in seconds) can be reused from a previous run.
+    """
+    logger : logging.Logger = None
+    client : dataikuapi.dssclient.DSSClient = None
+    cache : LocalCache = None
+    max_age : float = 0
+    issues : List[dict] = None
+
+    def __init__(self,
+                 client : dataikuapi.dssclient.DSSClient,
+                 cache : LocalCache = None,
+                 max_age : float = 0,
+                 logger : logging.Logger = None
+                ):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.client = client
+        self.cache = cache
+        self.max_age = max_age
+
+    def _get_cache_key(self) -> str:
+        return f"sanity_check_{self.client.get_instance_info().raw['dipInstanceId']}"
+
+    def get_issues(self, severity : str = None) -> List[dict]:
+        """
+        Return the sanity check messages ({severity, title, details}), optionally filtered on a severity.
+        """
+        if self.issues is None:
+            if self.cache is not None:
+                self.issues = self.cache.get(self._get_cache_key(), self.max_age)
+            if self.issues is None:
+                self.logger.info("Performing the instance sanity check")
+                sc = self.client.perform_instance_sanity_check()
+                self.issues = [{'severity': message.severity, 'title': message.title, 'details': message.details} for message in sc.messages]
+                if self.cache is not None:
+                    self.cache.set(self._get_cache_key(), self.issues)
+        if severity is None:
+            return self.issues
+        return [issue for issue in self.issues if issue['severity'] == severity]
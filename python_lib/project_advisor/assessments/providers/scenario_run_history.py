@@ -0,0 +1,130 @@
+import dataikuapi
+
+import datetime
+import logging
+import os
+import sqlite3
+import time
+from typing import List
+
+
+DEFAULT_RETENTION_DAYS = 30
+
+
+class ScenarioRunHistory():
+    """
+    Persistent store of the scenario runs (local SQLite database).
+    For each scenario, only the runs newer than the stored watermark are fetched from DSS,
+    the "failures in the last N days" & "last outcome" questions are then answered locally.
+    Runs older than the retention window are pruned.
+    """
+    logger : logging.Logger = None
+    db_path : str = None
+    retention_days : int = DEFAULT_RETENTION_DAYS
+    connection : sqlite3.Connection = None
+    synced_scenarios : set = None # (project key, scenario id) already synced during this run
+
+    def __init__(self, db_path : str, retention_days : int = DEFAULT_RETENTION_DAYS, logger : logging.Logger = None):
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self.synced_scenarios = set()
+
+        os.makedirs(os.path.dirname(db_path), exist_ok = True)
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("""CREATE TABLE IF NOT EXISTS scenario_runs (
+                                       project_key TEXT, scenario_id TEXT, run_id TEXT,
+                                       start_time REAL, end_time REAL, outcome TEXT,
+                                       PRIMARY KEY (project_key, scenario_id, run_id))""")
+        self.connection.execute("""CREATE TABLE IF NOT EXISTS scenario_watermarks (
+                                       project_key TEXT, scenario_id TEXT, watermark REAL,
+                                       PRIMARY KEY (project_key, scenario_id))""")
+        self.connection.commit()
+        self.prune()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    ### Maintenance ###
+
+    def get_retention_start(self) -> float:
+        return time.time() - self.retention_days * 24 * 3600
+
+    def prune(self) -> None:
+        """
+        Delete the runs that started before the retention window.
+        """
+        cursor = self.connection.execute("DELETE FROM scenario_runs WHERE start_time < ?", (self.get_retention_start(),))
+        self.connection.commit()
+        if cursor.rowcount > 0:
+            self.logger.debug(f"Pruned {cursor.rowcount} scenario runs older than {self.retention_days} days")
+
+    ### Synchronization ###
+
+    def _store_run(self, project_key : str, scenario_id : str, run : dataikuapi.dss.scenario.DSSScenarioRun) -> None:
+        # Run times are in epoch milliseconds in the run payload
+        start = run.run.get("start", 0) / 1000
+        end = run.run.get("end", 0) / 1000 if run.run.get("end", 0) > 0 else None
+        outcome = run.run.get("result", {}).get("outcome")
+        self.connection.execute("INSERT OR REPLACE INTO scenario_runs VALUES (?, ?, ?, ?, ?, ?)",
+                                (project_key, scenario_id, run.id, start, end, outcome))
+
+    def sync(self, scenario : dataikuapi.dss.scenario.DSSScenario) -> None:
+        """
+        Fetch the runs started since the watermark of the scenario (at most once per run of the advisor).
+        The watermark stops at the oldest run still in progress so that its outcome is fetched later on.
+        """
+        key = (scenario.project_key, scenario.id)
+        if key in self.synced_scenarios:
+            return
+
+        row = self.connection.execute("SELECT watermark FROM scenario_watermarks WHERE project_key = ? AND scenario_id = ?", key).fetchone()
+        watermark = max(row[0], self.get_retention_start()) if row is not None else self.get_retention_start()
+
+        now = time.time()
+        runs = scenario.get_runs_by_date(from_date = datetime.datetime.fromtimestamp(watermark),
+                                         to_date = datetime.datetime.fromtimestamp(now))
+        new_watermark = now
+        for run in runs:
+            self._store_run(scenario.project_key, scenario.id, run)
+            if run.run.get("result", {}).get("outcome") is None:
+                new_watermark = min(new_watermark, run.run.get("start", 0) / 1000)
+
+        self.connection.execute("INSERT OR REPLACE INTO scenario_watermarks VALUES (?, ?, ?)", key + (new_watermark,))
+        self.connection.commit()
+        self.synced_scenarios.add(key)
+        self.logger.debug(f"Synced {len(runs)} runs of scenario {scenario.id} in project {scenario.project_key}")
+
+    ### Queries ###
+
+    def get_runs(self, scenario : dataikuapi.dss.scenario.DSSScenario, days : int = 7) -> List[dict]:
+        """
+        Return the runs of the last days ({run_id, start_time, end_time, outcome}), most recent first.
+        """
+        self.sync(scenario)
+        since = time.time() - days * 24 * 3600
+        rows = self.connection.execute("""SELECT run_id, start_time, end_time, outcome FROM scenario_runs
+                                          WHERE project_key = ? AND scenario_id = ? AND start_time >= ?
+                                          ORDER BY start_time DESC""", (scenario.project_key, scenario.id, since)).fetchall()
+        return [{"run_id" : run_id, "start_time" : start_time, "end_time" : end_time, "outcome" : outcome}
+                for run_id, start_time, end_time, outcome in rows]
+
+    def get_failed_runs(self, scenario : dataikuapi.dss.scenario.DSSScenario, days : int = 7) -> List[dict]:
+        return [run for run in self.get_runs(scenario, days = days) if run["outcome"] == "FAILED"]
+
+    def get_last_outcome(self, scenario : dataikuapi.dss.scenario.DSSScenario) -> str:
+        """
+        Return the outcome of the last finished run, None if the scenario never completed a run.
+        Scenarios without a run in the retention window are looked up through the API.
+        """
+        self.sync(scenario)
+        row = self.connection.execute("""SELECT outcome FROM scenario_runs
+                                         WHERE project_key = ? AND scenario_id = ? AND outcome IS NOT NULL
+                                         ORDER BY start_time DESC LIMIT 1""", (scenario.project_key, scenario.id)).fetchone()
+        if row is not None:
+            return row[0]
+        try:
+            run = scenario.get_last_finished_run()
+        except Exception:
+            return None
+        return run.outcome
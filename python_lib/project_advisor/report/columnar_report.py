@@ -0,0 +1,160 @@
+import dataiku
+
+import io
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import List
+
+import pandas as pd
+
+from project_advisor.report.report_partitions import (get_run_date_partition, select_run_date_partitions)
+
+
+TIMESTAMP_FORMAT = "%m/%d/%Y, %H:%M:%S"
+
+METRIC_REPORT = "metrics"
+CHECK_REPORT = "checks"
+
+# Typed columnar schema of the reports, the frequently used result_data fields are flattened into their own columns.
+REPORT_COLUMN_TYPES = {
+    METRIC_REPORT : {
+        "timestamp" : "datetime64[ns]",
+        "metric_name" : "category",
+        "metric_type" : "category",
+        "project_id" : "category",
+        "metric_value" : "object",
+        "metric_value_num" : "float64",
+        "description" : "object",
+        "metric_unit" : "object",
+        "result_data" : "object",
+    },
+    CHECK_REPORT : {
+        "timestamp" : "datetime64[ns]",
+        "check_name" : "category",
+        "check_category" : "category",
+        "project_id" : "category",
+        "pass" : "boolean",
+        "is_critical" : "boolean",
+        "message" : "object",
+        "description" : "object",
+        "result_data" : "object",
+    },
+}
+
+# result_data field flattened into each column
+FLATTENED_FIELDS = {
+    METRIC_REPORT : ["description", "metric_unit"],
+    CHECK_REPORT : ["description", "is_critical"],
+}
+
+# In memory types of the loaded reports
+CATEGORICAL_COLUMNS = {
+    METRIC_REPORT : ["metric_name", "metric_type", "project_id"],
+    CHECK_REPORT : ["check_name", "check_category", "project_id"],
+}
+BOOLEAN_COLUMNS = {
+    METRIC_REPORT : [],
+    CHECK_REPORT : ["pass", "is_critical"],
+}
+
+
+### Writing ###
+
+def _load_result_data(result_data : str) -> dict:
+    try:
+        data = json.loads(result_data)
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def build_report_frame(records : List[dict], report : str) -> pd.DataFrame:
+    """
+    Build the typed columnar frame of a report (METRIC_REPORT or CHECK_REPORT) from the records saved to the report datasets.
+    """
+    column_types = REPORT_COLUMN_TYPES[report]
+    df = pd.DataFrame.from_records(records, columns = [c for c in column_types.keys() if c not in FLATTENED_FIELDS[report] and c != "metric_value_num"])
+
+    result_data = [_load_result_data(r) for r in df["result_data"]]
+    for field in FLATTENED_FIELDS[report]:
+        df[field] = [data.get(field) for data in result_data]
+
+    df["timestamp"] = pd.to_datetime(df["timestamp"], format = TIMESTAMP_FORMAT)
+    df["project_id"] = df["project_id"].mask(df["project_id"] == "") # Instance assessments have no project
+    if report == METRIC_REPORT:
+        df["metric_value"] = df["metric_value"].astype(str).where(df["metric_value"].notna()) # Missing values are kept null
+        df["metric_value_num"] = pd.to_numeric(df["metric_value"].where(df["metric_type"].isin(["INT", "FLOAT"])), errors = "coerce")
+
+    return df[list(column_types.keys())].astype(column_types)
+
+def write_report_frame(folder : dataiku.Folder, report : str, df : pd.DataFrame, timestamp : datetime) -> str:
+    """
+    Write a report frame as a new Parquet file of the run date partition of the report folder, return its path.
+    """
+    path = f"/{report}/{get_run_date_partition(timestamp)}/{timestamp.strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:8]}.parquet"
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index = False)
+    folder.upload_data(path, buffer.getvalue())
+    return path
+
+
+### Reading ###
+
+def _get_file_run_date(path : str) -> str:
+    # Files are named after the run timestamp (%Y%m%dT%H%M%S_<id>.parquet)
+    name = path.split("/")[-1]
+    return f"{name[0:4]}-{name[4:6]}-{name[6:8]}"
+
+def list_report_files(folder : dataiku.Folder, report : str, history_days : int = None, since : str = None) -> List[str]:
+    """
+    List the Parquet files of a report, restricted to the latest run date plus history_days days of history (all if None)
+    and to the run dates from since (incremental loads).
+    """
+    paths = [path for path in folder.list_paths_in_partition() if path.startswith(f"/{report}/") and path.endswith(".parquet")]
+    run_dates = set(select_run_date_partitions([_get_file_run_date(path) for path in paths], history_days, since))
+    return sorted(path for path in paths if _get_file_run_date(path) in run_dates)
+
+def load_report_frame(folder : dataiku.Folder, report : str, columns : List[str] = None, history_days : int = None, since : str = None) -> pd.DataFrame:
+    """
+    Load a report from the Parquet files of the report folder, reading only the given columns
+    and the run date partitions of the time window (see list_report_files).
+    The frame is returned with the in-memory types of format_report_frame.
+    """
+    column_types = REPORT_COLUMN_TYPES[report]
+    if columns is None:
+        columns = list(column_types.keys())
+
+    frames = []
+    for path in list_report_files(folder, report, history_days, since):
+        with folder.get_download_stream(path) as stream:
+            frames.append(pd.read_parquet(io.BytesIO(stream.read()), columns = columns))
+    logging.info(f"Loaded {len(frames)} {report} report files from the report folder")
+
+    if len(frames) == 0:
+        return pd.DataFrame({c : pd.Series(dtype = column_types[c]) for c in columns})
+
+    # The categories differ between files, they are rebuilt on the concatenated frame
+    return format_report_frame(pd.concat(frames, ignore_index = True), report)
+
+
+### In memory format ###
+
+def format_report_frame(df : pd.DataFrame, report : str) -> pd.DataFrame:
+    """
+    Convert a loaded report (dataset or Parquet files) to its compact in-memory types :
+    timestamps parsed in one vectorized pass with the explicit report format, categorical names & project ids,
+    nullable boolean flags (None for the checks that don't apply). Logs the memory footprint.
+    """
+    memory_before = df.memory_usage(deep = True).sum()
+    if not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+        df["timestamp"] = pd.to_datetime(df["timestamp"], format = TIMESTAMP_FORMAT)
+    for column in CATEGORICAL_COLUMNS[report]:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    for column in BOOLEAN_COLUMNS[report]:
+        if column in df.columns:
+            df[column] = df[column].astype("boolean")
+    memory_after = df.memory_usage(deep = True).sum()
+    logging.info(f"Loaded {report} report : {len(df)} rows, {memory_after / 1024**2:.2f} MB in memory ({memory_before / 1024**2:.2f} MB before formatting)")
+    return df
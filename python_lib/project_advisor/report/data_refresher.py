@@ -0,0 +1,63 @@
+# Data Refresher
+import logging
+import threading
+from typing import Any, Callable, List
+
+
+class ReportDataRefresher():
+    """
+    Holds the report data used by a webapp and refreshes it in a background thread.
+    The refresh function returns the new data (None when there is no new run), which is swapped in one assignment :
+    the callbacks read self.data once and work on a consistent version while a refresh is running.
+    """
+    data : Any = None
+    refresh_data : Callable = None
+    refresh_interval : int = None
+    on_refresh : List[Callable] = None
+
+    def __init__(self, data : Any, refresh_data : Callable, refresh_interval : int = None):
+        """
+        refresh_interval : minutes between two refreshes (no refresh if empty or 0).
+        """
+        self.data = data
+        self.refresh_data = refresh_data
+        self.refresh_interval = refresh_interval
+        self.on_refresh = []
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self) -> None:
+        """
+        Start the background refresh thread.
+        """
+        if not self.refresh_interval or self.thread is not None:
+            return
+        logging.info(f"Starting the report data refresh every {self.refresh_interval} minutes")
+        self.thread = threading.Thread(target = self.run, name = "report-data-refresher", daemon = True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def run(self) -> None:
+        while not self.stop_event.wait(self.refresh_interval * 60):
+            self.refresh()
+
+    def refresh(self) -> bool:
+        """
+        Refresh the data now, return True if new data was swapped in.
+        """
+        try:
+            new_data = self.refresh_data(self.data)
+        except Exception as error:
+            logging.exception(f"Failed to refresh the report data, keeping the loaded data : {error}")
+            return False
+        if new_data is None:
+            logging.info("No new run in the reports")
+            return False
+
+        self.data = new_data
+        logging.info("Report data refreshed")
+        for callback in self.on_refresh:
+            callback(new_data)
+        return True
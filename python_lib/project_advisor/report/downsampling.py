@@ -0,0 +1,79 @@
+# Downsampling
+import numpy as np
+import pandas as pd
+
+##############################
+## Time series downsampling ##
+##############################
+
+def lttb_indices(x, y, n_out):
+    """
+    Positions of the points kept by the Largest-Triangle-Three-Buckets algorithm :
+    the first & last points, and in each bucket the point forming the largest triangle
+    with the previously kept point and the average of the next bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the first and the last points
+    bucket_edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = bucket_edges[i], bucket_edges[i + 1]
+        next_end = bucket_edges[i + 2] if i + 2 < len(bucket_edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    return indices
+
+def downsample_series(df, x_col, y_col, group_col, max_points):
+    """
+    Downsample each series (group) of a long format frame to max_points points,
+    with LTTB for numeric values, one point out of n otherwise. The frame is expected to be sorted by x.
+    """
+    downsampled_dfs = []
+    for _, series_df in df.groupby(group_col, observed=True, sort=False):
+        if len(series_df) <= max_points:
+            downsampled_dfs.append(series_df)
+            continue
+        y = pd.to_numeric(series_df[y_col], errors="coerce").to_numpy(dtype="float64")
+        if np.isnan(y).any():
+            indices = np.unique(np.linspace(0, len(series_df) - 1, max_points).astype(int))
+        else:
+            x = pd.to_datetime(series_df[x_col]).to_numpy(dtype="datetime64[ns]").astype("int64").astype("float64")
+            indices = lttb_indices(x, y, max_points)
+        downsampled_dfs.append(series_df.iloc[indices])
+
+    if len(downsampled_dfs) == 0:
+        return df
+    return pd.concat(downsampled_dfs)
+
+def downsample_score_steps(df, max_points):
+    """
+    Downsample the score changes of a waterfall by time buckets : the initial run and the last run of each bucket are kept,
+    the deltas are recomputed between the kept runs (the cumulated score is unchanged).
+    """
+    if len(df) <= max_points:
+        return df
+    df = df.sort_values("timestamp")
+    changes_df = df.iloc[1:]
+    buckets = pd.cut(pd.to_datetime(changes_df["timestamp"]).astype("int64"), bins=max_points - 1, labels=False)
+    result_df = pd.concat([df.iloc[:1], changes_df.groupby(buckets.to_numpy()).tail(1)])
+    result_df["delta"] = np.concatenate([result_df["delta"].iloc[:1].to_numpy(dtype="float64"),
+                                         result_df["project_score"].diff().iloc[1:].round(2).to_numpy(dtype="float64")])
+    return result_df
+
+def filter_x_range(df, x_col, x_range):
+    """
+    Rows of the zoomed x range (all the rows if x_range is None)
+    """
+    if x_range is None:
+        return df
+    x = pd.to_datetime(df[x_col])
+    return df[(x >= pd.Timestamp(x_range[0])) & (x <= pd.Timestamp(x_range[1]))]
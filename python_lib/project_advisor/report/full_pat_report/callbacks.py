@@ -1,7 +1,7 @@
 # Callbacks
 import dash
 import logging
-from dash.dependencies import Input, Output, State, ALL
+from dash.dependencies import Input, Output, State, ALL, MATCH
 from dash import dcc, html
 from flask import request
 from dash import callback_context
@@ -9,10 +9,10 @@ from dash import callback_context
 
 from project_advisor.report.full_pat_report.config import configs
 from project_advisor.report.full_pat_report.style import styles
-from project_advisor.report.full_pat_report.tools import (enrich_project_list,
-                                                          user_is_admin,
-                                                          get_user_project_keys,
-                                                          
+from project_advisor.report.full_pat_report.tools import (user_is_admin,
+                                                          get_check_reco_row,
+                                                          get_evolution_df,
+                                                          query_table_page
                                                          )
                                                           
 
@@ -21,6 +21,13 @@ from project_advisor.report.full_pat_report.tabs import (generate_homepage_singl
                                                          generate_layout_instance_pat,
                                                          generate_project_details
                                                          )
+from project_advisor.report.full_pat_report.components import (create_check_reco_details,
+                                                               project_score_evolution_by_category,
+                                                               metric_evolution,
+                                                               format_table_page
+                                                              )
+from project_advisor.report.full_pat_report.layout_cache import LayoutCache
+from project_advisor.report.full_pat_report.identity_cache import identity_cache
 
 
 def get_authenticated_user_id():
@@ -37,22 +44,20 @@ def get_authenticated_user_id():
 
 
 
-def load_callbacks(app, data):
+def load_callbacks(app, data_refresher):
     """
     Init Callbacks
+    data_refresher : ReportDataRefresher holding the report data, each callback reads its current version once.
     """
     logging.info(f"Init Callbacks")
     
     # Init variables for callbacks
-    client = configs["client"]
-    check_df = data["check_df"]
-    metric_df = data["metric_df"]
-    user_to_project_df = data["user_to_project_df"]
-    is_instance_report = data["is_instance_report"]
+    # User profiles & admin groups loaded in bulk before the first page load
+    identity_cache.check_loaded()
     
-    # All CHECKED projects on the INSTANCE
-    list_project_ids = list(check_df["project_id"].unique())
-    all_project_list = enrich_project_list(list_project_ids)
+    # Generated tab layouts, shared by all users and dropped when the data is refreshed
+    layout_cache = LayoutCache(max_size=configs["layout_cache_size"])
+    data_refresher.on_refresh.append(lambda data: layout_cache.invalidate())
     
     # Callback to identify user
     @app.callback(
@@ -65,10 +70,10 @@ def load_callbacks(app, data):
         Load user using webapp
         """
         logging.info(f"Load user using webapp")
+        is_instance_report = data_refresher.data["is_instance_report"]
         
         user_id = get_authenticated_user_id()
-        users = client.list_users()
-        user_name = next((user['displayName'] for user in users if user['login'] == user_id), "Unknown")
+        user_name = identity_cache.get_display_name(user_id)
         logging.info(f"User with username : {user_name} has been identified")
         
         ### Define drop down options
@@ -112,12 +117,14 @@ def load_callbacks(app, data):
         logging.info(f"Update dynamic drop downs")
         
         user_login = get_authenticated_user_id()
+        data = data_refresher.data
+        all_project_list = data["all_project_list"]
         
         user_project_list = []
         if user_is_admin(user_login):
             user_project_list = all_project_list
         else:
-            user_project_keys = get_user_project_keys(user_login, user_to_project_df)
+            user_project_keys = data["project_access"].get_user_project_keys(user_login)
             user_project_list = [p for p in all_project_list if list(p.keys())[0] in user_project_keys]
         
         
@@ -156,6 +163,8 @@ def load_callbacks(app, data):
         logging.info(f"Update main content")
         
         ctx = callback_context
+        data = data_refresher.data
+        all_project_list = data["all_project_list"]
         
         # Define user project list.
         user_project_list = all_project_list
@@ -168,13 +177,15 @@ def load_callbacks(app, data):
                 return generate_homepage_single_pat(), dash.no_update
             else:
                 # If a project is selected, show the project layout
-                return generate_layout_single_pat(selected_project, 
-                                                  user_project_list, 
-                                                  data), \
+                return layout_cache.get_or_build(("project", selected_project, data["data_version"]),
+                                                 lambda: generate_layout_single_pat(selected_project, 
+                                                                                    user_project_list, 
+                                                                                    data)), \
                        generate_project_details(selected_project, user_project_list, styles)
 
         elif selected_tool == 'instance':
-            return generate_layout_instance_pat(all_project_list, data), None
+            return layout_cache.get_or_build(("instance", None, data["data_version"]),
+                                             lambda: generate_layout_instance_pat(all_project_list, data)), None
 
         elif selected_tool == 'batch':
             return dbc.Row([
@@ -182,6 +193,81 @@ def load_callbacks(app, data):
             ]), dash.no_update
 
         return None, dash.no_update
+
+    # Callback to load the details of the opened checks of the reco accordion
+    @app.callback(
+        Output({'type': 'check-reco-details', 'project': ALL, 'check': ALL}, 'children'),
+        Input('check-reco-accordion', 'active_item'),
+        State({'type': 'check-reco-details', 'project': ALL, 'check': ALL}, 'id'),
+        State({'type': 'check-reco-details', 'project': ALL, 'check': ALL}, 'children'),
+    )
+    def update_check_reco_details(active_items, details_ids, details_children):
+        """
+        Load the details of the opened checks (not loaded yet)
+        """
+        data = data_refresher.data
+        active_items = active_items if isinstance(active_items, list) else [active_items]
+        opened_checks = {item[len("check-"):] for item in active_items if item and item.startswith("check-")}
+        
+        details = []
+        for details_id, children in zip(details_ids, details_children):
+            if details_id['check'] not in opened_checks or children:
+                details.append(dash.no_update)
+                continue
+            logging.info(f"Load the details of check {details_id['check']}")
+            check_row = get_check_reco_row(data, details_id['project'], details_id['check'])
+            details.append(create_check_reco_details(check_row) if check_row is not None else html.P("Check not found in the latest run.", className="text-muted"))
+        return details
+
+
+    # Callbacks serving the pages of the instance tables
+    def load_paged_table_callback(table_id):
+        @app.callback(
+            Output(table_id, 'data'),
+            Output(table_id, 'page_count'),
+            Input(table_id, 'page_current'),
+            Input(table_id, 'page_size'),
+            Input(table_id, 'sort_by'),
+            Input(table_id, 'filter_query')
+        )
+        def update_paged_table(page_current, page_size, sort_by, filter_query):
+            """
+            Serve the requested page of the table
+            """
+            logging.info(f"Update paged table {table_id}, page : {page_current}")
+            table_df = data_refresher.data["instance_tables"].get(table_id)
+            if table_df is None:
+                return [], 1
+            page_df, page_count = query_table_page(table_df, page_current or 0, page_size, sort_by, filter_query)
+            return format_table_page(page_df), page_count
     
+    for table_id in ["instance-fail-to-pass-table", "instance-check-reco-table"]:
+        load_paged_table_callback(table_id)
+
 
-    
\ No newline at end of file
+    # Callback to reload the zoomed range of an evolution chart at full resolution
+    @app.callback(
+        Output({'type': 'evolution-graph', 'chart': MATCH, 'project': MATCH}, 'figure'),
+        Input({'type': 'evolution-graph', 'chart': MATCH, 'project': MATCH}, 'relayoutData'),
+        State({'type': 'evolution-graph', 'chart': MATCH, 'project': MATCH}, 'id'),
+        prevent_initial_call=True
+    )
+    def update_evolution_resolution(relayout_data, graph_id):
+        """
+        Rebuild the chart from the points of the zoomed range (downsampled range when zoomed out)
+        """
+        if not relayout_data:
+            return dash.no_update
+        if 'xaxis.range[0]' in relayout_data:
+            x_range = (relayout_data['xaxis.range[0]'], relayout_data['xaxis.range[1]'])
+        elif relayout_data.get('xaxis.autorange'):
+            x_range = None
+        else:
+            # Other relayout events (legend, hover mode, ...)
+            return dash.no_update
+        
+        logging.info(f"Update the resolution of chart {graph_id['chart']}, range : {x_range}")
+        df = get_evolution_df(data_refresher.data, graph_id['chart'], graph_id['project'])
+        if graph_id['chart'] == 'score-by-category':
+            return project_score_evolution_by_category(df, x_range=x_range)
+        return metric_evolution(df, x_range=x_range)
@@ -12,6 +12,7 @@ import random
 
 from project_advisor.report.full_pat_report.config import configs
 from project_advisor.report.full_pat_report.style import (styles, font_family, base_colors)
+from project_advisor.report.downsampling import (downsample_series, downsample_score_steps, filter_x_range)
 
 # Helper explanation content
 helper_content = dcc.Markdown('''
@@ -42,7 +43,8 @@ def project_score_evolution(df):
     """
     logging.info(f"Build Waterfall showing score evolution over time")
     # Consider only rows which are not null for the delta value
-    df_chart = df[df.delta != 0].copy()
+    # Long histories are reduced to chart_max_points bars (time buckets)
+    df_chart = downsample_score_steps(df[df.delta != 0], configs["chart_max_points"]).copy()
 
     # Create a new column with change labels (considering edge case where there is no change)
     if len(df_chart) == 1:
@@ -149,12 +151,16 @@ def project_score_by_category(df):
     return fig
 
 
-def project_score_evolution_by_category(df):
+def project_score_evolution_by_category(df, x_range=None):
     """
     Build project score by category
+    x_range : zoomed date range, the points of the range are downsampled to chart_max_points points per category
     """
     logging.info(f"Build project score by category")
     
+    df = filter_x_range(df, 'date', x_range)
+    df = downsample_series(df.sort_values('date'), 'date', 'project_score', 'category', configs["chart_max_points"])
+    
     fig = go.Figure()
 
     categories = df['category'].unique()
@@ -198,6 +204,10 @@ def project_score_evolution_by_category(df):
         hovertemplate='Date: %{x}<br>Score: %{y}', 
         selector=dict(type='scatter')  
     )
+    
+    # Keep the zoomed range
+    if x_range is not None:
+        fig.update_xaxes(range=list(x_range))
 
     return fig
 
@@ -232,13 +242,84 @@ def create_fail_to_pass_table(changed_to_pass):
     return table_fail_to_pass
 
 
+def create_paged_table(table_id, columns, page_size=20):
+    """
+    Create a table paged, sorted and filtered on the server, only the displayed page is sent to the browser
+    """
+    logging.info(f"Create paged table {table_id}")
+    
+    return dash_table.DataTable(
+        id=table_id,
+        columns=[{"name": i.replace("_", " ").title(), "id": i} for i in columns],
+        data=[],
+        page_current=0,
+        page_size=page_size,
+        page_action='custom',
+        sort_action='custom',
+        sort_mode='single',
+        sort_by=[],
+        filter_action='custom',
+        filter_query='',
+        style_cell={'textAlign': 'left', 'padding': '5px', 'font-family': font_family, 'whiteSpace': 'normal', 'height': 'auto'},
+        style_as_list_view=True,
+        style_header={
+            'backgroundColor': 'white',
+            'fontWeight': 'bold'
+        },
+        style_data_conditional=[
+            {
+                'if': {
+                    'filter_query': '{status_change} = "Fail to Pass"',
+                    'column_id': 'status_change'
+                },
+                'backgroundColor': 'green',
+                'color': 'white',
+            },
+            {
+                'if': {
+                    'filter_query': '{status} = "Fail"',
+                    'column_id': 'status'
+                },
+                'color': '#f35b05',
+                'fontWeight': 'bold',
+            }
+        ],
+    )
+
+
+def format_table_page(page_df):
+    """
+    Records of a table page, the result data of the page rows is parsed into their description
+    """
+    page_df = page_df.copy()
+    if 'result_data' in page_df.columns:
+        page_df['description'] = [metadata.get('description') for metadata in parse_result_data(page_df['result_data'].tolist())]
+        page_df = page_df.drop(columns=['result_data'])
+    page_df = page_df.astype(object)
+    return page_df.where(page_df.notna(), None).to_dict('records')
+
+
+def format_check_name(check_names):
+    """
+    Display names of the checks
+    """
+    return check_names.astype(str).str.replace("_check", "", regex=False).str.replace("_", " ", regex=False).str.capitalize()
+
+
 def create_check_reco_accordion(check_reco_df): 
     """
     Create check reco accordion
+    Only the headers are rendered (from the name & pass columns), the details of a check are loaded when it is opened.
     """
     logging.info(f"Create check reco accordion")
     
-    categories = check_reco_df.groupby('check_category')
+    check_style = {
+        'color': 'black',
+        'padding': '10px',
+        'border': '1px solid #ddd'
+    }
+    
+    categories = check_reco_df.groupby('check_category', observed=True)
     accordion_items = []
 
     for category_name, category_df in categories:
@@ -252,39 +333,21 @@ def create_check_reco_accordion(check_reco_df):
         ])
 
         # Create a list of individual checks within the category
-        checks = []
-
-        for _, row in category_df.iterrows():
-            check_passed = row['pass']
-            check_name = row['check_name']
-            check_message = row['message']
-            check_result = json.loads(row['result_data'])
-            
-            # Add warning icon if any check failed in the category
-            check_header = html.Span([
-                html.Span(["Check: ", check_name.replace("_check", "").replace("_", " ").capitalize()]),
-                html.I(className="bi bi-check-circle-fill text-success ms-2") if check_passed else html.I(className="bi bi-x-octagon-fill text-danger ms-2")
-            ])
-
-            check_style = {
-                'color': 'black',
-                'padding': '10px',
-                'border': '1px solid #ddd'
-            }
-           
-            # If the check failed, display it with the recommendation
-            check_content = html.Div([
-                html.P(f"Description: {check_result['description']}") if check_result['description'] else None,
-                html.P(f"Message: {check_message}" if check_message else None),
-                html.P(f"Additional details: {check_result['run_result']}") if not check_passed else None
-            ], style=check_style)
-
-            checks.append(dbc.AccordionItem(
-                check_content,
-                title=check_header,
-                item_id=f"check-{row['check_name']}",
+        # Checks that don't apply have no pass flag
+        check_passed = category_df['pass'].eq(True).fillna(False).tolist()
+        project_ids = category_df['project_id'].astype(object).where(category_df['project_id'].notna(), "").tolist()
+        checks = [
+            dbc.AccordionItem(
+                html.Div(id={'type': 'check-reco-details', 'project': project_id, 'check': check_name}, style=check_style),
+                title=html.Span([
+                    html.Span(["Check: ", display_name]),
+                    html.I(className="bi bi-check-circle-fill text-success ms-2") if passed else html.I(className="bi bi-x-octagon-fill text-danger ms-2")
+                ]),
+                item_id=f"check-{check_name}",
                 style=check_style,
-            ))
+            )
+            for check_name, display_name, passed, project_id in zip(category_df['check_name'].astype(str), format_check_name(category_df['check_name']), check_passed, project_ids)
+        ]
 
         # Add category as an accordion item
         accordion_items.append(dbc.AccordionItem(
@@ -294,12 +357,37 @@ def create_check_reco_accordion(check_reco_df):
         ))
     return dbc.Accordion(
         accordion_items,
+        id='check-reco-accordion',
         always_open=True,  # Keep accordion categories open to see checks easily
         flush=True,
         start_collapsed=True
     )
 
 
+def create_check_reco_details(check_row):
+    """
+    Details of a check of the reco accordion, the result data is parsed when the check is opened
+    """
+    check_passed = pd.notna(check_row['pass']) and check_row['pass']
+    check_message = check_row['message']
+    check_result = json.loads(check_row['result_data'])
+    
+    # If the check failed, display it with the recommendation
+    return [
+        html.P(f"Description: {check_result['description']}") if check_result['description'] else None,
+        html.P(f"Message: {check_message}" if check_message else None),
+        html.P(f"Additional details: {check_result['run_result']}") if not check_passed else None
+    ]
+
+
+def parse_result_data(result_data):
+    """
+    Parse the result data of the rows, each distinct payload is parsed once
+    """
+    parsed = {value : json.loads(value) for value in set(result_data)}
+    return [parsed[value] for value in result_data]
+
+
 def generate_metric_cards(df_metrics):
     """
     Building generic metric cards
@@ -308,45 +396,52 @@ def generate_metric_cards(df_metrics):
     
     cards_per_row = 6
     rows = []
-
-    # Split the dataframe into chunks of 5 rows
-    for i in range(0, len(df_metrics), cards_per_row):
-        row_cards = []
-
-        for _, metric in df_metrics.iloc[i:i + cards_per_row].iterrows():
-            metric_value = str(int(float(metric['metric_value']))) if metric['metric_type'] == 'INT' else metric['metric_value']
-            metric_metadata = json.loads(metric['result_data'])
-            metric_unit = metric_metadata.get("metric_unit")
-            
-            # Case where metric has a unit
-            if metric_unit:
-                metric_value = f"{metric_value} {metric_unit}"
-            
-            card = dbc.Card([
-                dbc.CardHeader(f"{metric['metric_name'].replace('_', ' ').replace('nbr', '#').replace('percentage', '%').capitalize()}", 
-                               style={"height": "70px", 'display': 'flex', "align-items": "center", 'justify-content': 'center', 'overflow': 'hidden', "font-size": "14px", 'white-space': 'wrap', 'text-overflow': 'ellipsis'}),
-                dbc.CardBody(
-                    [
-                        html.H3(f"{metric_value}", className="card-title") ,
-                        html.P(f"{metric_metadata['description'].replace('.','')}", className="card-text", style={"font-size": "12px"}),
-                    ]
-                )],
-                style={"height": "100%", "text-align": "center"},
-            )
-            row_cards.append(dbc.Col(card, width=12 // cards_per_row))  # 2 units width to fit 6 cards in a row
-
-        # Add the row to the list of rows
-        rows.append(dbc.Row(row_cards, justify="start", style={"margin-bottom": "20px"}))
+    
+    # Card values, names and metadata computed on the columns of the displayed metrics
+    metric_values = df_metrics['metric_value'].astype(str)
+    is_int = (df_metrics['metric_type'] == 'INT').to_numpy()
+    metric_values = [str(int(float(value))) if int_value else value for value, int_value in zip(metric_values, is_int)]
+    metric_names = df_metrics['metric_name'].astype(str).str.replace('_', ' ', regex=False).str.replace('nbr', '#', regex=False).str.replace('percentage', '%', regex=False).str.capitalize().tolist()
+    metric_metadatas = parse_result_data(df_metrics['result_data'].tolist())
+    
+    cards = []
+    for metric_value, metric_name, metric_metadata in zip(metric_values, metric_names, metric_metadatas):
+        metric_unit = metric_metadata.get("metric_unit")
+        
+        # Case where metric has a unit
+        if metric_unit:
+            metric_value = f"{metric_value} {metric_unit}"
+        
+        card = dbc.Card([
+            dbc.CardHeader(f"{metric_name}", 
+                           style={"height": "70px", 'display': 'flex', "align-items": "center", 'justify-content': 'center', 'overflow': 'hidden', "font-size": "14px", 'white-space': 'wrap', 'text-overflow': 'ellipsis'}),
+            dbc.CardBody(
+                [
+                    html.H3(f"{metric_value}", className="card-title") ,
+                    html.P(f"{metric_metadata['description'].replace('.','')}", className="card-text", style={"font-size": "12px"}),
+                ]
+            )],
+            style={"height": "100%", "text-align": "center"},
+        )
+        cards.append(dbc.Col(card, width=12 // cards_per_row))  # 2 units width to fit 6 cards in a row
+
+    # Split the cards into rows of 6 cards
+    for i in range(0, len(cards), cards_per_row):
+        rows.append(dbc.Row(cards[i:i + cards_per_row], justify="start", style={"margin-bottom": "20px"}))
 
     return rows
 
 
-def metric_evolution(df):
+def metric_evolution(df, x_range=None):
     """
     Building metric evolution
+    x_range : zoomed date range, the points of the range are downsampled to chart_max_points points per metric
     """
     logging.info(f"Building metric evolution")
     
+    df = filter_x_range(df, 'timestamp', x_range)
+    df = downsample_series(df.sort_values('timestamp'), 'timestamp', 'metric_value', 'metric_name', configs["chart_max_points"])
+    
     fig = go.Figure()
 
     metric_name = df['metric_name'].unique()
@@ -391,6 +486,10 @@ def metric_evolution(df):
         hovertemplate='Date: %{x}<br>Metric value: %{y}', 
         selector=dict(type='scatter')  
     )
+    
+    # Keep the zoomed range
+    if x_range is not None:
+        fig.update_xaxes(range=list(x_range))
 
     return fig
             
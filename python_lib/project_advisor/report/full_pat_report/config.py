@@ -11,6 +11,15 @@ configs = {
     
     # List categories
     "project_categories" : ["AUTOMATION", "CODE", "DEPLOYMENT", "DOCUMENTATION", "FLOW", "PERFORMANCE", "ROBUSTNESS", "API_SERVICE"],
-    "instance_categories" : ["PLATFORM", "USAGE", "PROCESSES", "CONFIGURATION"]
+    "instance_categories" : ["PLATFORM", "USAGE", "PROCESSES", "CONFIGURATION"],
+    
+    # Max number of generated tab layouts kept in memory
+    "layout_cache_size" : 64,
+    
+    # Seconds before the cached user profiles and admin groups are reloaded
+    "identity_cache_ttl" : 600,
+    
+    # Max number of points per series (and of bars) of the evolution charts, the zoomed ranges are reloaded at full resolution
+    "chart_max_points" : 500
     
 }
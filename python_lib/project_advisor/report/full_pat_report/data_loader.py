@@ -1,41 +1,55 @@
 # Data Loader
 import dataiku
-from datetime import datetime
+import pandas as pd
 import logging
 
 from project_advisor.report.full_pat_report.config import configs
-from project_advisor.report.full_pat_report.tools import (build_user_to_project_mapping,
-                                                          compute_project_scores_for_all_timestamps,
-                                                          compute_project_scores_for_all_timestamps,
-                                                          compute_project_scores_by_category,
-                                                          compute_project_scores_by_category)
+from project_advisor.report.columnar_report import (METRIC_REPORT, CHECK_REPORT, TIMESTAMP_FORMAT, load_report_frame, format_report_frame)
+from project_advisor.report.report_partitions import (load_report_dataset, filter_time_window, get_run_date_partition)
+from project_advisor.report.latest_run import has_new_runs
+from project_advisor.report.full_pat_report.project_access import ProjectAccessIndex
+from project_advisor.report.full_pat_report.tools import (build_project_index,
+                                                          enrich_project_list,
+                                                          compute_instance_tables)
+from project_advisor.report.scores import (compute_project_scores_for_all_timestamps,
+                                           compute_project_scores_by_category,
+                                           set_score_evolution_deltas)
 
 
-def load_pat_report_data(input_config):
+def load_score_report(score_dataset_name, check_df, history_days = None, since = None):
     """
-    Load data from the flow and run pre-computations.
+    Load the scores materialized by the advisors for the runs of the loaded check report.
+    """
+    logging.info("Loading the materialized scores")
+    try:
+        score_df = load_report_dataset(dataiku.Dataset(score_dataset_name), history_days = history_days, since = since)
+    except Exception as error:
+        logging.warning(f"Failed to load the score dataset, scores are computed from the checks : {error}")
+        return None
+    score_df["timestamp"] = pd.to_datetime(score_df["timestamp"], format = TIMESTAMP_FORMAT)
+    return score_df[score_df["timestamp"].isin(check_df["timestamp"].unique())]
+
+
+def load_report_frames(input_config, history_days = None, since = None):
+    """
+    Load the formatted metric & check reports (required columns) from the typed columnar reports or from the Flow.
+    Only the run date partitions of the time window (and from the since run date) are read.
     """
-    logging.info("Loading Metrics & Checks Datasets and precomputing score")
-    
-    # INIT
-    data = {}
-    
-    metric_dataset_name = input_config['metric_dataset']
-    check_dataset_name = input_config['check_dataset']
-    
-    #client = configs["client"]
-    project_categories = configs["project_categories"]
-    instance_categories = configs["instance_categories"]
     metric_required_columns = configs["metric_required_columns"]
     check_required_columns = configs["check_required_columns"]
     
-    
-    # Load data from Flow
-    metric_report = dataiku.Dataset(metric_dataset_name)
-    metric_df = metric_report.get_dataframe()
-    
-    check_report = dataiku.Dataset(check_dataset_name)
-    check_df = check_report.get_dataframe()
+    # Load data from the typed columnar reports (only the required columns) or from the Flow
+    report_folder_id = input_config.get('report_folder')
+    if report_folder_id:
+        report_folder = dataiku.Folder(report_folder_id)
+        metric_df = load_report_frame(report_folder, METRIC_REPORT, columns = metric_required_columns, history_days = history_days, since = since)
+        check_df = load_report_frame(report_folder, CHECK_REPORT, columns = check_required_columns, history_days = history_days, since = since)
+    else:
+        metric_report = dataiku.Dataset(input_config['metric_dataset'])
+        metric_df = load_report_dataset(metric_report, history_days = history_days, since = since)
+        
+        check_report = dataiku.Dataset(input_config['check_dataset'])
+        check_df = load_report_dataset(check_report, history_days = history_days, since = since)
     
     # Check Report columns
     if not all(req_col in list(metric_df.columns) for req_col in metric_required_columns):
@@ -46,44 +60,181 @@ def load_pat_report_data(input_config):
     
     logging.info(f"Input Metric & Check Report datasets have the required schemas")
     
-    is_instance_report = False
-    if any(check_df["project_id"].isna()):
-        is_instance_report = True
-    
-    logging.info(f"Webapp is running on instance report datasets : {is_instance_report}")
-    
     # Format and compute dataset
     logging.info("Formatting metric and check datasets")
-    check_df["timestamp"] = check_df["timestamp"].transform(lambda x : datetime.strptime(x, '%m/%d/%Y, %H:%M:%S'))
-    metric_df["timestamp"] = metric_df["timestamp"].transform(lambda x : datetime.strptime(x, '%m/%d/%Y, %H:%M:%S'))
+    if not report_folder_id: # Columnar reports are formatted when loaded
+        check_df = format_report_frame(check_df, CHECK_REPORT)
+        metric_df = format_report_frame(metric_df, METRIC_REPORT)
+    return metric_df, check_df
+
+
+def precompute_scores(input_config, check_df, is_instance_report, history_days = None, since = None):
+    """
+    Precompute the project & instance score frames used by the charts.
+    """
+    project_categories = configs["project_categories"]
+    instance_categories = configs["instance_categories"]
     
-    # Precompute mapping tables
-    logging.info("Precomputing user to project mapping")
-    user_to_project_df = build_user_to_project_mapping()
+    # Materialized scores, the scores of the legacy runs are computed from the checks
+    score_df = None
+    if input_config.get('score_dataset'):
+        score_df = load_score_report(input_config['score_dataset'], check_df, history_days = history_days, since = since)
     
     # Precompute dataframes to build the charts
     logging.info("Precomputing scores for project and instance checks")
     
     # Project Level pre-calculations.
-    precomputed_result_project_df = compute_project_scores_for_all_timestamps(check_df, category=project_categories, group_by_project=True)
-    precomputed_project_by_category_df = compute_project_scores_by_category(check_df, category=project_categories, group_by_project=True)
+    precomputed_scores = {
+        "precomputed_result_project_df" : compute_project_scores_for_all_timestamps(check_df, category=project_categories, group_by_project=True, score_df=score_df),
+        "precomputed_project_by_category_df" : compute_project_scores_by_category(check_df, category=project_categories, group_by_project=True, score_df=score_df),
+        "precomputed_result_instance_df" : None,
+        "precomputed_instance_by_category_df" : None
+    }
     
     # Instance Level pre-calcualations.
-    precomputed_result_instance_df = None 
-    precomputed_instance_by_category_df = None
     if is_instance_report:
-        precomputed_result_instance_df = compute_project_scores_for_all_timestamps(check_df, category=instance_categories, group_by_project=False)
-        precomputed_instance_by_category_df = compute_project_scores_by_category(check_df, category=instance_categories, group_by_project=False)
+        precomputed_scores["precomputed_result_instance_df"] = compute_project_scores_for_all_timestamps(check_df, category=instance_categories, group_by_project=False, score_df=score_df)
+        precomputed_scores["precomputed_instance_by_category_df"] = compute_project_scores_by_category(check_df, category=instance_categories, group_by_project=False, score_df=score_df)
+    return precomputed_scores
+
+
+def build_report_data(check_df, metric_df, is_instance_report, project_access, precomputed_scores, all_project_list = None):
+    """
+    Assemble the data used by the callbacks : report frames, precomputed scores, per project indexes and project list.
+    """
+    instance_categories = configs["instance_categories"]
+    
+    # Per project indexes of the frames read by the project tab & instance only frames read by the instance tab
+    logging.info("Indexing the report rows by project")
+    project_indexes = {
+        "check_df" : build_project_index(check_df),
+        "metric_df" : build_project_index(metric_df),
+        "precomputed_result_project_df" : build_project_index(precomputed_scores["precomputed_result_project_df"]),
+        "precomputed_project_by_category_df" : build_project_index(precomputed_scores["precomputed_project_by_category_df"]),
+    }
+    instance_check_df = check_df[check_df["check_category"].isin(instance_categories)].copy()
+    instance_metric_df = metric_df[metric_df["project_id"].isna()].copy()
+    
+    # Tables of the instance tab, served page by page
+    instance_tables = compute_instance_tables(instance_check_df) if is_instance_report else {}
+    
+    # All CHECKED projects on the INSTANCE
+    if all_project_list is None:
+        all_project_list = enrich_project_list(list(check_df["project_id"].dropna().unique()))
+    
+    # Version of the loaded report data, part of the key of the cached layouts
+    data_version = f"{check_df['timestamp'].max()}|{len(check_df)}|{len(metric_df)}"
     
     data = {
+        "data_version" : data_version,
         "is_instance_report" : is_instance_report,
-        "user_to_project_df" : user_to_project_df,
+        "project_access" : project_access,
+        "all_project_list" : all_project_list,
         "check_df" : check_df,
         "metric_df" : metric_df,
-        "precomputed_result_project_df" : precomputed_result_project_df,
-        "precomputed_result_instance_df" : precomputed_result_instance_df,
-        "precomputed_project_by_category_df" : precomputed_project_by_category_df, 
-        "precomputed_instance_by_category_df" : precomputed_instance_by_category_df
+        "project_indexes" : project_indexes,
+        "instance_check_df" : instance_check_df,
+        "instance_metric_df" : instance_metric_df,
+        "instance_tables" : instance_tables
     }
+    data.update(precomputed_scores)
+    return data
+
+
+def load_pat_report_data(input_config):
+    """
+    Load data from the flow and run pre-computations.
+    """
+    logging.info("Loading Metrics & Checks Datasets and precomputing score")
+    
+    # Time window : latest run date plus history_days days of history (0 or empty for the full history)
+    history_days = input_config.get('history_days') or None
+    
+    metric_df, check_df = load_report_frames(input_config, history_days = history_days)
+    check_df = filter_time_window(check_df, history_days)
+    metric_df = filter_time_window(metric_df, history_days)
+    
+    is_instance_report = False
+    if any(check_df["project_id"].isna()):
+        is_instance_report = True
+    
+    logging.info(f"Webapp is running on instance report datasets : {is_instance_report}")
+    
+    # Project access index, the projects of each user are resolved on login
+    project_access = ProjectAccessIndex.build()
+    
+    precomputed_scores = precompute_scores(input_config, check_df, is_instance_report, history_days = history_days)
+    
+    data = build_report_data(check_df, metric_df, is_instance_report, project_access, precomputed_scores)
     logging.info("All data is loaded and precomputed!")
-    return data
\ No newline at end of file
+    return data
+
+
+def probe_new_runs(input_config, latest_timestamp):
+    """
+    Probe the check report for runs newer than latest_timestamp without loading its rows (None if it can't be probed).
+    The loader only lists the files of the new run dates in the report folder.
+    """
+    if input_config.get('report_folder'):
+        return True
+    return has_new_runs(dataiku.Dataset(input_config['check_dataset']), latest_timestamp)
+
+
+def refresh_pat_report_data(input_config, data):
+    """
+    Incremental refresh : load only the rows of the runs newer than the loaded data, compute their scores,
+    append them to the loaded frames and drop the rows out of the time window.
+    Return the new data, None if there is no new run.
+    """
+    history_days = input_config.get('history_days') or None
+    latest_timestamp = data["check_df"]["timestamp"].max()
+    if pd.isna(latest_timestamp):
+        return load_pat_report_data(input_config)
+    
+    logging.info(f"Checking for runs newer than {latest_timestamp}")
+    new_runs = probe_new_runs(input_config, latest_timestamp)
+    if new_runs is None:
+        logging.info("Incremental refresh skipped : the check dataset is neither partitioned by run date nor on SQL, "
+                     "its new runs can't be found without reading its full history")
+        return None
+    if not new_runs:
+        return None
+    
+    # Only the run date partitions from the latest loaded run date are read
+    new_metric_df, new_check_df = load_report_frames(input_config, since = get_run_date_partition(latest_timestamp))
+    new_check_df = new_check_df[new_check_df["timestamp"] > latest_timestamp]
+    new_metric_df = new_metric_df[new_metric_df["timestamp"] > latest_timestamp]
+    if len(new_check_df) == 0 and len(new_metric_df) == 0:
+        return None
+    logging.info(f"Loading {new_check_df['timestamp'].nunique()} new runs")
+    
+    # A report switching to an instance report needs the instance scores of the whole history
+    is_instance_report = data["is_instance_report"] or any(new_check_df["project_id"].isna())
+    if is_instance_report != data["is_instance_report"]:
+        return load_pat_report_data(input_config)
+    
+    # The categories differ between the loaded & new frames, they are rebuilt on the concatenated frames
+    check_df = format_report_frame(pd.concat([data["check_df"], new_check_df], ignore_index = True), CHECK_REPORT)
+    metric_df = format_report_frame(pd.concat([data["metric_df"], new_metric_df], ignore_index = True), METRIC_REPORT)
+    check_df = filter_time_window(check_df, history_days).reset_index(drop = True)
+    metric_df = filter_time_window(metric_df, history_days).reset_index(drop = True)
+    
+    # Scores are computed per run : only the new runs are computed, the deltas are recomputed on the appended scores
+    new_scores = precompute_scores(input_config, new_check_df, is_instance_report, since = get_run_date_partition(latest_timestamp))
+    precomputed_scores = {}
+    for name, new_score_df in new_scores.items():
+        if new_score_df is None:
+            precomputed_scores[name] = None
+            continue
+        score_df = pd.concat([data[name], new_score_df], ignore_index = True)
+        score_df = filter_time_window(score_df, history_days).reset_index(drop = True)
+        if "delta" in score_df.columns:
+            score_df = set_score_evolution_deltas(score_df, group_by_project = "project_id" in score_df.columns)
+        precomputed_scores[name] = score_df
+    
+    # Projects are enriched again only when new projects were checked
+    all_project_list = data["all_project_list"]
+    if not set(new_check_df["project_id"].dropna().unique()).issubset({list(p.keys())[0] for p in all_project_list}):
+        all_project_list = None
+    
+    return build_report_data(check_df, metric_df, is_instance_report, data["project_access"], precomputed_scores, all_project_list)
@@ -0,0 +1,99 @@
+# Identity Cache
+import logging
+import threading
+import time
+
+from project_advisor.report.full_pat_report.config import configs
+
+
+class IdentityCache():
+    """
+    TTL cache of the user profiles (display name & groups) and of the admin groups, loaded in bulk.
+    Once expired, the cached identities are still served while they are reloaded in a background thread.
+    """
+
+    def __init__(self, ttl=600):
+        self.ttl = ttl
+        self.users = None
+        self.admin_groups = None
+        self.load_time = None
+        self.lock = threading.Lock()
+        self.is_refreshing = False
+
+    def load(self):
+        """
+        Load all the user profiles & the admin flags of the groups.
+        """
+        logging.info("Loading the user profiles and admin groups")
+        client = configs["client"]
+        users = {user["login"] : {"display_name" : user.get("displayName"),
+                                  "groups" : user.get("groups", [])}
+                 for user in client.list_users()}
+
+        admin_groups = set()
+        for group in client.list_groups():
+            # The group listing carries the admin flag, the definition is only read if it doesn't
+            is_admin = group["admin"] if "admin" in group else client.get_group(group["name"]).get_definition().get("admin", False)
+            if is_admin:
+                admin_groups.add(group["name"])
+
+        with self.lock:
+            self.users = users
+            self.admin_groups = admin_groups
+            self.load_time = time.monotonic()
+        logging.info(f"Loaded {len(users)} user profiles, {len(admin_groups)} admin groups")
+
+    def refresh(self):
+        try:
+            self.load()
+        except Exception as error:
+            logging.exception(f"Failed to refresh the user profiles, keeping the loaded ones : {error}")
+        finally:
+            self.is_refreshing = False
+
+    def check_loaded(self):
+        """
+        Load the identities on first use, reload them in the background once expired.
+        """
+        if self.load_time is None:
+            self.load()
+            return
+
+        with self.lock:
+            if self.is_refreshing or time.monotonic() - self.load_time < self.ttl:
+                return
+            self.is_refreshing = True
+        threading.Thread(target=self.refresh, name="identity-cache-refresh", daemon=True).start()
+
+    def get_user(self, user_login):
+        """
+        Profile of a user, read from the instance if the user was created after the last load.
+        Unknown or deleted users get an empty profile (displayed as "Unknown", no groups) until the next load.
+        """
+        self.check_loaded()
+        user = self.users.get(user_login)
+        if user is None:
+            try:
+                definition = configs["client"].get_user(user_login).get_definition()
+            except Exception as error:
+                logging.warning(f"Failed to read the profile of user {user_login} : {error}")
+                definition = {}
+            user = {"display_name" : definition.get("displayName"),
+                    "groups" : definition.get("groups", [])}
+            with self.lock:
+                self.users[user_login] = user
+        return user
+
+    def get_display_name(self, user_login):
+        return self.get_user(user_login)["display_name"] or "Unknown"
+
+    def get_user_groups(self, user_login):
+        return self.get_user(user_login)["groups"]
+
+    def is_admin(self, user_login):
+        groups = self.get_user_groups(user_login)
+        return any(group in self.admin_groups for group in groups)
+
+
+# Identities shared by the callbacks
+identity_cache = IdentityCache(ttl=configs["identity_cache_ttl"])
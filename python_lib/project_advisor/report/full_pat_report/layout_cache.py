@@ -0,0 +1,44 @@
+# Layout Cache
+import logging
+import threading
+from collections import OrderedDict
+
+
+class LayoutCache():
+    """
+    Bounded LRU cache of the generated tab layouts (with their figures), keyed by (tool, project, data version).
+    Entries of a previous data version are dropped when the data is refreshed.
+    """
+
+    def __init__(self, max_size=32):
+        self.max_size = max_size
+        self.layouts = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        """
+        Return the cached layout for the key, build & cache it on a miss.
+        """
+        with self.lock:
+            if key in self.layouts:
+                self.layouts.move_to_end(key)
+                logging.info(f"Layout cache hit : {key}")
+                return self.layouts[key]
+
+        # Built outside of the lock, the layouts of other keys can be served meanwhile
+        layout = build()
+
+        with self.lock:
+            self.layouts[key] = layout
+            self.layouts.move_to_end(key)
+            while len(self.layouts) > self.max_size:
+                self.layouts.popitem(last=False)
+        return layout
+
+    def invalidate(self):
+        """
+        Drop all the cached layouts (on data refresh).
+        """
+        with self.lock:
+            self.layouts.clear()
+        logging.info("Layout cache invalidated")
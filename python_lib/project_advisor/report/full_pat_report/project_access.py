@@ -0,0 +1,61 @@
+# Project Access
+import logging
+import threading
+
+from project_advisor.report.full_pat_report.config import configs
+from project_advisor.report.full_pat_report.identity_cache import identity_cache
+from project_advisor.assessments.providers.instance_inventory import InstanceInventory
+
+
+class ProjectAccessIndex():
+    """
+    Inverted index of the project accesses (write or admin permission, or ownership) :
+    group -> projects, user -> directly shared projects, owner -> projects.
+    The project set of a user is computed on first access (login) and cached, the user groups are read from the cached identities.
+    """
+
+    def __init__(self, group_projects, user_projects, owner_projects):
+        self.group_projects = group_projects
+        self.user_projects = user_projects
+        self.owner_projects = owner_projects
+        self.user_project_keys = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def build(cls, inventory=None):
+        """
+        Build the index from the projects & permissions tables of the inventory
+        (the permissions are fetched concurrently in one sweep if not provided).
+        """
+        logging.info("Building the project access index")
+        client = configs["client"]
+        if inventory is None:
+            inventory = InstanceInventory.build(client, tables = ["permissions"])
+        projects_df = inventory.get_table("projects")
+        permissions_df = inventory.get_table("permissions")
+
+        # Only permissions with at least write access on the project content
+        write_permissions_df = permissions_df[permissions_df["admin"].fillna(False).astype(bool)
+                                              | permissions_df["write_project_content"].fillna(False).astype(bool)]
+        group_projects = write_permissions_df.dropna(subset=["group"]).groupby("group")["project_key"].agg(set).to_dict()
+        user_projects = write_permissions_df.dropna(subset=["user"]).groupby("user")["project_key"].agg(set).to_dict()
+        owner_projects = projects_df.dropna(subset=["owner_login"]).groupby("owner_login")["project_key"].agg(set).to_dict()
+
+        logging.info(f"Project access index built : {len(group_projects)} groups, {len(user_projects)} users with direct shares, {len(owner_projects)} owners")
+        return cls(group_projects, user_projects, owner_projects)
+
+    def get_user_project_keys(self, user_login):
+        """
+        Keys of the projects the user owns or can write to, directly or through one of their groups.
+        """
+        with self.lock:
+            if user_login in self.user_project_keys:
+                return self.user_project_keys[user_login]
+
+        project_keys = set(self.owner_projects.get(user_login, set())) | self.user_projects.get(user_login, set())
+        for group in identity_cache.get_user_groups(user_login):
+            project_keys |= self.group_projects.get(group, set())
+
+        with self.lock:
+            self.user_project_keys[user_login] = project_keys
+        return project_keys
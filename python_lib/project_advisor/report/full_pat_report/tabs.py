@@ -11,6 +11,7 @@ from project_advisor.report.full_pat_report.components import (project_score_evo
                                                                project_score_evolution_by_category,
                                                                create_fail_to_pass_table,
                                                                create_check_reco_accordion,
+                                                               create_paged_table,
                                                                generate_metric_cards,
                                                                metric_evolution,
                                                                helper_content
@@ -18,7 +19,8 @@ from project_advisor.report.full_pat_report.components import (project_score_evo
 
 from project_advisor.report.full_pat_report.tools import (compute_fail_to_pass_df,
                                                           compute_check_reco_table_df,
-                                                          compute_metric_df
+                                                          compute_metric_df,
+                                                          get_project_rows
                                                          )
 
 def generate_homepage_single_pat():
@@ -77,13 +79,9 @@ def generate_layout_single_pat(project_key, project_list, data):
     logging.info("Generate the layout for the single PAT Tab")
     
     project_categories = configs["project_categories"]
-    check_df = data["check_df"]
-    metric_df = data["metric_df"]
-    precomputed_result_project_df = data["precomputed_result_project_df"] 
-    precomputed_project_by_category_df = data["precomputed_project_by_category_df"]
     
-    # Compute project scores for all timestamps
-    project_scores_df = precomputed_result_project_df[precomputed_result_project_df["project_id"] == project_key]
+    # Compute project scores for all timestamps (project rows read through the per project indexes)
+    project_scores_df = get_project_rows(data, "precomputed_result_project_df", project_key)
     most_recent_timestamp = project_scores_df['timestamp'].max()
     project_score_value = int(project_scores_df[project_scores_df['timestamp'] == most_recent_timestamp]['project_score'].iloc[0])
     most_recent_timestamp_str = most_recent_timestamp.strftime('%Y-%m-%d %H:%M:%S')
@@ -93,7 +91,7 @@ def generate_layout_single_pat(project_key, project_list, data):
     fig_project_score_evol = project_score_evolution(project_scores_df)
     
     # Compute project scores by category
-    project_by_category_df = precomputed_project_by_category_df[precomputed_project_by_category_df["project_id"] == project_key]
+    project_by_category_df = get_project_rows(data, "precomputed_project_by_category_df", project_key)
     most_recent_date = project_by_category_df['date'].max()
     most_recent_project_scores_category_df = project_by_category_df[project_by_category_df['date'] == most_recent_date]
 
@@ -102,7 +100,7 @@ def generate_layout_single_pat(project_key, project_list, data):
     fig_scores_by_category_evol = project_score_evolution_by_category(project_by_category_df)
 
     # Failed to pass dataframe and table
-    project_df = check_df[check_df["project_id"] == project_key]
+    project_df = get_project_rows(data, "check_df", project_key)
     fail_to_pass_df = compute_fail_to_pass_df(project_df, category=project_categories)
     table_fail_to_pass = create_fail_to_pass_table(fail_to_pass_df) if not fail_to_pass_df.empty else html.P("No changes in check status during the last run.", className="text-muted")
 
@@ -111,7 +109,7 @@ def generate_layout_single_pat(project_key, project_list, data):
     table_check_reco = create_check_reco_accordion(check_reco_df)
 
     # Metric cards and evolution chart
-    df_metric_project = metric_df[metric_df['project_id'] == project_key].copy()
+    df_metric_project = get_project_rows(data, "metric_df", project_key).copy()
     project_metric_df = compute_metric_df(df_metric_project, instance=False)
     most_recent_timestamp = project_metric_df['timestamp'].max()
     project_metric_last_df = project_metric_df[project_metric_df['timestamp'] == most_recent_timestamp]
@@ -203,7 +201,7 @@ def generate_layout_single_pat(project_key, project_list, data):
                     dbc.Card([
                         dbc.CardHeader("Evolution of project scores by category", style={"font-size": 20}),
                         dbc.CardBody([
-                            dcc.Graph(figure=fig_scores_by_category_evol)
+                            dcc.Graph(id={'type': 'evolution-graph', 'chart': 'score-by-category', 'project': project_key}, figure=fig_scores_by_category_evol)
                         ]),
                     ], className="mb-4"),
                 ], md=8),
@@ -243,7 +241,7 @@ def generate_layout_single_pat(project_key, project_list, data):
                     dbc.Card([
                         dbc.CardHeader("Metrics evolution over time", style={"font-size": 20}),
                         dbc.CardBody([
-                            dcc.Graph(figure=fig_metric_evolution), 
+                            dcc.Graph(id={'type': 'evolution-graph', 'chart': 'metric', 'project': project_key}, figure=fig_metric_evolution), 
                         ]),
                     ], className="mb-4"),
                 ], md=8),
@@ -262,9 +260,8 @@ def generate_layout_instance_pat(project_list, data):
     """
     logging.info("Generate Layout for the instance PAT TAB")
     
-    instance_categories = configs["instance_categories"]
-    check_df = data["check_df"]
-    metric_df = data["metric_df"]
+    instance_check_df = data["instance_check_df"] # Only the instance checks
+    instance_metric_df = data["instance_metric_df"] # Only the instance metrics
     precomputed_result_project_df = data["precomputed_result_project_df"]
     precomputed_result_instance_df = data["precomputed_result_instance_df"]
     precomputed_instance_by_category_df = data["precomputed_instance_by_category_df"]
@@ -303,15 +300,15 @@ def generate_layout_instance_pat(project_list, data):
     fig_scores_by_category_evol = project_score_evolution_by_category(precomputed_instance_by_category_df)
 
     # Failed to pass dataframe and table
-    fail_to_pass_df = compute_fail_to_pass_df(check_df, category=instance_categories)
-    table_fail_to_pass = create_fail_to_pass_table(fail_to_pass_df) if not fail_to_pass_df.empty else html.P("No changes in check status during the last run.", className="text-muted")
+    # Tables paged on the server (see the paged table callbacks)
+    fail_to_pass_df = data["instance_tables"]["instance-fail-to-pass-table"]
+    table_fail_to_pass = create_paged_table("instance-fail-to-pass-table", fail_to_pass_df.columns) if not fail_to_pass_df.empty else html.P("No changes in check status during the last run.", className="text-muted")
 
     # Check recommendations table
-    check_reco_df = compute_check_reco_table_df(check_df, category=instance_categories)
-    table_check_reco = create_check_reco_accordion(check_reco_df)
+    table_check_reco = create_paged_table("instance-check-reco-table", ["check_category", "check_name", "status", "message", "description"])
 
     # Metric cards and evolution chart
-    project_metric_df = compute_metric_df(metric_df, instance=True)
+    project_metric_df = compute_metric_df(instance_metric_df, instance=True)
     most_recent_timestamp = project_metric_df['timestamp'].max()
     project_metric_last_df = project_metric_df[project_metric_df['timestamp'] == most_recent_timestamp]
     cards_metric_project = generate_metric_cards(project_metric_last_df)
@@ -394,7 +391,7 @@ def generate_layout_instance_pat(project_list, data):
                     dbc.Card([
                         dbc.CardHeader("Evolution of project scores by category", style={"font-size": 20}),
                         dbc.CardBody([
-                            dcc.Graph(figure=fig_scores_by_category_evol)
+                            dcc.Graph(id={'type': 'evolution-graph', 'chart': 'score-by-category', 'project': ''}, figure=fig_scores_by_category_evol)
                         ]),
                     ], className="mb-4"),
                 ], md=8),
@@ -434,7 +431,7 @@ def generate_layout_instance_pat(project_list, data):
                     dbc.Card([
                         dbc.CardHeader("Metrics evolution over time", style={"font-size": 20}),
                         dbc.CardBody([
-                            dcc.Graph(figure=fig_metric_evolution), 
+                            dcc.Graph(id={'type': 'evolution-graph', 'chart': 'metric', 'project': ''}, figure=fig_metric_evolution), 
                         ]),
                     ], className="mb-4"),
                 ], md=8),
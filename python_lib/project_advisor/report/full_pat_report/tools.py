@@ -4,6 +4,9 @@ import pandas as pd
 
 from project_advisor.report.full_pat_report.config import configs
 from project_advisor.report.full_pat_report.style import styles
+from project_advisor.report.full_pat_report.identity_cache import identity_cache
+from project_advisor.report.scores import (compute_project_scores_for_all_timestamps,
+                                           compute_project_scores_by_category)
 
 #########################
 ## User Auth functions ##
@@ -11,80 +14,10 @@ from project_advisor.report.full_pat_report.style import styles
 
 def user_is_admin(user_login):
     """
-    Return user admin status
+    Return user admin status (member of an admin group), read from the cached identities
     """
     logging.info("Checking if user is admin")
-    client = configs["client"]
-    
-    groups = client.list_groups()
-    user = client.get_user(user_login)
-    settings = user.get_settings()
-    groups = settings.get_raw().get("groups",[])
-    
-    is_admin = False
-    for group_name in groups:
-        group = client.get_group(group_name)
-        if group.get_definition().get("admin", False):
-            is_admin = True
-    return is_admin 
-
-def build_user_to_project_mapping():
-    """
-    Building access to user to project mapping
-    """
-    logging.info("Building access to user to project mapping")
-    client = configs["client"]
-    users = client.list_users()
-    groups = client.list_groups()
-    projects = client.list_projects()
-
-    # Enrich projects (precomputation)
-    for p in projects:
-        project_key = p["projectKey"]
-        project = client.get_project(project_key)
-        p.update({"permissions": project.get_permissions()["permissions"]})
-
-    user_to_project_mapping = []
-    for user in users:
-        user_login = user["login"]
-        user_groups = user["groups"]
-
-        for p in projects:
-            project_key = p["projectKey"]
-            project_owner = p["ownerLogin"]
-
-            is_project_owner = False
-            is_shared_by_user = False
-            is_shared_by_group = False
-            
-            if user_login == project_owner:
-                is_project_owner = True
-            
-            else:
-                for permission in p["permissions"]:
-                    # If has at least write permissions on project.
-                    if any([permission['admin'],
-                           permission['writeProjectContent']]):
-
-                        if permission.get("user") == user_login:
-                            is_shared_by_user = True
-
-                        if permission.get("group") in user_groups:
-                            is_shared_by_group = True
-
-            if any([is_project_owner,is_shared_by_user, is_shared_by_group]):
-                user_to_project_mapping.append({
-                    "user_login" : user_login,
-                    "project_key" : project_key,
-                    "is_project_owner" : is_project_owner,
-                    "is_shared_by_user" : is_shared_by_user,
-                    "is_shared_by_group" : is_shared_by_group
-                })
-    return pd.DataFrame.from_dict(user_to_project_mapping)
-
-def get_user_project_keys(user_login, mapping_df):
-    return list(mapping_df[mapping_df["user_login"]==user_login]["project_key"])
-
+    return identity_cache.is_admin(user_login)
 
 ###############################
 ## Dynamic Display Functions ##
@@ -111,129 +44,18 @@ def enrich_project_list(project_list):
 ###############################
 ## Precomputations functions ##
 ###############################
-def compute_project_scores_for_all_timestamps(df, category=None, group_by_project=True):
+def build_project_index(df):
     """
-    Compute Project Score over time.
+    Index the rows of a report frame by project : project key -> row positions, built in one grouping.
     """
-    logging.info(f"Compute Project Score over time, group_by_project : {group_by_project}")
-    # If category list specified, filter the dataframe by category first
-    if category:
-        df = df[df["check_category"].isin(category)]
-
-    # Define grouping columns based on the input parameter and group the dataframe
-    grouping_cols = ['timestamp'] + (['project_id'] if group_by_project else [])
-    grouped = df.groupby(grouping_cols)
-    
-    results = []
-    for group_keys, group in grouped:
-        # Count the number of passed checks (True) and failed checks (False)
-        value_counts = group["pass"].value_counts()
-
-        # Handle cases where True or False may not exist in the column
-        passed_checks = value_counts.get(True, 0)
-        failed_checks = value_counts.get(False, 0)
-
-        # Avoid division by zero
-        total_checks = passed_checks + failed_checks
-        project_score = round(passed_checks / total_checks, 2) * 100 if total_checks > 0 else 0.0
-
-        # Create result dictionary with keys based on grouping
-        if len(grouping_cols) == 1:
-            timestamp = group_keys
-        else:
-            timestamp = group_keys[0]
-        
-        # Create result dictionary with keys based on grouping
-        result_dict = {
-            'timestamp': timestamp,
-            'project_score': round(project_score,2)
-        }
-        
-        if group_by_project:
-            result_dict['project_id'] = group_keys[1]
+    return df.groupby("project_id", observed=True).indices
 
-        results.append(result_dict)
-
-    result_df = pd.DataFrame(results)
-    
-    result_df['timestamp'] = pd.to_datetime(result_df['timestamp'])
-
-    # Sort the DataFrame by the appropriate columns
-    sort_columns = ['timestamp'] + (['project_id'] if group_by_project else [])
-    result_df = result_df.sort_values(by=sort_columns)
-
-    # Compute the delta (difference) in project score
-    if group_by_project:
-        result_df['delta'] = result_df.groupby('project_id')['project_score'].diff()
-    else:
-        result_df['delta'] = result_df['project_score'].diff()
-
-    return result_df
-
-
-def compute_project_scores_by_category(df, category=None, group_by_project=True):
+def get_project_rows(data, df_name, project_key):
     """
-    Compute Project Scores by Category
-    If category list specified, filter the dataframe by category first
+    Rows of a project in a report frame of the loaded data, read through the per project index.
     """
-    logging.info(f"Compute Project Score by category, group_by_project : {group_by_project}")
-    
-    if category:
-        df = df[df["check_category"].isin(category)]
-    
-    # Define grouping columns based on the input parameter and group the dataframe
-    grouping_cols = ['timestamp', 'check_category'] + (['project_id'] if group_by_project else [])
-    grouped = df.groupby(grouping_cols)
-
-    results = []
-    for group_keys, group in grouped:
-        # Count the number of passed (True) and failed (False) checks
-        value_counts = group["pass"].value_counts()
-
-        # Retrieve counts or default to 0
-        passed_checks = value_counts.get(True, 0)
-        failed_checks = value_counts.get(False, 0)
-
-        total_checks = passed_checks + failed_checks
-        
-        # Compute the project score (0% if no checks, otherwise the ratio of passed checks)
-        if total_checks == 0:
-            project_score = 0.0
-        else:
-            project_score = round(passed_checks / total_checks * 100, 2)
-
-        result_dict = {
-            'timestamp': group_keys[0],
-            'project_score': project_score,
-            'category': group_keys[1]
-        }
-        
-        if group_by_project:
-            result_dict['project_id'] = group_keys[2]
-        
-        results.append(result_dict)
-
-    result_df = pd.DataFrame(results)
-
-    # Extract the date from the timestamp and convert it to datetime format
-    result_df['date'] = pd.to_datetime(result_df['timestamp'])
-
-    # Filter by the specified project categories
-    result_df = result_df[result_df['category'].isin(category)]
-    
-    # Create a new column for bar colors based on project score
-    def get_color(score):
-        if score > 70:
-            return '#b8e7ba'
-        elif 50 <= score <= 70:
-            return '#fce9a5'
-        else:
-            return '#fcd1b9'
-
-    result_df['color'] = result_df['project_score'].apply(get_color)
-    
-    return result_df
-
+    df = data[df_name]
+    return df.iloc[data["project_indexes"][df_name].get(project_key, [])]
 
 def compute_fail_to_pass_df(df, category=None):
     """
@@ -288,10 +110,46 @@ def compute_check_reco_table_df(df, category=None):
     most_recent_rows = df[df['timestamp'] == most_recent_timestamp]
 
     # Create a new column 'status' that marks whether the check passed or failed
-    most_recent_rows['status'] = most_recent_rows['pass'].apply(lambda x: 'Pass' if x else 'Fail')
+    most_recent_rows['status'] = most_recent_rows['pass'].apply(lambda x: 'Pass' if pd.notna(x) and x else 'Fail')
     return most_recent_rows
 
 
+def get_check_reco_row(data, project_key, check_name):
+    """
+    Row of a check in the recommendations of a project (of the instance if the project key is empty)
+    """
+    if project_key:
+        check_reco_df = compute_check_reco_table_df(get_project_rows(data, "check_df", project_key), category=configs["project_categories"])
+    else:
+        check_reco_df = compute_check_reco_table_df(data["instance_check_df"], category=configs["instance_categories"])
+    check_rows = check_reco_df[check_reco_df["check_name"] == check_name]
+    return None if check_rows.empty else check_rows.iloc[0]
+
+
+def compute_instance_tables(instance_check_df):
+    """
+    Tables of the instance tab, served page by page
+    """
+    instance_categories = configs["instance_categories"]
+    fail_to_pass_df = compute_fail_to_pass_df(instance_check_df, category=instance_categories)
+    check_reco_df = compute_check_reco_table_df(instance_check_df, category=instance_categories)
+    return {
+        "instance-fail-to-pass-table" : fail_to_pass_df,
+        "instance-check-reco-table" : check_reco_df[["check_category", "check_name", "status", "message", "result_data"]].reset_index(drop=True)
+    }
+
+
+def get_evolution_df(data, chart, project_key):
+    """
+    Full resolution frame of an evolution chart of a project (of the instance if the project key is empty)
+    """
+    if chart == "score-by-category":
+        return get_project_rows(data, "precomputed_project_by_category_df", project_key) if project_key else data["precomputed_instance_by_category_df"]
+    if project_key:
+        return compute_metric_df(get_project_rows(data, "metric_df", project_key), instance=False)
+    return compute_metric_df(data["instance_metric_df"], instance=True)
+
+
 def compute_metric_df(df_metric, instance=True):
     """
     Compute Check reco Table df
@@ -302,3 +160,70 @@ def compute_metric_df(df_metric, instance=True):
         df_metric = df_metric[df_metric["project_id"].isna()]
 
     return df_metric
+
+
+############################
+## Paged tables functions ##
+############################
+
+# Operators of the DataTable filter queries
+FILTER_OPERATORS = [['ge ', '>='],
+                    ['le ', '<='],
+                    ['lt ', '<'],
+                    ['gt ', '>'],
+                    ['ne ', '!='],
+                    ['eq ', '='],
+                    ['contains ']]
+
+def split_filter_part(filter_part):
+    """
+    Split a part of a DataTable filter query into column, operator and value
+    """
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            if operator in filter_part:
+                name_part, value_part = filter_part.split(operator, 1)
+                name = name_part[name_part.find('{') + 1: name_part.rfind('}')]
+                value_part = value_part.strip()
+                if value_part and value_part[0] == value_part[-1] and value_part[0] in ("'", '"', '`'):
+                    value = value_part[1: -1].replace('\\' + value_part[0], value_part[0])
+                else:
+                    try:
+                        value = float(value_part)
+                    except ValueError:
+                        value = value_part
+                return name, operator_type[0].strip(), value
+    return None, None, None
+
+def filter_table_df(df, filter_query):
+    """
+    Filter a table with a DataTable filter query (custom filtering)
+    """
+    if not filter_query:
+        return df
+    for filter_part in filter_query.split(' && '):
+        col_name, operator, filter_value = split_filter_part(filter_part)
+        if col_name not in df.columns:
+            continue
+        if operator == 'contains':
+            df = df[df[col_name].astype(str).str.contains(str(filter_value), case=False, regex=False)]
+            continue
+        # Numbers are compared as numbers, other values as strings
+        values = df[col_name].astype(str) if isinstance(filter_value, str) else pd.to_numeric(df[col_name], errors='coerce')
+        df = df[getattr(values, operator)(filter_value)]
+    return df
+
+def query_table_page(df, page_current, page_size, sort_by=None, filter_query=None):
+    """
+    Filter, sort and slice a table for the requested page (custom backend paging), return the page rows and the page count
+    """
+    df = filter_table_df(df, filter_query)
+    if sort_by:
+        df = df.sort_values(
+            [col['column_id'] for col in sort_by],
+            ascending=[col['direction'] == 'asc' for col in sort_by],
+            inplace=False
+        )
+    page_count = max((len(df) - 1) // page_size + 1, 1)
+    page_df = df.iloc[page_current * page_size:(page_current + 1) * page_size]
+    return page_df, page_count
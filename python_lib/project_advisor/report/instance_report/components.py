@@ -80,7 +80,8 @@ def build_pie_chart_card(category : str, df: pd.DataFrame):
     logging.info(f"Building check pie chart for category : {category}")
     
     df = df.reset_index()
-    df["pass"] = df["pass"].transform( lambda x : str(x))
+    # Not applicable checks (NA in the nullable boolean pass column) are shown as "nan"
+    df["pass"] = df["pass"].astype("object").map({True : "True", False : "False"}).fillna("nan")
     fig = px.pie(df, 
              names = "pass",
              color = 'pass',
@@ -113,7 +114,7 @@ def build_instance_check_card(check_name : str,
     result_data = inst_check["result_data"]
     check_pass = inst_check["pass"]
 
-    if check_pass:
+    if pd.notna(check_pass) and check_pass:
         color = GREEN
     else:
         color = RED
@@ -1,17 +1,49 @@
 import dataiku
-from datetime import datetime
 import logging
 
-def load_historical_metric_check_reports(instance_metric_report_name, instance_check_report_name):
+from project_advisor.report.columnar_report import (METRIC_REPORT, CHECK_REPORT, load_report_frame, format_report_frame)
+from project_advisor.report.report_partitions import load_report_dataset
+from project_advisor.report.latest_run import load_latest_report_run
+
+# Columns used by the instance report
+METRIC_COLUMNS = ['timestamp', 'metric_name', 'metric_value', 'metric_type', 'project_id']
+CHECK_COLUMNS = ['timestamp', 'check_name', 'check_category', 'project_id', 'pass', 'message', 'result_data']
+
+def load_historical_metric_check_reports(instance_metric_report_name, instance_check_report_name, report_folder_id = None, history_days = None):
+    # history_days : only read the run date partitions of the latest run date plus history_days days (all if None)
+    
+    # Typed columnar reports : only the used columns are read
+    if report_folder_id:
+        logging.info("Loading Metrics and Checks from the columnar report folder")
+        report_folder = dataiku.Folder(report_folder_id)
+        metric_df = load_report_frame(report_folder, METRIC_REPORT, columns = METRIC_COLUMNS, history_days = history_days)
+        check_df = load_report_frame(report_folder, CHECK_REPORT, columns = CHECK_COLUMNS, history_days = history_days)
+        return metric_df, check_df
+    
     # Example: load a DSS dataset as a Pandas dataframe
     logging.info("Loading Metrics and Checks datasets")
     
     check_report = dataiku.Dataset(instance_check_report_name)
-    check_df = check_report.get_dataframe()
+    check_df = load_report_dataset(check_report, history_days = history_days)
 
     metric_report = dataiku.Dataset(instance_metric_report_name)
-    metric_df = metric_report.get_dataframe()
+    metric_df = load_report_dataset(metric_report, history_days = history_days)
 
-    check_df["timestamp"] = check_df["timestamp"].transform(lambda x : datetime.strptime(x, '%m/%d/%Y, %H:%M:%S'))
-    metric_df["timestamp"] = metric_df["timestamp"].transform(lambda x : datetime.strptime(x, '%m/%d/%Y, %H:%M:%S'))
-    return metric_df, check_df
\ No newline at end of file
+    check_df = format_report_frame(check_df, CHECK_REPORT)
+    metric_df = format_report_frame(metric_df, METRIC_REPORT)
+    return metric_df, check_df
+
+def load_latest_metric_check_reports(instance_metric_report_name, instance_check_report_name, report_folder_id = None):
+    # Only the rows & columns of the latest run of each report are read
+    
+    # Typed columnar reports : files of the latest run date
+    if report_folder_id:
+        metric_df, check_df = load_historical_metric_check_reports(instance_metric_report_name, instance_check_report_name, report_folder_id, history_days = 0)
+    else:
+        logging.info("Loading the latest run of the Metrics and Checks datasets")
+        check_df = format_report_frame(load_latest_report_run(dataiku.Dataset(instance_check_report_name), columns = CHECK_COLUMNS), CHECK_REPORT)
+        metric_df = format_report_frame(load_latest_report_run(dataiku.Dataset(instance_metric_report_name), columns = METRIC_COLUMNS), METRIC_REPORT)
+    
+    latest_check_df = check_df[check_df["timestamp"]== check_df["timestamp"].max()]
+    latest_metric_df = metric_df[metric_df["timestamp"]== metric_df["timestamp"].max()]
+    return latest_metric_df, latest_check_df
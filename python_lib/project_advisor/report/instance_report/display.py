@@ -1,10 +1,13 @@
+import dataiku
 import logging
+import pandas as pd
 import dash
 import dash_bootstrap_components as dbc
 from dash import dcc, html
 
 
-from project_advisor.report.instance_report.data_loader import load_historical_metric_check_reports
+from project_advisor.report.instance_report.data_loader import load_latest_metric_check_reports
+from project_advisor.report.latest_run import has_new_runs
 
 from project_advisor.report.instance_report.components import (build_numerical_metric_card,
                                                                build_hist_card,
@@ -14,15 +17,53 @@ from project_advisor.report.instance_report.components import (build_numerical_m
                                                               )
 from project_advisor.report.instance_report.style import ( ROW_STYLE, PAGE_STYLE )
 
-def build_layout(config):
-    logging.info("Building Display")
+def load_latest_reports(config):
     # Load Data
     instance_metric_report_name = config['metric_dataset']
     instance_check_report_name = config['check_dataset']
-    metric_df, check_df = load_historical_metric_check_reports(instance_metric_report_name, instance_check_report_name)
+    # Only the latest run is displayed : only its rows are read (query on SQL datasets, latest partition otherwise)
+    return load_latest_metric_check_reports(instance_metric_report_name, instance_check_report_name, config.get('report_folder'))
+
+def build_layout(config):
+    latest_metric_df, latest_check_df = load_latest_reports(config)
+    return build_display(latest_metric_df, latest_check_df)
 
-    latest_check_df = check_df[check_df["timestamp"]== check_df["timestamp"].max()]
-    latest_metric_df = metric_df[metric_df["timestamp"]== metric_df["timestamp"].max()]
+def load_report_layout(config):
+    """
+    Load the latest run and build its layout, returned with the run timestamp.
+    """
+    latest_metric_df, latest_check_df = load_latest_reports(config)
+    return {
+        "timestamp" : latest_check_df["timestamp"].max(),
+        "layout" : build_display(latest_metric_df, latest_check_df)
+    }
+
+def refresh_report_layout(config, report_layout):
+    """
+    Rebuild the layout if a run newer than the displayed one was saved, None otherwise.
+    The check report is probed first, the latest run is only loaded when the probe finds a newer run.
+    """
+    if pd.notna(report_layout["timestamp"]) and not config.get('report_folder'):
+        new_runs = has_new_runs(dataiku.Dataset(config['check_dataset']), report_layout["timestamp"])
+        if new_runs is None:
+            logging.info("Refresh skipped : the check dataset is neither partitioned by run date nor on SQL, "
+                         "its latest run can't be found without reading its full history")
+            return None
+        if not new_runs:
+            return None
+    
+    latest_metric_df, latest_check_df = load_latest_reports(config)
+    latest_timestamp = latest_check_df["timestamp"].max()
+    if pd.isna(latest_timestamp) or (pd.notna(report_layout["timestamp"]) and latest_timestamp <= report_layout["timestamp"]):
+        return None
+    logging.info(f"New run {latest_timestamp}, rebuilding the report")
+    return {
+        "timestamp" : latest_timestamp,
+        "layout" : build_display(latest_metric_df, latest_check_df)
+    }
+
+def build_display(latest_metric_df, latest_check_df):
+    logging.info("Building Display")
     
     ### Instance Metrics ###
     instance_metrics = []
@@ -0,0 +1,120 @@
+import dataiku
+from dataiku import SQLExecutor2
+from dataiku.sql import SelectQuery, Column, Constant, toSQL
+
+import logging
+from typing import List
+
+import pandas as pd
+
+from project_advisor.report.columnar_report import TIMESTAMP_FORMAT
+from project_advisor.report.report_partitions import (is_partitioned_by_run_date, get_run_date_partition)
+
+
+# Rows read at once when streaming a report dataset that is neither on SQL nor partitioned
+CHUNK_SIZE = 100000
+
+
+def is_sql_dataset(dataset : dataiku.Dataset) -> bool:
+    try:
+        return dataset.get_location_info().get("locationInfoType") == "SQL"
+    except Exception as error:
+        logging.debug(f"Failed to read the location of dataset {dataset.name} : {error}")
+        return False
+
+def get_latest_timestamp(timestamps : pd.Series) -> str:
+    # Report timestamps are strings (TIMESTAMP_FORMAT) that don't sort chronologically
+    parsed = pd.to_datetime(timestamps, format = TIMESTAMP_FORMAT)
+    return timestamps.iloc[parsed.argmax()]
+
+def query_latest_timestamp(dataset : dataiku.Dataset) -> str:
+    """
+    Timestamp of the latest run of a SQL report dataset, from the distinct run timestamps (None if the dataset is empty).
+    """
+    timestamps_query = SelectQuery()
+    timestamps_query.select_from(dataset)
+    timestamps_query.select(Column("timestamp"))
+    timestamps_query.distinct()
+    timestamps = SQLExecutor2(dataset = dataset).query_to_df(toSQL(timestamps_query, dataset = dataset))["timestamp"].dropna()
+    if len(timestamps) == 0:
+        return None
+    return get_latest_timestamp(timestamps)
+
+def has_new_runs(dataset : dataiku.Dataset, latest_timestamp : pd.Timestamp) -> bool:
+    """
+    Probe a report dataset for runs newer than latest_timestamp without loading its rows :
+    from the partition list if partitioned by run date, from the latest timestamp queried on SQL datasets.
+    Return None if it can't be probed : reading a dataset neither partitioned by run date nor on SQL reads its full history.
+    """
+    if is_partitioned_by_run_date(dataset):
+        partitions = dataset.list_partitions()
+        return len(partitions) > 0 and max(partitions) >= get_run_date_partition(latest_timestamp)
+    if is_sql_dataset(dataset):
+        report_latest_timestamp = query_latest_timestamp(dataset)
+        return report_latest_timestamp is not None and pd.to_datetime(report_latest_timestamp, format = TIMESTAMP_FORMAT) > latest_timestamp
+    return None
+
+def query_latest_run(dataset : dataiku.Dataset, columns : List[str] = None) -> pd.DataFrame:
+    """
+    Push the latest run filter and the column projection down to the database :
+    one query for the distinct run timestamps, one for the rows of the latest run.
+    """
+    latest_timestamp = query_latest_timestamp(dataset)
+    if latest_timestamp is None:
+        return dataset.get_dataframe(columns = columns, limit = 0)
+    logging.info(f"Querying the run {latest_timestamp} of dataset {dataset.name}")
+
+    executor = SQLExecutor2(dataset = dataset)
+    run_query = SelectQuery()
+    run_query.select_from(dataset)
+    for column in (columns or []): # All the columns if not specified
+        run_query.select(Column(column))
+    run_query.where(Column("timestamp").eq(Constant(latest_timestamp)))
+    return executor.query_to_df(toSQL(run_query, dataset = dataset))
+
+def read_latest_partition(dataset : dataiku.Dataset, columns : List[str] = None) -> pd.DataFrame:
+    """
+    Read the run date partitions from the latest one, stopping at the first one with rows.
+    """
+    for partition in sorted(dataset.list_partitions(), reverse = True):
+        dataset.read_partitions = [partition]
+        try:
+            df = dataset.get_dataframe(columns = columns)
+        finally:
+            dataset.read_partitions = None
+        if len(df) > 0:
+            logging.info(f"Latest run found in partition {partition} of dataset {dataset.name}")
+            return df
+    return dataset.get_dataframe(columns = columns, limit = 0)
+
+def stream_latest_run(dataset : dataiku.Dataset, columns : List[str] = None) -> pd.DataFrame:
+    """
+    Stream the dataset by chunks, only the rows of the latest run seen so far are kept in memory.
+    """
+    latest_df = None
+    latest_time = None
+    for chunk_df in dataset.iter_dataframes(chunksize = CHUNK_SIZE, columns = columns):
+        chunk_times = pd.to_datetime(chunk_df["timestamp"], format = TIMESTAMP_FORMAT)
+        if chunk_times.isna().all():
+            continue
+        chunk_latest_time = chunk_times.max()
+        if latest_time is None or chunk_latest_time > latest_time:
+            latest_df = chunk_df[(chunk_times == chunk_latest_time).to_numpy()]
+            latest_time = chunk_latest_time
+        elif chunk_latest_time == latest_time:
+            latest_df = pd.concat([latest_df, chunk_df[(chunk_times == chunk_latest_time).to_numpy()]], ignore_index = True)
+    if latest_df is None:
+        return dataset.get_dataframe(columns = columns, limit = 0)
+    return latest_df
+
+def load_latest_report_run(dataset : dataiku.Dataset, columns : List[str] = None) -> pd.DataFrame:
+    """
+    Load the rows (and columns) of the latest run of a report dataset :
+    pushed down as queries for SQL datasets, latest non empty partition for run date partitioned datasets,
+    streamed by chunks otherwise.
+    """
+    if is_sql_dataset(dataset):
+        return query_latest_run(dataset, columns)
+    if is_partitioned_by_run_date(dataset):
+        return read_latest_partition(dataset, columns)
+    return stream_latest_run(dataset, columns)
@@ -0,0 +1,70 @@
+import dataiku
+
+import logging
+from datetime import datetime, timedelta
+from typing import List
+
+import pandas as pd
+
+
+# Reports are partitioned by run date (DSS "DAY" time partitioning identifier)
+RUN_DATE_FORMAT = "%Y-%m-%d"
+
+
+def get_run_date_partition(timestamp : datetime) -> str:
+    return timestamp.strftime(RUN_DATE_FORMAT)
+
+def is_partitioned_by_run_date(dataset : dataiku.Dataset) -> bool:
+    """
+    True if the report dataset is partitioned on a single time dimension with a DAY period.
+    """
+    try:
+        dimensions = dataset.get_config().get("partitioning", {}).get("dimensions", [])
+    except Exception as error:
+        logging.debug(f"Failed to read the partitioning of dataset {dataset.name} : {error}")
+        return False
+    return len(dimensions) == 1 and dimensions[0].get("type") == "time" and dimensions[0].get("params", {}).get("period") == "DAY"
+
+def select_run_date_partitions(partitions : List[str], history_days : int = None, since : str = None) -> List[str]:
+    """
+    Select the partitions of the latest run date plus history_days days of history (all the partitions if history_days is None).
+    since : only select the partitions from this run date (incremental loads).
+    """
+    partitions = sorted(set(partitions))
+    if since is not None:
+        partitions = [partition for partition in partitions if partition >= since]
+    if history_days is None or len(partitions) == 0:
+        return partitions
+    start = (datetime.strptime(partitions[-1], RUN_DATE_FORMAT) - timedelta(days = history_days)).strftime(RUN_DATE_FORMAT)
+    return [partition for partition in partitions if partition >= start]
+
+def load_report_dataset(dataset : dataiku.Dataset, history_days : int = None, since : str = None) -> pd.DataFrame:
+    """
+    Load a report dataset, reading only the run date partitions of the time window (and from the since run date)
+    when the dataset is partitioned. A dataset that is not partitioned is read in full, since included :
+    probe it for new runs before an incremental load.
+    """
+    if (history_days is None and since is None) or not is_partitioned_by_run_date(dataset):
+        return dataset.get_dataframe()
+
+    partitions = select_run_date_partitions(dataset.list_partitions(), history_days, since)
+    if len(partitions) == 0:
+        if since is not None:
+            return dataset.get_dataframe(limit = 0) # No new run date
+        return dataset.get_dataframe()
+    logging.info(f"Loading {len(partitions)} partitions of dataset {dataset.name}")
+    dataset.read_partitions = partitions
+    try:
+        return dataset.get_dataframe()
+    finally:
+        dataset.read_partitions = None
+
+def filter_time_window(df : pd.DataFrame, history_days : int = None) -> pd.DataFrame:
+    """
+    Keep the rows (with a parsed timestamp) of the latest run date plus history_days days of history,
+    the same window as the partition selection for the reports that are not partitioned.
+    """
+    if history_days is None or len(df) == 0:
+        return df
+    start = pd.Timestamp(df["timestamp"].max()).normalize() - pd.Timedelta(days = history_days)
+    return df[df["timestamp"] >= start]
@@ -0,0 +1,227 @@
+# Scores
+import logging
+import numpy as np
+import pandas as pd
+
+###############################
+## Precomputations functions ##
+###############################
+
+# Materialized score rows, one row per run, scope (project or instance), project & category ("" for the overall score)
+SCORE_COLUMNS = ["timestamp", "scope", "project_id", "check_category", "passed_checks", "failed_checks", "project_score", "delta"]
+PROJECT_SCOPE = "project"
+INSTANCE_SCOPE = "instance"
+
+SCORE_COLORS = {
+    "high" : '#b8e7ba',   # score > 70
+    "medium" : '#fce9a5', # 50 <= score <= 70
+    "low" : '#fcd1b9',    # score < 50
+}
+
+def count_checks(df, grouping_cols):
+    """
+    Count the passed (True) and failed (False) checks of each group in one grouped sum.
+    Checks without a pass flag (not applicable) are not counted, groups with only such checks are kept.
+    """
+    counts_df = pd.DataFrame({
+        "passed_checks" : df["pass"].eq(True).fillna(False).astype("int64"),
+        "failed_checks" : df["pass"].eq(False).fillna(False).astype("int64"),
+    })
+    counts_df[grouping_cols] = df[grouping_cols]
+    counts_df = counts_df.groupby(grouping_cols, observed=True)[["passed_checks", "failed_checks"]].sum().reset_index()
+
+    # Categorical keys are returned as plain values
+    for col in grouping_cols:
+        if isinstance(counts_df[col].dtype, pd.CategoricalDtype):
+            counts_df[col] = counts_df[col].astype(object)
+    return counts_df
+
+def get_materialized_counts(score_df, grouping_cols, category=None):
+    """
+    Pass/fail counts of the materialized score rows matching the grouping (project or instance scope, overall or by category).
+    """
+    scope = PROJECT_SCOPE if "project_id" in grouping_cols else INSTANCE_SCOPE
+    is_overall = score_df["check_category"].isna() | (score_df["check_category"] == "")
+    by_category = "check_category" in grouping_cols
+    rows = score_df[(score_df["scope"] == scope) & (is_overall != by_category)]
+    if by_category and category:
+        rows = rows[rows["check_category"].isin(category)]
+    return rows[grouping_cols + ["passed_checks", "failed_checks"]]
+
+def count_checks_with_scores(df, grouping_cols, category=None, score_df=None):
+    """
+    Pass/fail counts of each group, read from the materialized score rows for the runs they cover,
+    counted from the checks for the legacy runs without score rows.
+    """
+    if score_df is None or len(score_df) == 0:
+        return count_checks(df, grouping_cols)
+
+    materialized_counts_df = get_materialized_counts(score_df, grouping_cols, category)
+    legacy_df = df[~df["timestamp"].isin(set(materialized_counts_df["timestamp"]))]
+    logging.info(f"Scores read from {materialized_counts_df['timestamp'].nunique()} materialized runs, computed for {legacy_df['timestamp'].nunique()} legacy runs")
+
+    counts_df = pd.concat([materialized_counts_df, count_checks(legacy_df, grouping_cols)], ignore_index=True)
+    counts_df[["passed_checks", "failed_checks"]] = counts_df[["passed_checks", "failed_checks"]].astype("int64")
+    return counts_df.sort_values(by=grouping_cols).reset_index(drop=True)
+
+def round_scores(ratios, digits=2):
+    """
+    Python rounding of the score ratios, applied once per distinct ratio.
+    """
+    unique_ratios, inverse = np.unique(ratios, return_inverse=True)
+    return np.array([round(ratio, digits) for ratio in unique_ratios], dtype="float64")[inverse.reshape(-1)]
+
+def compute_project_scores_for_all_timestamps(df, category=None, group_by_project=True, score_df=None):
+    """
+    Compute Project Score over time.
+    score_df : materialized score rows, used for the runs they cover.
+    """
+    logging.info(f"Compute Project Score over time, group_by_project : {group_by_project}")
+    # If category list specified, filter the dataframe by category first
+    if category:
+        df = df[df["check_category"].isin(category)]
+
+    # Define grouping columns based on the input parameter and count the checks of each group
+    grouping_cols = ['timestamp'] + (['project_id'] if group_by_project else [])
+    counts_df = count_checks_with_scores(df, grouping_cols, score_df=score_df)
+    project_scores = compute_overall_scores(counts_df)
+
+    result_df = pd.DataFrame({
+        'timestamp': pd.to_datetime(counts_df['timestamp']),
+        'project_score': project_scores
+    })
+    if group_by_project:
+        result_df['project_id'] = counts_df['project_id']
+
+    # Sort the DataFrame by the appropriate columns
+    sort_columns = ['timestamp'] + (['project_id'] if group_by_project else [])
+    result_df = result_df.sort_values(by=sort_columns)
+
+    # Compute the delta (difference) in project score
+    return set_score_evolution_deltas(result_df, group_by_project)
+
+def set_score_evolution_deltas(result_df, group_by_project=True):
+    """
+    Delta of each project score with the previous score of the project (or of the instance), on scores sorted by timestamp.
+    """
+    if group_by_project:
+        result_df['delta'] = result_df.groupby('project_id')['project_score'].diff()
+    else:
+        result_df['delta'] = result_df['project_score'].diff()
+    return result_df
+
+def compute_overall_scores(counts_df):
+    """
+    Overall scores (percentage of passed checks, ratio rounded first) of the counted groups.
+    """
+    passed_checks = counts_df["passed_checks"].to_numpy(dtype="float64")
+    total_checks = passed_checks + counts_df["failed_checks"].to_numpy(dtype="float64")
+
+    # Avoid division by zero (score of 0 without any passed or failed check)
+    ratios = np.divide(passed_checks, total_checks, out=np.zeros_like(passed_checks), where=total_checks > 0)
+    return round_scores(round_scores(ratios) * 100)
+
+def compute_category_scores(counts_df):
+    """
+    Category scores (percentage of passed checks) of the counted groups.
+    """
+    passed_checks = counts_df["passed_checks"].to_numpy(dtype="float64")
+    total_checks = passed_checks + counts_df["failed_checks"].to_numpy(dtype="float64")
+
+    # Compute the project score (0% if no checks, otherwise the ratio of passed checks)
+    ratios = np.divide(passed_checks, total_checks, out=np.zeros_like(passed_checks), where=total_checks > 0)
+    return round_scores(ratios * 100)
+
+
+def get_score_colors(scores):
+    """
+    Bar colors based on the project scores.
+    """
+    return np.select([scores > 70, scores >= 50], [SCORE_COLORS["high"], SCORE_COLORS["medium"]], default=SCORE_COLORS["low"])
+
+def compute_project_scores_by_category(df, category=None, group_by_project=True, score_df=None):
+    """
+    Compute Project Scores by Category
+    If category list specified, filter the dataframe by category first
+    score_df : materialized score rows, used for the runs they cover.
+    """
+    logging.info(f"Compute Project Score by category, group_by_project : {group_by_project}")
+
+    if category:
+        df = df[df["check_category"].isin(category)]
+
+    # Define grouping columns based on the input parameter and count the checks of each group
+    grouping_cols = ['timestamp', 'check_category'] + (['project_id'] if group_by_project else [])
+    counts_df = count_checks_with_scores(df, grouping_cols, category=category, score_df=score_df)
+    project_scores = compute_category_scores(counts_df)
+
+    result_df = pd.DataFrame({
+        'timestamp': counts_df['timestamp'],
+        'project_score': project_scores,
+        'category': counts_df['check_category']
+    })
+    if group_by_project:
+        result_df['project_id'] = counts_df['project_id']
+
+    # Extract the date from the timestamp and convert it to datetime format
+    result_df['date'] = pd.to_datetime(result_df['timestamp'])
+
+    # Filter by the specified project categories
+    if category:
+        result_df = result_df[result_df['category'].isin(category)]
+
+    # Create a new column for bar colors based on project score
+    result_df['color'] = get_score_colors(result_df['project_score'].to_numpy())
+
+    return result_df
+
+
+##############################
+## Score materialization ##
+##############################
+
+def compute_run_score_rows(check_df, project_categories, instance_categories):
+    """
+    Materialized score rows of the checks of a run : pass/fail counts & score of each project (project categories)
+    and of the instance (instance categories), overall and by category. The delta is left empty.
+    """
+    score_dfs = []
+    for scope, categories, key_cols in [(PROJECT_SCOPE, project_categories, ['project_id']), (INSTANCE_SCOPE, instance_categories, [])]:
+        scope_df = check_df[check_df["check_category"].isin(categories)]
+        if len(scope_df) == 0:
+            continue
+
+        overall_df = count_checks(scope_df, ['timestamp'] + key_cols)
+        overall_df["check_category"] = ""
+        overall_df["project_score"] = compute_overall_scores(overall_df)
+
+        by_category_df = count_checks(scope_df, ['timestamp', 'check_category'] + key_cols)
+        by_category_df["project_score"] = compute_category_scores(by_category_df)
+
+        scope_score_df = pd.concat([overall_df, by_category_df], ignore_index=True)
+        scope_score_df["scope"] = scope
+        if not key_cols:
+            scope_score_df["project_id"] = ""
+        score_dfs.append(scope_score_df)
+
+    if len(score_dfs) == 0:
+        return pd.DataFrame(columns=SCORE_COLUMNS)
+    score_df = pd.concat(score_dfs, ignore_index=True)
+    score_df["delta"] = np.nan
+    return score_df[SCORE_COLUMNS]
+
+def set_score_deltas(score_df, previous_score_df):
+    """
+    Delta of each score row with the latest previous score of the same scope, project & category.
+    """
+    key_cols = ["scope", "project_id", "check_category"]
+    if previous_score_df is None or len(previous_score_df) == 0:
+        return score_df
+    previous_df = previous_score_df[key_cols + ["project_score"]].copy()
+    previous_df["_order"] = pd.to_datetime(previous_score_df["timestamp"], format='%m/%d/%Y, %H:%M:%S')
+    previous_df[["project_id", "check_category"]] = previous_df[["project_id", "check_category"]].fillna("")
+    previous_df = previous_df.sort_values("_order").drop_duplicates(subset=key_cols, keep="last")
+
+    merged_df = score_df[key_cols].merge(previous_df[key_cols + ["project_score"]], on=key_cols, how="left")
+    score_df["delta"] = score_df["project_score"].to_numpy() - merged_df["project_score"].to_numpy(dtype="float64")
+    return score_df
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Benchmark of the vectorized score precomputations against the per group reference implementations.
+# Run with : PYTHONPATH=python_lib python tests/python/benchmarks/benchmark_score_computations.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "unit"))
+
+from test_score_computations import build_check_history, as_typed_frame, CASES
+
+
+def benchmark(n_runs, n_projects):
+    df = as_typed_frame(build_check_history(n_runs = n_runs, n_projects = n_projects))
+    for compute, reference, category, group_by_project in CASES:
+        start = time.perf_counter()
+        reference(df, category = category, group_by_project = group_by_project)
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        compute(df, category = category, group_by_project = group_by_project)
+        vectorized_time = time.perf_counter() - start
+
+        print(f"{compute.__name__} (group_by_project={group_by_project}) on {len(df)} checks : "
+              f"reference {reference_time:.3f}s, vectorized {vectorized_time:.3f}s")
+
+
+if __name__ == "__main__":
+    for n_runs, n_projects in [(30, 50), (60, 100)]:
+        benchmark(n_runs, n_projects)
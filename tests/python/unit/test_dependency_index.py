@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Tests of the incremental refresh of the project dependency index saved across runs.
+
+from project_advisor.assessments.providers.dependency_index import ProjectDependencyIndex
+from project_advisor.assessments.providers.local_cache import LocalCache
+
+
+class FakeInstanceInfo():
+    raw = {"dipInstanceId" : "test-instance"}
+
+
+class FakeProject():
+    def __init__(self, client, project_key):
+        self.client = client
+        self.project_key = project_key
+
+    def get_settings(self):
+        return self
+
+    def get_raw(self):
+        self.client.fetched_projects.append(self.project_key)
+        rules = [{"targetProject" : target_project} for target_project in self.client.targets[self.project_key]]
+        return {"exposedObjects" : {"objects" : [{"rules" : rules}] if len(rules) > 0 else []}}
+
+
+class FakeClient():
+    """
+    Instance with shared objects between projects, recording the projects whose settings are fetched.
+    """
+    def __init__(self, targets):
+        self.targets = targets
+        self.versions = {project_key : 1 for project_key in targets}
+        self.fetched_projects = []
+
+    def get_instance_info(self):
+        return FakeInstanceInfo()
+
+    def list_projects(self):
+        return [{"projectKey" : project_key, "versionTag" : {"lastModifiedOn" : version}}
+                for project_key, version in self.versions.items()]
+
+    def get_project(self, project_key):
+        return FakeProject(self, project_key)
+
+
+def test_only_modified_projects_are_fetched(tmp_path):
+    cache = LocalCache(cache_dir = str(tmp_path))
+    client = FakeClient({"A" : ["B"], "B" : [], "C" : ["B"], "D" : []})
+
+    # First run : no saved index, all the projects are fetched
+    index = ProjectDependencyIndex.load_and_refresh(client, cache)
+    assert sorted(client.fetched_projects) == ["A", "B", "C", "D"]
+    assert index.get_source_projects("B") == {"A", "C"}
+
+    # Next run : only the modified project is fetched again
+    client.fetched_projects = []
+    client.targets["C"] = ["D"]
+    client.versions["C"] = 2
+    index = ProjectDependencyIndex.load_and_refresh(client, cache)
+    assert client.fetched_projects == ["C"]
+    assert index.get_source_projects("B") == {"A"}
+    assert index.get_source_projects("D") == {"C"}
+
+    # Deleted projects are dropped without fetching anything
+    client.fetched_projects = []
+    del client.versions["A"]
+    index = ProjectDependencyIndex.load_and_refresh(client, cache)
+    assert client.fetched_projects == []
+    assert index.get_source_projects("B") == set()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Tests of the downsampling of the evolution charts.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_advisor.report.downsampling import (lttb_indices,
+                                                 downsample_series,
+                                                 downsample_score_steps)
+
+
+def test_lttb_keeps_bounds_and_extremes():
+    x = np.arange(10000, dtype = "float64")
+    y = np.zeros(10000)
+    y[4321] = 50 # Isolated spike
+    indices = lttb_indices(x, y, 200)
+    assert len(indices) == 200
+    assert indices[0] == 0 and indices[-1] == 9999
+    assert np.all(np.diff(indices) > 0)
+    assert 4321 in indices
+
+def test_downsample_series_per_group():
+    timestamps = list(pd.date_range("2024-01-01", periods = 2000, freq = "h"))
+    df = pd.DataFrame({
+        "timestamp" : timestamps * 2,
+        "metric_name" : ["numeric"] * 2000 + ["text"] * 2000,
+        "metric_value" : [str(v) for v in np.sin(np.arange(2000) / 50)] + ["value"] * 2000,
+    })
+    downsampled_df = downsample_series(df, "timestamp", "metric_value", "metric_name", 300)
+    assert downsampled_df.groupby("metric_name").size().to_dict() == {"numeric" : 300, "text" : 300}
+
+    # Short series are kept at full resolution
+    assert len(downsample_series(df.iloc[:100], "timestamp", "metric_value", "metric_name", 300)) == 100
+
+def test_downsample_score_steps_keeps_final_score():
+    scores = np.round(np.random.default_rng(0).uniform(0, 100, 3000), 2)
+    df = pd.DataFrame({"timestamp" : pd.date_range("2024-01-01", periods = 3000, freq = "h"), "project_score" : scores})
+    df["delta"] = df["project_score"].diff()
+    downsampled_df = downsample_score_steps(df, 100)
+    assert len(downsampled_df) <= 100
+    assert np.isnan(downsampled_df["delta"].iloc[0])
+    assert downsampled_df["project_score"].iloc[0] + downsampled_df["delta"].iloc[1:].sum() == pytest.approx(scores[-1], abs = 1e-6)
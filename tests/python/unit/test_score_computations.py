@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# Equivalence tests of the vectorized score precomputations on synthetic check histories.
+# The benchmark is in tests/python/benchmarks/benchmark_score_computations.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_advisor.report.scores import (compute_project_scores_for_all_timestamps,
+                                           compute_project_scores_by_category,
+                                           compute_run_score_rows,
+                                           set_score_deltas)
+
+PROJECT_CATEGORIES = ["DOCUMENTATION", "PERFORMANCE", "ROBUSTNESS", "DEPLOYMENT", "RUNNING"]
+INSTANCE_CATEGORIES = ["SANITY", "USAGE"]
+
+
+def build_check_history(n_runs, n_projects, n_checks = 25, seed = 0):
+    """
+    Synthetic check report : n_runs runs over n_projects projects & the instance, 10% of the checks don't apply.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for run in range(n_runs):
+        timestamp = pd.Timestamp("2024-01-01") + pd.Timedelta(days = run, hours = int(rng.integers(0, 20)))
+        for project in range(n_projects + 1):
+            is_instance = project == n_projects
+            for check in range(n_checks):
+                if rng.random() < 0.1:
+                    continue
+                value = rng.random()
+                rows.append({
+                    "timestamp" : timestamp,
+                    "check_name" : f"check_{check}",
+                    "check_category" : INSTANCE_CATEGORIES[check % 2] if is_instance else PROJECT_CATEGORIES[check % 5],
+                    "project_id" : None if is_instance else f"PROJECT_{project}",
+                    "pass" : None if value < 0.1 else bool(value < 0.6),
+                })
+    return pd.DataFrame(rows)
+
+def as_typed_frame(df):
+    """
+    In-memory types of the loaded reports (categorical keys & nullable pass flag).
+    """
+    return df.astype({"check_name" : "category", "check_category" : "category", "project_id" : "category", "pass" : "boolean"})
+
+
+### Reference (per group) implementations ###
+
+def reference_scores_for_all_timestamps(df, category = None, group_by_project = True):
+    if category:
+        df = df[df["check_category"].isin(category)]
+    grouping_cols = ["timestamp"] + (["project_id"] if group_by_project else [])
+    results = []
+    for group_keys, group in df.groupby(grouping_cols, observed = True):
+        group_keys = group_keys if isinstance(group_keys, tuple) else (group_keys,)
+        value_counts = group["pass"].value_counts()
+        passed_checks = value_counts.get(True, 0)
+        failed_checks = value_counts.get(False, 0)
+        total_checks = passed_checks + failed_checks
+        project_score = round(passed_checks / total_checks, 2) * 100 if total_checks > 0 else 0.0
+        result_dict = {"timestamp" : group_keys[0], "project_score" : round(project_score, 2)}
+        if group_by_project:
+            result_dict["project_id"] = group_keys[1]
+        results.append(result_dict)
+    result_df = pd.DataFrame(results)
+    result_df["timestamp"] = pd.to_datetime(result_df["timestamp"])
+    result_df = result_df.sort_values(by = grouping_cols)
+    if group_by_project:
+        result_df["delta"] = result_df.groupby("project_id")["project_score"].diff()
+    else:
+        result_df["delta"] = result_df["project_score"].diff()
+    return result_df
+
+def reference_scores_by_category(df, category = None, group_by_project = True):
+    if category:
+        df = df[df["check_category"].isin(category)]
+    grouping_cols = ["timestamp", "check_category"] + (["project_id"] if group_by_project else [])
+    results = []
+    for group_keys, group in df.groupby(grouping_cols, observed = True):
+        value_counts = group["pass"].value_counts()
+        passed_checks = value_counts.get(True, 0)
+        failed_checks = value_counts.get(False, 0)
+        total_checks = passed_checks + failed_checks
+        project_score = 0.0 if total_checks == 0 else round(passed_checks / total_checks * 100, 2)
+        result_dict = {"timestamp" : group_keys[0], "project_score" : project_score, "category" : group_keys[1]}
+        if group_by_project:
+            result_dict["project_id"] = group_keys[2]
+        results.append(result_dict)
+    result_df = pd.DataFrame(results)
+    result_df["date"] = pd.to_datetime(result_df["timestamp"])
+    result_df = result_df[result_df["category"].isin(category)]
+    result_df["color"] = result_df["project_score"].apply(lambda score : "#b8e7ba" if score > 70 else ("#fce9a5" if score >= 50 else "#fcd1b9"))
+    return result_df
+
+
+### Tests ###
+
+CASES = [
+    (compute_project_scores_for_all_timestamps, reference_scores_for_all_timestamps, PROJECT_CATEGORIES, True),
+    (compute_project_scores_for_all_timestamps, reference_scores_for_all_timestamps, INSTANCE_CATEGORIES, False),
+    (compute_project_scores_by_category, reference_scores_by_category, PROJECT_CATEGORIES, True),
+    (compute_project_scores_by_category, reference_scores_by_category, INSTANCE_CATEGORIES, False),
+]
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("typed", [False, True])
+@pytest.mark.parametrize("compute, reference, category, group_by_project", CASES)
+def test_scores_identical_to_reference(compute, reference, category, group_by_project, typed, seed):
+    df = build_check_history(n_runs = 10, n_projects = 20, seed = seed)
+    if typed:
+        df = as_typed_frame(df)
+    pd.testing.assert_frame_equal(compute(df, category = category, group_by_project = group_by_project),
+                                  reference(df, category = category, group_by_project = group_by_project),
+                                  check_dtype = False)
+
+@pytest.mark.parametrize("materialized_runs", [0, 4, 10])
+@pytest.mark.parametrize("compute, reference, category, group_by_project", CASES)
+def test_materialized_scores_identical(compute, reference, category, group_by_project, materialized_runs):
+    """
+    Scores read from the score rows saved by the advisors for the latest runs, computed from the checks for the legacy runs.
+    """
+    df = build_check_history(n_runs = 10, n_projects = 20)
+    score_df = None
+    for timestamp in sorted(df["timestamp"].unique())[10 - materialized_runs:]:
+        run_score_df = compute_run_score_rows(df[df["timestamp"] == timestamp].fillna({"project_id" : ""}), PROJECT_CATEGORIES, INSTANCE_CATEGORIES)
+        run_score_df = set_score_deltas(run_score_df, score_df)
+        score_df = run_score_df if score_df is None else pd.concat([score_df, run_score_df], ignore_index = True)
+
+    pd.testing.assert_frame_equal(compute(df, category = category, group_by_project = group_by_project, score_df = score_df),
+                                  reference(df, category = category, group_by_project = group_by_project),
+                                  check_dtype = False)
@@ -16,7 +16,8 @@ from dash.dependencies import Input, Output, State, ALL
 from project_advisor.report.full_pat_report.callbacks import load_callbacks
 from project_advisor.report.full_pat_report.display import build_layout
 
-from project_advisor.report.full_pat_report.data_loader import load_pat_report_data
+from project_advisor.report.full_pat_report.data_loader import load_pat_report_data, refresh_pat_report_data
+from project_advisor.report.data_refresher import ReportDataRefresher
 
 logging.info('Webapp Initializing')
 
@@ -38,13 +39,17 @@ font_family = "Source Sans Pro"
 
 
 app.title = "PAT Report"
-data = load_pat_report_data(input_config)
-app.layout = build_layout(input_config, data)
+# Report data, new runs are loaded in the background every refresh_interval minutes
+data_refresher = ReportDataRefresher(load_pat_report_data(input_config),
+                                     lambda data: refresh_pat_report_data(input_config, data),
+                                     input_config.get('refresh_interval'))
+app.layout = build_layout(input_config, data_refresher.data)
 
 #########################
 ######  CALLBACKS  ######
 #########################
 
-load_callbacks(app, data)
+load_callbacks(app, data_refresher)
+data_refresher.start()
 
 logging.info('Webapp Initialized')
\ No newline at end of file
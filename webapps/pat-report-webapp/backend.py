@@ -14,7 +14,8 @@ from dash import dcc, html
 from dash.dependencies import Input, Output, State, ALL
 
 from project_advisor.report.instance_report.callbacks import collapse_callback
-from project_advisor.report.instance_report.display import build_layout
+from project_advisor.report.instance_report.display import load_report_layout, refresh_report_layout
+from project_advisor.report.data_refresher import ReportDataRefresher
 
 logging.info('Webapp Initializing')
 
@@ -29,12 +30,17 @@ config = get_webapp_config()
 app.config.external_stylesheets = ["https://fonts.googleapis.com/css2?family=Outfit:wght@100;200;300;400;500;600;700;800;900&display=swap", dbc.themes.ZEPHYR, dbc.icons.BOOTSTRAP, "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css"]
 
 app.title = "PAT Report"
-app.layout = build_layout(config)
+# Layout of the latest run, rebuilt in the background when a new run is saved (served on each page load)
+data_refresher = ReportDataRefresher(load_report_layout(config),
+                                     lambda report_layout: refresh_report_layout(config, report_layout),
+                                     config.get('refresh_interval'))
+app.layout = lambda: data_refresher.data["layout"]
 
 #########################
 ######  CALLBACKS  ######
 #########################
 
 collapse_callback(app)
+data_refresher.start()
 
 logging.info('Webapp Initialized')
\ No newline at end of file